@@ -3,12 +3,14 @@ Quick script to add sample data to the database
 """
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "app"))
 
-from simple_backend import SessionLocal, Match
+from db import SessionLocal, Base, engine
+from models import Match
 from datetime import datetime, timedelta
 
 def add_sample_data():
+    Base.metadata.create_all(bind=engine)
     db = SessionLocal()
     try:
         # Sample matches
@@ -0,0 +1,160 @@
+"""
+Normalized news articles.
+
+NewsAPI and RSS entries are reduced to one compact `Article` record with a
+fixed set of fields. Records are interned in `articles`, keyed by a hash of the
+canonical URL, so the same story fetched again (or from another endpoint)
+reuses the stored record instead of being cleaned and kept twice.
+"""
+import os, re, hashlib, calendar, threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from images import proxy_url
+
+ARTICLE_CACHE_SIZE = int(os.getenv("ARTICLE_CACHE_SIZE", "2000"))
+DESCRIPTION_LENGTH = 150
+
+# query parameters that only track the click and never change the page
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "ocid", "cmpid", "at_medium", "at_campaign")
+
+TAG_RE = re.compile(r"<[^>]+>")
+
+class Article:
+    __slots__ = ("id", "title", "description", "url", "source", "published_at", "image")
+
+    def __init__(self, id, title, description, url, source, published_at, image):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.url = url
+        self.source = source
+        self.published_at = published_at
+        self.image = image
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "url": self.url,
+            "source": self.source,
+            "publishedAt": self.published_at,  # encoded as ...T15:00:00Z by responses.dumps
+            "image": proxy_url(self.image, 512),
+        }
+
+    def to_record(self):
+        """Plain fields for msgpack; published_at as epoch milliseconds."""
+        published = int(self.published_at.timestamp() * 1000) if self.published_at else None
+        return [self.id, self.title, self.description, self.url, self.source, published, self.image]
+
+def from_record(record):
+    """Article for a to_record() list, interned like a fetched one."""
+    key, title, description, url, source, published, image = record
+    return articles.intern(key, lambda: Article(
+        key, title, description, url, source,
+        datetime.fromtimestamp(published / 1000, timezone.utc) if published is not None else None, image))
+
+def canonical_url(url):
+    """Lowercased scheme/host without www, tracking parameters, fragment or trailing slash."""
+    url = url.strip()
+    parts = urlsplit(url)
+    if not parts.scheme and not parts.netloc:
+        # a bare "bbc.co.uk/sport" would otherwise parse as a path
+        parts = urlsplit(f"//{url}")
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith(TRACKING_PARAMS)])
+    return urlunsplit(((parts.scheme or "https").lower(), host, parts.path.rstrip("/") or "/", query, ""))
+
+def url_key(url):
+    return hashlib.sha1(canonical_url(url).encode()).hexdigest()[:16]
+
+def clean_description(description, max_length=DESCRIPTION_LENGTH):
+    """Strip markup and truncate for display."""
+    if not description:
+        return ""
+    text = TAG_RE.sub("", description).strip()
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+    return text
+
+def parse_published(value):
+    """UTC datetime from an ISO 8601 (NewsAPI) or RFC 822 (RSS) date; None if unparseable."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+class ArticleCache:
+    """Bounded canonical store of normalized articles, keyed by URL hash."""
+
+    def __init__(self, size=ARTICLE_CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self.entries.get(key)
+
+    def intern(self, key, make):
+        """The stored record for `key`, or the one built by `make()` once stored."""
+        with self._lock:
+            article = self.entries.get(key)
+            if article is not None:
+                self.entries.move_to_end(key)
+                return article
+        article = make()
+        with self._lock:
+            article = self.entries.setdefault(key, article)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+        return article
+
+    def __len__(self):
+        return len(self.entries)
+
+articles = ArticleCache()
+
+def from_newsapi(raw):
+    """Article for a NewsAPI `articles` item, or None without a URL."""
+    url = raw.get("url")
+    if not url:
+        return None
+    key = url_key(url)
+    return articles.intern(key, lambda: Article(
+        key,
+        (raw.get("title") or "").strip(),
+        clean_description(raw.get("description")),
+        url,
+        (raw.get("source") or {}).get("name") or "NewsAPI",
+        parse_published(raw.get("publishedAt")),
+        (raw.get("urlToImage") or "").strip() or None,
+    ))
+
+def from_rss(entry, source, image_of):
+    """Article for a feedparser entry, or None without a link; `image_of(entry)` picks its image."""
+    url = entry.get("link")
+    if not url:
+        return None
+    key = url_key(url)
+
+    def make():
+        parsed = entry.get("published_parsed")
+        published = (datetime.fromtimestamp(calendar.timegm(parsed), timezone.utc) if parsed
+                     else parse_published(entry.get("published")))
+        return Article(key, (entry.get("title") or "").strip(), clean_description(entry.get("summary")),
+                       url, source, published, image_of(entry))
+    return articles.intern(key, make)
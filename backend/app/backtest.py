@@ -0,0 +1,221 @@
+"""
+Backtesting of the prediction formulas over historical fixtures.
+
+Matches are replayed in kickoff order and every model only sees results
+from earlier days. Scoring (Brier, log-loss, calibration, ROI) is done with
+numpy over all seasons and leagues at once, and model variants run in
+parallel worker processes.
+"""
+import os, zlib, hashlib, logging
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from leagues import LEAGUE_NAMES, league_key_for_name
+from ratings import DEFAULT_RATING, DEFAULT_HOME_ADV, K_FACTOR
+
+logger = logging.getLogger(__name__)
+
+ODDS_MARKET = "1X2"
+ODDS_SELECTIONS = {"home": 0, "draw": 1, "away": 2}
+CALIBRATION_BINS = 10
+
+# Default grid: the three formulas used by the backends plus a few Elo settings
+DEFAULT_VARIANTS = [
+    {"name": "flat", "model": "flat"},
+    {"name": "hash_strength", "model": "hash_strength"},
+    {"name": "md5_strength", "model": "md5_strength"},
+    {"name": "elo_k20", "model": "elo", "k": 20.0},
+    {"name": "elo_k30", "model": "elo", "k": 30.0},
+    {"name": "elo_k20_ha80", "model": "elo", "k": 20.0, "home_adv": 80.0},
+]
+
+def season_of(kickoff):
+    # European seasons start in July/August
+    return kickoff.year if kickoff.month >= 7 else kickoff.year - 1
+
+def load_dataset(db, leagues=None):
+    """Finished matches with outcomes and closing odds as numpy arrays, in kickoff order."""
+    from models import Result, Odds
+    names = [LEAGUE_NAMES[k] for k in (leagues or LEAGUE_NAMES)]
+    results = (db.query(Result)
+               .filter(Result.league.in_(names))
+               .order_by(Result.kickoff)
+               .all())
+
+    # closing odds: the last price retrieved before kickoff
+    odds = np.full((len(results), 3), np.nan)
+    position = {r.match_id: i for i, r in enumerate(results)}
+    kickoffs = {r.match_id: r.kickoff for r in results}
+    if results:
+        odds_rows = (db.query(Odds)
+                     .filter(Odds.market == ODDS_MARKET, Odds.match_id.in_(list(position)))
+                     .order_by(Odds.retrieved_at)
+                     .all())
+        for o in odds_rows:
+            col = ODDS_SELECTIONS.get(o.selection)
+            if col is None or (o.retrieved_at and o.retrieved_at > kickoffs[o.match_id]):
+                continue
+            odds[position[o.match_id], col] = o.odd
+    return build_dataset([(r.kickoff, r.league, r.home, r.away, r.home_goals, r.away_goals) for r in results], odds)
+
+def build_dataset(results, odds=None):
+    """Arrays from (kickoff, league_name, home, away, home_goals, away_goals) rows sorted by kickoff."""
+    team_index = {}
+    teams = []
+    league_index = {}
+    cols = {k: [] for k in ("day", "season", "league", "home", "away", "outcome")}
+    for kickoff, league, home, away, hg, ag in results:
+        for team in ((league, home), (league, away)):
+            if team not in team_index:
+                team_index[team] = len(teams)
+                teams.append(team)
+        cols["day"].append(kickoff.toordinal())
+        cols["season"].append(season_of(kickoff))
+        cols["league"].append(league_index.setdefault(league_key_for_name(league) or league, len(league_index)))
+        cols["home"].append(team_index[(league, home)])
+        cols["away"].append(team_index[(league, away)])
+        cols["outcome"].append(0 if hg > ag else 1 if hg == ag else 2)
+    data = {k: np.asarray(v, dtype=np.int64) for k, v in cols.items()}
+    data["odds"] = odds if odds is not None else np.full((len(results), 3), np.nan)
+    data["teams"] = [name for _, name in teams]
+    data["leagues"] = list(league_index)
+    return data
+
+def predict_flat(data, variant):
+    """predictions.compute_simple_pick with default ratings."""
+    from predictions import compute_simple_pick
+    pick = compute_simple_pick()
+    row = np.array([pick["p_home"], pick["p_draw"], pick["p_away"]])
+    return np.tile(row, (len(data["outcome"]), 1))
+
+def _strength_probs(home_strength, away_strength):
+    # the enhanced_backend formula, on arrays
+    venue_advantage = 0.1
+    total = home_strength + away_strength + venue_advantage
+    home = np.clip((home_strength + venue_advantage) / total, 0.1, 0.8)
+    away = np.clip(away_strength / total, 0.1, 0.7)
+    draw = np.maximum(1 - home - away, 0.1)
+    return np.stack([home, draw, away], axis=1)
+
+def predict_hash_strength(data, variant):
+    """enhanced_backend.get_enhanced_predictions: strengths from a hash of the team name.
+
+    The original used hash(), which is salted per process; crc32 keeps runs reproducible.
+    """
+    strength = np.array([zlib.crc32(t.encode()) % 100 / 100 for t in data["teams"]])
+    return _strength_probs(strength[data["home"]], strength[data["away"]])
+
+def predict_md5_strength(data, variant):
+    """clean_working_backend.generate_prediction: strengths from md5(home+away)."""
+    teams = data["teams"]
+    probs = np.empty((len(data["outcome"]), 3))
+    for i, (h, a) in enumerate(zip(data["home"], data["away"])):
+        hash_val = int(hashlib.md5(f"{teams[h]}{teams[a]}".encode()).hexdigest()[:8], 16)
+        home_strength = (hash_val % 100) / 100 * 0.6 + 0.2 + 0.1
+        away_strength = ((hash_val >> 8) % 100) / 100 * 0.6 + 0.2
+        total = home_strength + away_strength + 0.3
+        probs[i] = (home_strength / total, 1 - (home_strength + away_strength) / total, away_strength / total)
+    return probs
+
+def predict_elo(data, variant):
+    """Online Elo, updated one match day at a time so a day's fixtures never see its results."""
+    k = variant.get("k", K_FACTOR)
+    home_adv = variant.get("home_adv", DEFAULT_HOME_ADV)
+    draw = variant.get("draw", 0.26)
+    ratings = np.full(len(data["teams"]), DEFAULT_RATING)
+    home, away, outcome = data["home"], data["away"], data["outcome"]
+    score = np.choose(outcome, [1.0, 0.5, 0.0])
+    expected = np.empty(len(outcome))
+    # day boundaries in the kickoff-sorted arrays
+    bounds = np.flatnonzero(np.diff(data["day"])) + 1
+    for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(outcome)]):
+        h, a = home[start:end], away[start:end]
+        e = 1.0 / (1.0 + np.exp((ratings[a] - ratings[h] - home_adv) / 400))
+        expected[start:end] = e
+        delta = k * (score[start:end] - e)
+        np.add.at(ratings, h, delta)
+        np.add.at(ratings, a, -delta)
+    return np.stack([(1 - draw) * expected, np.full(len(outcome), draw), (1 - draw) * (1 - expected)], axis=1)
+
+MODELS = {
+    "flat": predict_flat,
+    "hash_strength": predict_hash_strength,
+    "md5_strength": predict_md5_strength,
+    "elo": predict_elo,
+}
+
+def evaluate(probs, data):
+    """Metrics overall and per (season, league) group."""
+    probs = np.clip(probs / probs.sum(axis=1, keepdims=True), 1e-12, 1.0)
+    outcome = data["outcome"]
+    n = len(outcome)
+    rows = np.arange(n)
+    onehot = np.zeros_like(probs)
+    onehot[rows, outcome] = 1.0
+    brier = ((probs - onehot) ** 2).sum(axis=1)
+    logloss = -np.log(probs[rows, outcome])
+
+    # ROI: stake 1 on the best-value selection whenever expected value is positive
+    odds = data["odds"]
+    ev = np.where(np.isnan(odds), -np.inf, probs * np.nan_to_num(odds) - 1)
+    choice = ev.argmax(axis=1)
+    bet = ev[rows, choice] > 0
+    profit = np.where(bet, np.where(choice == outcome, np.nan_to_num(odds[rows, choice]) - 1, -1.0), 0.0)
+
+    # calibration over all three outcome probabilities
+    flat_p = probs.ravel()
+    flat_hit = onehot.ravel()
+    bins = np.minimum((flat_p * CALIBRATION_BINS).astype(np.int64), CALIBRATION_BINS - 1)
+    counts = np.bincount(bins, minlength=CALIBRATION_BINS)
+    mean_p = np.bincount(bins, weights=flat_p, minlength=CALIBRATION_BINS)
+    hits = np.bincount(bins, weights=flat_hit, minlength=CALIBRATION_BINS)
+    calibration = [
+        {"bin": i / CALIBRATION_BINS, "count": int(c), "predicted": float(p / c), "observed": float(o / c)}
+        for i, (c, p, o) in enumerate(zip(counts, mean_p, hits)) if c
+    ]
+
+    # per season x league in one pass
+    group_keys, group = np.unique(np.stack([data["season"], data["league"]], axis=1), axis=0, return_inverse=True)
+    group = group.ravel()
+    g_n = np.bincount(group)
+    g_brier = np.bincount(group, weights=brier)
+    g_logloss = np.bincount(group, weights=logloss)
+    g_bets = np.bincount(group, weights=bet)
+    g_profit = np.bincount(group, weights=profit)
+    groups = [
+        {
+            "season": int(season),
+            "league": data["leagues"][league],
+            "matches": int(g_n[i]),
+            "brier": float(g_brier[i] / g_n[i]),
+            "log_loss": float(g_logloss[i] / g_n[i]),
+            "bets": int(g_bets[i]),
+            "roi": float(g_profit[i] / g_bets[i]) if g_bets[i] else None,
+        }
+        for i, (season, league) in enumerate(group_keys)
+    ]
+
+    bets = int(bet.sum())
+    return {
+        "matches": n,
+        "brier": float(brier.mean()) if n else None,
+        "log_loss": float(logloss.mean()) if n else None,
+        "bets": bets,
+        "roi": float(profit.sum() / bets) if bets else None,
+        "calibration": calibration,
+        "groups": groups,
+    }
+
+def run_variant(variant, data):
+    probs = MODELS[variant["model"]](data, variant)
+    return {"variant": variant["name"], "params": variant, **evaluate(probs, data)}
+
+def run_backtest(data, variants=None, workers=None):
+    """Evaluate each variant on the dataset, one worker process per variant."""
+    variants = variants or DEFAULT_VARIANTS
+    if not len(data["outcome"]):
+        return []
+    with ProcessPoolExecutor(max_workers=workers or min(len(variants), os.cpu_count() or 1)) as pool:
+        results = list(pool.map(run_variant, variants, [data] * len(variants)))
+    for r in results:
+        logger.info(f"{r['variant']}: brier={r['brier']:.4f} log_loss={r['log_loss']:.4f} roi={r['roi']}")
+    return sorted(results, key=lambda r: r["log_loss"])
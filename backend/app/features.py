@@ -0,0 +1,156 @@
+"""
+Per-team rolling features kept in fixed-width numpy arrays.
+
+Each team owns one row. For the overall, home and away windows we keep a
+ring of the last WINDOW goals for, goals against and points, plus running
+sums, so ingesting a result is O(1) and a batch lookup is a handful of
+vectorized gathers. Results are expected in kickoff order (rebuild() replays
+them that way at startup).
+"""
+import os, threading, logging
+import numpy as np
+from kickoffs import epoch, to_utc
+
+logger = logging.getLogger(__name__)
+
+WINDOW = int(os.getenv("FEATURE_WINDOW", "5"))
+
+ALL, HOME, AWAY = 0, 1, 2
+GF, GA, PTS = 0, 1, 2
+
+# columns of feature_matrix(), home side then away side
+SIDE_FEATURES = ["games", "gf_avg", "ga_avg", "pts_avg", "venue_gf_avg", "venue_ga_avg", "rest_days"]
+FEATURE_COLUMNS = [f"home_{c}" for c in SIDE_FEATURES] + [f"away_{c}" for c in SIDE_FEATURES]
+
+def _epoch(kickoff):
+    return epoch(to_utc(kickoff)) if kickoff is not None else np.nan
+
+class FeatureStore:
+    def __init__(self, window=WINDOW, capacity=256):
+        self.window = window
+        self.index = {}
+        self.scores = {}  # match id -> (home goals, away goals) already in the windows
+        self._lock = threading.Lock()
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.rings = np.zeros((capacity, 3, 3, self.window), dtype=np.float32)
+        self.sums = np.zeros((capacity, 3, 3), dtype=np.float64)
+        self.counts = np.zeros((capacity, 3), dtype=np.int32)
+        self.pos = np.zeros((capacity, 3), dtype=np.int32)
+        self.last_kickoff = np.full(capacity, np.nan)
+        self.match_ids = np.full((capacity, 3, self.window), -1, dtype=np.int64)  # which match each slot holds
+
+    def _arrays(self):
+        return (self.rings, self.sums, self.counts, self.pos, self.last_kickoff, self.match_ids)
+
+    def _grow(self):
+        old = self._arrays()
+        n = len(self.last_kickoff)
+        self._allocate(n * 2)
+        for new, prev in zip(self._arrays(), old):
+            new[:n] = prev
+
+    def _row(self, team):
+        row = self.index.get(team)
+        if row is None:
+            row = len(self.index)
+            if row == len(self.last_kickoff):
+                self._grow()
+            self.index[team] = row
+        return row
+
+    def _push(self, row, window, values, match_id):
+        slot = self.pos[row, window]
+        ring = self.rings[row, window, :, slot]
+        if self.counts[row, window] == self.window:
+            self.sums[row, window] -= ring
+        else:
+            self.counts[row, window] += 1
+        ring[:] = values
+        self.sums[row, window] += values
+        self.match_ids[row, window, slot] = match_id
+        self.pos[row, window] = (slot + 1) % self.window
+
+    def _replace(self, row, window, values, match_id):
+        # a corrected score: swap the values in place if the match is still in the window
+        for slot in np.flatnonzero(self.match_ids[row, window] == match_id):
+            ring = self.rings[row, window, :, slot]
+            self.sums[row, window] += values - ring
+            ring[:] = values
+
+    def add(self, result):
+        """Push a finished result into both teams' windows; re-adding one only applies a changed score."""
+        hg, ag = result.home_goals, result.away_goals
+        home_pts = 3 if hg > ag else 1 if hg == ag else 0
+        away_pts = 3 if ag > hg else 1 if hg == ag else 0
+        kickoff = _epoch(result.kickoff)
+        home_values = np.array([hg, ag, home_pts], dtype=np.float64)
+        away_values = np.array([ag, hg, away_pts], dtype=np.float64)
+        with self._lock:
+            seen = self.scores.get(result.match_id)
+            if seen == (hg, ag):
+                return
+            self.scores[result.match_id] = (hg, ag)
+            h = self._row(result.home)
+            a = self._row(result.away)
+            if seen is not None:
+                for row, window, values in ((h, ALL, home_values), (h, HOME, home_values),
+                                            (a, ALL, away_values), (a, AWAY, away_values)):
+                    self._replace(row, window, values, result.match_id)
+                return
+            self._push(h, ALL, home_values, result.match_id)
+            self._push(h, HOME, home_values, result.match_id)
+            self._push(a, ALL, away_values, result.match_id)
+            self._push(a, AWAY, away_values, result.match_id)
+            # a result can arrive after a later one; keep the latest kickoff (fmax skips the NaN of a new team)
+            self.last_kickoff[h] = np.fmax(self.last_kickoff[h], kickoff)
+            self.last_kickoff[a] = np.fmax(self.last_kickoff[a], kickoff)
+
+    def feature_matrix(self, fixtures):
+        """One row per fixture (objects with home, away, kickoff), columns FEATURE_COLUMNS.
+
+        Teams without history get games=0 and NaN averages.
+        """
+        n = len(fixtures)
+        with self._lock:
+            rows = np.array([[self.index.get(f.home, -1), self.index.get(f.away, -1)] for f in fixtures],
+                            dtype=np.int64).reshape(n, 2)
+            known = rows >= 0
+            safe = np.where(known, rows, 0)
+            sums = self.sums[safe]          # (n, 2, window, metric)
+            counts = self.counts[safe]      # (n, 2, window)
+            last = self.last_kickoff[safe]  # (n, 2)
+        counts = np.where(known[..., None], counts, 0)
+        sums = np.where(known[..., None, None], sums, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts[..., None]
+        kickoffs = np.array([_epoch(f.kickoff) for f in fixtures]).reshape(n, 1)
+        rest_days = np.where(known, (kickoffs - last) / 86400.0, np.nan)
+
+        out = np.empty((n, 2, len(SIDE_FEATURES)))
+        out[:, :, 0] = counts[:, :, ALL]
+        out[:, :, 1] = means[:, :, ALL, GF]
+        out[:, :, 2] = means[:, :, ALL, GA]
+        out[:, :, 3] = means[:, :, ALL, PTS]
+        out[:, 0, 4] = means[:, 0, HOME, GF]
+        out[:, 0, 5] = means[:, 0, HOME, GA]
+        out[:, 1, 4] = means[:, 1, AWAY, GF]
+        out[:, 1, 5] = means[:, 1, AWAY, GA]
+        out[:, :, 6] = rest_days
+        return out.reshape(n, len(FEATURE_COLUMNS))
+
+    def rebuild(self, db):
+        from models import Result
+        with self._lock:
+            self.index = {}
+            self.scores = {}
+            self._allocate(len(self.last_kickoff))
+        count = 0
+        for result in db.query(Result).order_by(Result.kickoff).yield_per(1000):
+            self.add(result)
+            count += 1
+        logger.info(f"Feature store built from {count} results for {len(self.index)} teams")
+        return count
+
+features = FeatureStore()
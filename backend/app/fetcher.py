@@ -1,33 +1,133 @@
-import os, httpx, logging
-from datetime import datetime
+import asyncio, httpx, logging
+from sqlalchemy.exc import IntegrityError
 from db import SessionLocal
-from models import Match, Odds
-
-FOOTBALL_KEY = os.getenv("FOOTBALL_API_KEY")
-ODDS_KEY = os.getenv("ODDS_API_KEY")
-FOOTBALL_BASE = os.getenv("FOOTBALL_BASE", "https://api-football.example")
-
-async def fetch_fixtures():
-    # using httpx for async
-    async with httpx.AsyncClient(timeout=30) as client:
-        # example endpoint; replace with your API's path
-        r = await client.get(f"{FOOTBALL_BASE}/fixtures?date=today", headers={"x-apisports-key":FOOTBALL_KEY})
-        r.raise_for_status()
-        data = r.json()
-        # store into DB (simplified)
+from models import Match
+from providers import enabled_providers, get_provider
+from sources import enabled_sources
+from history import record_result
+from shared_cache import shared_cache
+from routers import ENABLED_ROUTERS
+from kickoffs import day_index, to_utc, epoch
+from metrics import track_upstream
+import upstream
+
+logger = logging.getLogger(__name__)
+
+# columns refreshed on every fetch; the rest only set on insert
+UPDATABLE = ("status", "home_logo", "away_logo", "venue", "referee", "kickoff", "kickoff_ts", "provider_payload")
+
+def _upsert(db, by_id):
+    existing = {m.provider_id: m for m in db.query(Match).filter(Match.provider_id.in_(list(by_id)))} if by_id else {}
+    touched = []
+    added = 0
+    for pid, f in by_id.items():
+        m = existing.get(pid)
+        if m is None:
+            m = Match(**f)
+            db.add(m)
+            added += 1
+        else:
+            for col in UPDATABLE:
+                if f.get(col) is not None:
+                    setattr(m, col, f[col])
+        touched.append(m)
+    db.flush()
+    # finished fixtures go into the results table and the H2H/form index
+    results = [record_result(db, m) for m in touched]
+    docs = fixture_docs(touched)
+    days = [(m.id, m.kickoff_ts, m.league) for m in touched]
+    return added, results, docs, days
+
+def fixture_docs(matches):
+    # read off the rows before commit expires them; only the search index and team tagger use them
+    if "search" not in ENABLED_ROUTERS and "news" not in ENABLED_ROUTERS:
+        return []
+    from search import fixture_doc
+    return [fixture_doc(m) for m in matches]
+
+def feed_indexes(results, docs):
+    """Add stored results and fixtures to the in-memory indexes of the enabled routers only."""
+    if "predictions" in ENABLED_ROUTERS:
+        from history import index_results
+        index_results(results)
+    if "search" in ENABLED_ROUTERS:
+        from search import search_index
+        search_index.add_fixtures(docs)
+    if "news" in ENABLED_ROUTERS:
+        from tagger import team_tagger
+        team_tagger.add_teams([(d["home"], d["league"]) for d in docs] + [(d["away"], d["league"]) for d in docs])
+
+def store_fixtures(fixtures):
+    """Upsert fixtures by provider_id. Returns the number of new matches.
+
+    If another writer inserts some of the same fixtures first, the unique
+    provider_id fails this batch; it is retried once against the rows that
+    are now there rather than dropped.
+    """
+    by_id = {f["provider_id"]: f for f in fixtures if f.get("provider_id")}
+    for f in by_id.values():
+        # one representation whatever the provider sent: naive UTC plus its epoch
+        f["kickoff"] = to_utc(f.get("kickoff"))
+        f["kickoff_ts"] = epoch(f["kickoff"])
+    for attempt in range(2):
         db = SessionLocal()
         try:
-            for f in data.get("response", []):
-                pid = str(f.get("fixture", {}).get("id") or f.get("id"))
-                kickoff = f.get("fixture", {}).get("date")
-                m = db.query(Match).filter(Match.provider_id == pid).first()
-                if not m:
-                    m = Match(provider_id=pid, league=f.get("league", {}).get("name"), home=f.get("teams", {}).get("home", {}).get("name"),
-                              away=f.get("teams", {}).get("away", {}).get("name"), kickoff=kickoff, status=f.get("fixture", {}).get("status", {}).get("short"),
-                              provider_payload=f)
-                    db.add(m)
-                else:
-                    m.provider_payload = f
-            db.commit()
+            try:
+                added, results, docs, days = _upsert(db, by_id)
+                db.commit()
+            except IntegrityError:
+                if attempt:
+                    raise
+                db.rollback()
+                logger.warning("Fixtures were inserted concurrently; retrying the batch as updates")
+                continue
+            feed_indexes(results, docs)
+            day_index.add(days)
+            # other workers mark their day index stale before dropping the responses built from it
+            shared_cache.broadcast("fixtures")
+            shared_cache.invalidate("responses")
+            return added
         finally:
-            db.close()
\ No newline at end of file
+            db.close()
+
+async def fetch_league(provider, client, key):
+    """(fixtures, stale): stale is True when the provider's circuit is open and the last good batch was served."""
+    async def attempt():
+        with track_upstream(provider.NAME):
+            return await provider.fetch(client, key)
+    return await upstream.call(provider.NAME, key, attempt)
+
+async def fetch_fixtures(leagues=None, providers=None):
+    """Fetch every enabled source concurrently over one pooled client and store the fixtures.
+
+    Sources are the provider x competition pairs in the catalogue, one per
+    competition; `leagues` and `providers` narrow them to some competition
+    keys or provider names. A provider is never asked for a competition
+    another one owns.
+    """
+    jobs = enabled_sources({p.NAME for p in enabled_providers()}, leagues)
+    if providers:
+        jobs = [s for s in jobs if s.provider in providers]
+    async with httpx.AsyncClient(timeout=upstream.UPSTREAM_TIMEOUT_SECONDS) as client:
+        batches = await asyncio.gather(
+            *(fetch_league(get_provider(s.provider), client, s.competition) for s in jobs),
+            return_exceptions=True,
+        )
+    fixtures = []
+    errors = []
+    stale = []
+    for source, outcome in zip(jobs, batches):
+        name, key = source.provider, source.competition
+        if isinstance(outcome, Exception):
+            logger.error(f"{name} fetch error for {key}: {outcome}")
+            errors.append(f"{name} ({key}): {outcome}")
+            continue
+        batch, from_snapshot = outcome
+        if from_snapshot:
+            logger.info(f"{name} circuit open, served {len(batch)} earlier fixtures for {key}")
+            stale.append(f"{name} ({key})")
+        else:
+            logger.info(f"{name} returned {len(batch)} fixtures for {key}")
+        fixtures.extend(batch)
+    added = await asyncio.to_thread(store_fixtures, fixtures)
+    return {"fetched": len(fixtures), "added": added, "errors": errors, "stale": stale}
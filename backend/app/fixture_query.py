@@ -0,0 +1,125 @@
+"""
+One query path for fixture listings.
+
+A FixtureQuery is a kickoff window [start, end) in UTC epoch seconds (either
+end open), a set of league names, a set of statuses, a sort order and a
+limit. Every listing endpoint builds one from its parameters with
+from_params() and runs it with fetch(), so they all compile to the same
+statement:
+
+    SELECT ... FROM matches
+    WHERE kickoff_ts >= :start AND kickoff_ts < :end
+      AND league IN (:leagues) AND status IN (:statuses)
+    ORDER BY kickoff_ts, id LIMIT :limit
+
+which the kickoff_ts and (league, kickoff_ts) indexes serve. Values are
+always bound, and IN lists are expanding parameters, so there is one
+statement object per combination of filters present and sort order. Each is
+built once here and compiled once by SQLAlchemy's compiled cache, whatever
+the values.
+"""
+import os, time
+from datetime import timedelta
+from functools import lru_cache
+from sqlalchemy import select, bindparam, BigInteger, Integer
+from models import Match
+from leagues import LEAGUE_NAMES
+from kickoffs import zone, local_today, day_start, day_range
+
+FIXTURE_QUERY_MAX_LIMIT = int(os.getenv("FIXTURE_QUERY_MAX_LIMIT", "500"))
+
+ORDERS = {
+    "kickoff": (Match.kickoff_ts, Match.id),
+    "-kickoff": (Match.kickoff_ts.desc(), Match.id.desc()),
+    "league": (Match.league, Match.kickoff_ts, Match.id),
+}
+
+def window(tz, days_ahead=None, date_from=None, date_to=None):
+    """(start, end) epoch seconds for calendar days in `tz`; either may be None.
+
+    date_from/date_to are inclusive local dates. Without them, days_ahead is
+    0 for today, 1 for tomorrow, or N for the N days from today.
+    """
+    if date_from is not None or date_to is not None:
+        if date_from is not None and date_to is not None and date_to < date_from:
+            raise ValueError("date_to is before date_from")
+        return (day_start(date_from, tz) if date_from is not None else None,
+                day_start(date_to + timedelta(days=1), tz) if date_to is not None else None)
+    if days_ahead is None:
+        return None, None
+    if days_ahead < 0:
+        raise ValueError("days_ahead must not be negative")
+    today = local_today(tz)
+    if days_ahead == 1:
+        return day_range(today + timedelta(days=1), 1, tz)
+    return day_range(today, max(days_ahead, 1), tz)
+
+def _split(value):
+    return [v.strip() for v in value.split(",") if v.strip()] if value else []
+
+@lru_cache(maxsize=None)
+def _statement(has_start, has_end, has_leagues, has_statuses, order):
+    stmt = select(Match)
+    if has_start:
+        stmt = stmt.where(Match.kickoff_ts >= bindparam("start", type_=BigInteger))
+    if has_end:
+        stmt = stmt.where(Match.kickoff_ts < bindparam("end", type_=BigInteger))
+    if has_leagues:
+        stmt = stmt.where(Match.league.in_(bindparam("leagues", expanding=True)))
+    if has_statuses:
+        stmt = stmt.where(Match.status.in_(bindparam("statuses", expanding=True)))
+    return stmt.order_by(*ORDERS[order]).limit(bindparam("limit", type_=Integer))
+
+class FixtureQuery:
+    def __init__(self, start=None, end=None, leagues=(), statuses=(), order="kickoff", limit=20):
+        if order not in ORDERS:
+            raise ValueError(f"Unknown order: {order} (one of {', '.join(ORDERS)})")
+        self.start = start
+        self.end = end
+        self.leagues = tuple(leagues)
+        self.statuses = tuple(statuses)
+        self.order = order
+        self.limit = max(0, min(limit, FIXTURE_QUERY_MAX_LIMIT))
+        self.upcoming = False
+
+    @classmethod
+    def from_params(cls, tz="UTC", days_ahead=None, date_from=None, date_to=None, league=None, status=None,
+                    order="kickoff", limit=20, upcoming=False):
+        """A query from endpoint parameters; ValueError on any that are invalid.
+
+        league and status are comma-separated (league keys, provider status
+        strings). With no window given, `upcoming` starts it at now.
+        """
+        leagues = []
+        for key in _split(league):
+            if key not in LEAGUE_NAMES:
+                raise ValueError(f"Unknown league: {key}")
+            leagues.append(LEAGUE_NAMES[key])
+        start, end = window(zone(tz), days_ahead, date_from, date_to)
+        upcoming = upcoming and start is None and end is None
+        query = cls(int(time.time()) if upcoming else start, end, leagues, _split(status), order, limit)
+        query.upcoming = upcoming
+        return query
+
+    def key(self):
+        """Hashable identity for response caching; an upcoming window's moving start is left out."""
+        return ("upcoming" if self.upcoming else self.start, self.end, self.leagues, self.statuses, self.order, self.limit)
+
+    def statement(self):
+        """(statement, bound parameters)."""
+        stmt = _statement(self.start is not None, self.end is not None, bool(self.leagues), bool(self.statuses), self.order)
+        params = {"limit": self.limit}
+        if self.start is not None:
+            params["start"] = self.start
+        if self.end is not None:
+            params["end"] = self.end
+        if self.leagues:
+            params["leagues"] = list(self.leagues)
+        if self.statuses:
+            params["statuses"] = list(self.statuses)
+        return stmt, params
+
+async def fetch(db, query):
+    """Matches for `query` on an AsyncSession."""
+    stmt, params = query.statement()
+    return (await db.execute(stmt, params)).scalars().all()
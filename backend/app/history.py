@@ -0,0 +1,145 @@
+"""
+Finished results plus in-memory head-to-head and recent-form indexes.
+
+The indexes are rebuilt from the results table at startup and kept current
+by the fetcher as results are ingested, so lookups never scan match history.
+"""
+import os, bisect, logging, threading
+from collections import deque
+from providers import final_score
+
+logger = logging.getLogger(__name__)
+
+H2H_SIZE = int(os.getenv("H2H_SIZE", "10"))
+FORM_SIZE = int(os.getenv("FORM_SIZE", "10"))
+
+def _outcome(gf, ga):
+    return "W" if gf > ga else "D" if gf == ga else "L"
+
+def pair_key(home, away):
+    return frozenset((home, away))
+
+def _insert(ring, entry):
+    # results normally arrive in kickoff order; keep the ring sorted if they don't
+    if not ring or ring[-1]["kickoff"] <= entry["kickoff"]:
+        ring.append(entry)
+        return
+    if len(ring) == ring.maxlen and entry["kickoff"] < ring[0]["kickoff"]:
+        return
+    items = list(ring)
+    bisect.insort(items, entry, key=lambda e: e["kickoff"])
+    ring.clear()
+    ring.extend(items)
+
+class HistoryIndex:
+    def __init__(self, h2h_size=H2H_SIZE, form_size=FORM_SIZE):
+        self.h2h_size = h2h_size
+        self.form_size = form_size
+        self.h2h = {}
+        self.form = {}
+        self.seen = {}  # match id -> (home goals, away goals) as indexed
+        self._lock = threading.Lock()
+
+    def _correct(self, result):
+        # a score changed after it was indexed: rewrite the entries in place
+        hg, ag = result.home_goals, result.away_goals
+        for entry in self.h2h.get(pair_key(result.home, result.away), ()):
+            if entry["match_id"] == result.match_id:
+                entry["home_goals"], entry["away_goals"] = hg, ag
+        for team, gf, ga in ((result.home, hg, ag), (result.away, ag, hg)):
+            for entry in self.form.get(team, ()):
+                if entry["match_id"] == result.match_id:
+                    entry.update(goals_for=gf, goals_against=ga, result=_outcome(gf, ga))
+
+    def add(self, result):
+        """Index a finished result; re-adding one updates its score if it has changed."""
+        kickoff = result.kickoff
+        hg, ag = result.home_goals, result.away_goals
+        with self._lock:
+            seen = self.seen.get(result.match_id)
+            if seen == (hg, ag):
+                return
+            self.seen[result.match_id] = (hg, ag)
+            if seen is not None:
+                self._correct(result)
+                return
+            ring = self.h2h.setdefault(pair_key(result.home, result.away), deque(maxlen=self.h2h_size))
+            _insert(ring, {"match_id": result.match_id, "kickoff": kickoff, "home": result.home,
+                           "away": result.away, "home_goals": hg, "away_goals": ag})
+            for team, opponent, venue, gf, ga in ((result.home, result.away, "H", hg, ag),
+                                                  (result.away, result.home, "A", ag, hg)):
+                ring = self.form.setdefault(team, deque(maxlen=self.form_size))
+                _insert(ring, {"match_id": result.match_id, "kickoff": kickoff, "opponent": opponent,
+                               "venue": venue, "goals_for": gf, "goals_against": ga,
+                               "result": _outcome(gf, ga)})
+
+    def head_to_head(self, home, away, limit=None):
+        """Most recent meetings first, either venue."""
+        ring = self.h2h.get(pair_key(home, away))
+        if not ring:
+            return []
+        items = list(reversed(ring))
+        return items[:limit] if limit else items
+
+    def recent_form(self, team, limit=None):
+        """Most recent results first, from the team's point of view."""
+        ring = self.form.get(team)
+        if not ring:
+            return []
+        items = list(reversed(ring))
+        return items[:limit] if limit else items
+
+    def rebuild(self, db):
+        from models import Result
+        with self._lock:
+            self.h2h = {}
+            self.form = {}
+            self.seen = {}
+        count = 0
+        for result in db.query(Result).order_by(Result.kickoff).yield_per(1000):
+            self.add(result)
+            count += 1
+        logger.info(f"History index built from {count} results")
+        return count
+
+history = HistoryIndex()
+
+def record_result(db, match):
+    """Store the final score for a finished match. Returns the Result, or None if unfinished.
+
+    Call `index_results` once the session has committed.
+    """
+    from models import Result
+    score = final_score(match.provider, match.provider_payload)
+    if score is None or match.id is None or match.kickoff is None:
+        return None
+    result = db.query(Result).filter(Result.match_id == match.id).first()
+    if result is None:
+        result = Result(match_id=match.id, league=match.league, home=match.home, away=match.away,
+                        kickoff=match.kickoff, home_goals=score[0], away_goals=score[1])
+        db.add(result)
+    else:
+        result.home_goals, result.away_goals = score
+    return result
+
+def index_results(results):
+    """Feed committed results to the H2H/form index and the feature store."""
+    from features import features
+    for result in results:
+        if result is not None:
+            history.add(result)
+            features.add(result)
+
+def backfill_results(db):
+    """Create results for finished matches ingested before the results table existed."""
+    from models import Match, Result
+    known = {mid for (mid,) in db.query(Result.match_id)}
+    added = []
+    for match in db.query(Match).yield_per(1000):
+        if match.id not in known:
+            result = record_result(db, match)
+            if result is not None:
+                added.append(result)
+    db.commit()
+    index_results(added)
+    return len(added)
@@ -0,0 +1,199 @@
+"""
+Image proxy with an on-disk WebP thumbnail cache.
+
+Team logos and article images are fetched from their host once, resized to
+one of a few fixed widths and stored as WebP under IMAGE_CACHE_DIR, named by
+the SHA-256 of the original bytes. When the images router is served,
+`proxy_url` rewrites third-party image URLs in API payloads so clients load
+every image from this origin: the content-addressed URL of the thumbnail,
+served as immutable, once this worker has rendered it, and the proxy URL,
+which renders it, until then.
+
+The API is read cross-origin, so the rewritten URLs are absolute, on
+PUBLIC_BASE_URL. It defaults to the public URL Render or Railway give the
+service, else the local development server.
+"""
+import os, asyncio, hashlib, logging
+from io import BytesIO
+from urllib.parse import urlsplit, quote
+import httpx
+from metrics import track_upstream
+
+logger = logging.getLogger(__name__)
+
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "images"))
+IMAGE_PROXY = os.getenv("IMAGE_PROXY", "1") == "1"
+
+def _public_base_url():
+    if os.getenv("PUBLIC_BASE_URL"):
+        return os.environ["PUBLIC_BASE_URL"]
+    if os.getenv("RENDER_EXTERNAL_URL"):
+        return os.environ["RENDER_EXTERNAL_URL"]
+    if os.getenv("RAILWAY_PUBLIC_DOMAIN"):
+        return f"https://{os.environ['RAILWAY_PUBLIC_DOMAIN']}"
+    return "http://localhost:8000"
+
+PUBLIC_BASE_URL = _public_base_url().rstrip("/")
+IMAGE_PATH = "/api/v1/images"
+IMAGE_PROXY_PATH = f"{IMAGE_PATH}/proxy"
+IMAGE_MAX_BYTES = int(os.getenv("IMAGE_MAX_BYTES", str(5 * 1024 * 1024)))
+WEBP_QUALITY = int(os.getenv("WEBP_QUALITY", "80"))
+WIDTHS = (64, 128, 256, 512, 800)
+DEFAULT_WIDTH = 256
+
+# only these hosts are fetched, so the proxy can't be pointed at arbitrary URLs
+DEFAULT_HOSTS = ",".join([
+    "media.api-sports.io",
+    "a.espncdn.com",
+    "r2.thesportsdb.com",
+    "www.thesportsdb.com",
+    "images.unsplash.com",
+    "ichef.bbci.co.uk",
+    "e0.365dm.com",
+])
+IMAGE_PROXY_HOSTS = {h.strip().lower() for h in os.getenv("IMAGE_PROXY_HOSTS", DEFAULT_HOSTS).split(",") if h.strip()}
+
+_pil = None
+_serving = False
+
+def _image_module():
+    """Pillow is only imported the first time an image is resized."""
+    global _pil
+    if _pil is None:
+        from PIL import Image
+        _pil = Image
+    return _pil
+
+def allowed(url):
+    parts = urlsplit(url)
+    return parts.scheme in ("http", "https") and (parts.hostname or "").lower() in IMAGE_PROXY_HOSTS
+
+def serve():
+    """Called when the images router is mounted; until then image URLs are left as they are."""
+    global _serving
+    _serving = IMAGE_PROXY
+
+def proxy_url(url, width=DEFAULT_WIDTH):
+    """This origin's URL for `url` if it can be proxied, else `url` unchanged."""
+    if not url or not _serving or not allowed(url):
+        return url
+    width = snap_width(width)
+    name = image_cache.rendered.get((url, width))
+    if name is not None:
+        return f"{PUBLIC_BASE_URL}{IMAGE_PATH}/{name}"
+    return f"{PUBLIC_BASE_URL}{IMAGE_PROXY_PATH}?url={quote(url, safe='')}&w={width}"
+
+def snap_width(width):
+    """Smallest cached width that is at least `width`, capped at the largest."""
+    for w in WIDTHS:
+        if width <= w:
+            return w
+    return WIDTHS[-1]
+
+def thumbnail_name(digest, width):
+    return f"{digest}-{width}.webp"
+
+def thumbnail_path(name):
+    return os.path.join(IMAGE_CACHE_DIR, name[:2], name)
+
+def source_path(digest):
+    return os.path.join(IMAGE_CACHE_DIR, digest[:2], f"{digest}.src")
+
+def _url_path(url):
+    return os.path.join(IMAGE_CACHE_DIR, "urls", hashlib.sha1(url.encode()).hexdigest())
+
+def render_thumbnail(data, width):
+    Image = _image_module()
+    with Image.open(BytesIO(data)) as img:
+        img = img.convert("RGBA") if img.mode in ("P", "LA", "RGBA") else img.convert("RGB")
+        if img.width > width:
+            img = img.resize((width, max(1, round(img.height * width / img.width))), Image.LANCZOS)
+        out = BytesIO()
+        img.save(out, "WEBP", quality=WEBP_QUALITY, method=4)
+        return out.getvalue()
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+async def _check_host(request):
+    # redirects are followed, so every hop has to stay on an allowed host
+    if not allowed(str(request.url)):
+        raise ValueError(f"Host not allowed: {request.url.host}")
+
+class ImageCache:
+    def __init__(self):
+        self.digests = {}    # source url -> content digest
+        self.rendered = {}   # (source url, width) -> thumbnail name, for thumbnails known to be on disk
+        self._inflight = {}
+        self._client = None
+
+    def _digest_for(self, url):
+        digest = self.digests.get(url)
+        if digest is None and os.path.exists(_url_path(url)):
+            with open(_url_path(url)) as f:
+                digest = self.digests[url] = f.read().strip()
+        return digest
+
+    async def _download(self, url):
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=15, follow_redirects=True,
+                                             event_hooks={"request": [_check_host]})
+        with track_upstream("images"):
+            return await self._stream(url)
+
+    async def _stream(self, url):
+        async with self._client.stream("GET", url) as response:
+            response.raise_for_status()
+            if not response.headers.get("content-type", "").startswith("image/"):
+                raise ValueError(f"Not an image: {response.headers.get('content-type')}")
+            chunks = []
+            size = 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > IMAGE_MAX_BYTES:
+                    raise ValueError(f"Image larger than {IMAGE_MAX_BYTES} bytes")
+                chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def _render(self, url, width):
+        digest = self._digest_for(url)
+        if digest is not None and os.path.exists(source_path(digest)):
+            data = await asyncio.to_thread(_read, source_path(digest))
+        else:
+            # first sight of this URL: keep the original so other widths never refetch it
+            data = await self._download(url)
+            digest = hashlib.sha256(data).hexdigest()
+            await asyncio.to_thread(_write, source_path(digest), data)
+            await asyncio.to_thread(_write, _url_path(url), digest.encode())
+            self.digests[url] = digest
+            logger.info(f"Cached {url} as {digest} ({len(data)} bytes)")
+        name = thumbnail_name(digest, width)
+        if not os.path.exists(thumbnail_path(name)):
+            thumb = await asyncio.to_thread(render_thumbnail, data, width)
+            await asyncio.to_thread(_write, thumbnail_path(name), thumb)
+        return name
+
+    async def thumbnail(self, url, width):
+        """Name of the cached thumbnail of `url` at `width`; concurrent requests share one render."""
+        key = (url, width)
+        digest = self._digest_for(url)
+        if digest is not None and os.path.exists(thumbnail_path(thumbnail_name(digest, width))):
+            name = thumbnail_name(digest, width)
+        else:
+            task = self._inflight.get(key)
+            if task is None:
+                task = self._inflight[key] = asyncio.ensure_future(self._render(url, width))
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            name = await task
+        self.rendered[key] = name
+        return name
+
+image_cache = ImageCache()
@@ -0,0 +1,110 @@
+"""
+In-app ingestion schedule.
+
+Every enabled source in the catalogue (sources.py) with a polling interval
+gets its own job. Sources sharing an interval are spread evenly across it:
+N sources polled every T seconds start T/N apart, the first at startup, so
+upstream calls and ingest writes form a steady trickle instead of a burst
+every T seconds.
+
+Every replica runs the scheduler, but a job only does work in the replica
+that currently leads ingestion (see leader.py), so each source is polled
+once per interval however many replicas serve reads. If the leader dies,
+another replica is elected within LEADER_RETRY_SECONDS and its next tick
+runs the job.
+
+With no intervals configured (FETCH_INTERVAL_SECONDS=0, the default, and
+none in the catalogue) no fetches are scheduled and ingestion stays
+triggered from outside, via /api/fetchMatches or scripts/fetch_fixtures.py.
+
+With the news router enabled, the news poll runs every NEWS_REFRESH_SECONDS
+in every worker, so requests only ever read the index; the poll itself
+leaves the upstream calls to one worker when there is a shared cache.
+"""
+import time, asyncio, logging
+from datetime import datetime, timezone
+from functools import partial
+from leader import LeaderElection, acquire
+from metrics import observe_job_lag, job_succeeded
+from providers import enabled_providers
+from sources import enabled_sources
+
+logger = logging.getLogger(__name__)
+
+election = LeaderElection("ingestion")
+_scheduler = None
+
+def periodic(job, interval, first_due, fn, leader=True):
+    """fn wrapped to record its lag and success under `job`; with `leader`, to run only on the leader."""
+    due = first_due
+
+    def run():
+        nonlocal due
+        lag = time.time() - due
+        # missed ticks are coalesced into this run, so the next one is due after now
+        due += interval * max(1, int(lag // interval) + 1)
+        if leader and not election.is_leader:
+            return
+        observe_job_lag(job, lag)
+        fn()
+        job_succeeded(job)
+    return run
+
+def fetch_source(source):
+    from fetcher import fetch_fixtures
+    lock = acquire(f"fetch:{source.name}")
+    if lock is None:
+        logger.info(f"Skipping scheduled fetch of {source.name}: already running")
+        return
+    try:
+        summary = asyncio.run(fetch_fixtures([source.competition], [source.provider]))
+    finally:
+        lock.release()
+    logger.info(f"Scheduled fetch of {source.name}: {summary['fetched']} fixtures, {summary['added']} new, "
+                f"{len(summary['errors'])} errors")
+
+def schedule():
+    """(job name, interval seconds, offset seconds, fn) for every scheduled source, in start order."""
+    by_interval = {}
+    for source in enabled_sources({p.NAME for p in enabled_providers()}):
+        if source.interval > 0:
+            by_interval.setdefault(source.interval, []).append(source)
+    jobs = []
+    for interval, group in sorted(by_interval.items()):
+        for i, source in enumerate(group):
+            jobs.append((f"fetch:{source.name}", interval, interval * i / len(group), partial(fetch_source, source)))
+    return jobs
+
+def start(news=False):
+    """Schedule the source fetches and, with `news`, the news poll (first run right away)."""
+    global _scheduler
+    if _scheduler is not None:
+        return
+    jobs = [(name, interval, offset, fn, True) for name, interval, offset, fn in schedule()]
+    if jobs:
+        election.start()
+    if news:
+        from routers.news import NEWS_REFRESH_SECONDS, refresh_news
+        if NEWS_REFRESH_SECONDS > 0:
+            jobs.append(("news_refresh", NEWS_REFRESH_SECONDS, 0, refresh_news, False))
+    if not jobs:
+        return
+    from apscheduler.schedulers.background import BackgroundScheduler
+    _scheduler = BackgroundScheduler(timezone="UTC")
+    now = time.time()
+    for name, interval, offset, fn, leader in jobs:
+        # the trigger would put the first run a whole interval after start_date, so it is pinned to
+        # now + offset; coalesce: a backlog of missed ticks is one run, and never two at once
+        first = datetime.fromtimestamp(now + offset, timezone.utc)
+        _scheduler.add_job(periodic(name, interval, now + offset, fn, leader), "interval", seconds=interval, id=name, name=name,
+                           start_date=first, next_run_time=first,
+                           coalesce=True, max_instances=1, misfire_grace_time=max(1, int(interval)))
+    _scheduler.start()
+    logger.info(f"Scheduled {len(jobs)} jobs")
+
+def stop():
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.shutdown(wait=False)
+        _scheduler = None
+    election.stop()
@@ -0,0 +1,152 @@
+"""
+Kickoff times: normalized to UTC at ingest and indexed by local calendar day.
+
+Providers report kickoffs as offset-aware ISO strings or as a date and time
+with no offset (TheSportsDB, in UTC). to_utc() turns either into a naive UTC
+datetime, which is what the kickoff column holds, and epoch() into the
+integer seconds stored next to it in kickoff_ts, the indexed column window
+queries filter on.
+
+DayIndex keeps every fixture's kickoff_ts sorted in memory and, per client
+timezone, a precomputed map of local date -> slice of that order, so
+"today in Europe/London" is a dict lookup. A timezone's map is built the
+first time it is asked for and dropped whenever fixtures change; the other
+workers hear about changes over the shared cache and reload on next use.
+"""
+import os, bisect, calendar, logging, threading
+from collections import OrderedDict
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+from shared_cache import shared_cache
+
+logger = logging.getLogger(__name__)
+
+DAY_INDEX_TIMEZONES = int(os.getenv("DAY_INDEX_TIMEZONES", "64"))  # per-timezone bucket maps kept
+
+def to_utc(dt, tz=timezone.utc):
+    """Naive UTC datetime for `dt`; a naive `dt` is taken to be in `tz`."""
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=tz)
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+def epoch(dt):
+    """Seconds since the epoch for a naive UTC datetime."""
+    return calendar.timegm(dt.timetuple()) if dt is not None else None
+
+def zone(name):
+    """ZoneInfo for an IANA timezone name; ValueError if there is no such zone."""
+    try:
+        return ZoneInfo(name)
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Unknown timezone: {name}") from e
+
+def local_today(tz):
+    return datetime.now(tz).date()
+
+def day_start(day, tz):
+    """Epoch seconds of local midnight starting `day` in `tz`."""
+    return int(datetime.combine(day, time(), tz).timestamp())
+
+def day_range(first, days, tz):
+    """(start, end) epoch seconds covering `days` local days from `first` in `tz`."""
+    return day_start(first, tz), day_start(first + timedelta(days=days), tz)
+
+class DayIndex:
+    def __init__(self):
+        self.kickoffs = {}   # match id -> (kickoff_ts, league)
+        self.order = []      # (kickoff_ts, match id), sorted
+        self.buckets = OrderedDict()  # timezone name -> {local date: (lo, hi) into order}
+        self.stale = False
+        self._lock = threading.Lock()
+
+    def _changed(self):
+        self.order = None
+        self.buckets.clear()
+
+    def add(self, matches):
+        """Index (match id, kickoff_ts, league) rows; re-adding a match moves it."""
+        with self._lock:
+            for match_id, ts, league in matches:
+                if ts is None:
+                    self.kickoffs.pop(match_id, None)
+                else:
+                    self.kickoffs[match_id] = (ts, league)
+            self._changed()
+
+    def _buckets(self, tz_name):
+        buckets = self.buckets.get(tz_name)
+        if buckets is not None:
+            self.buckets.move_to_end(tz_name)
+            return buckets
+        tz = zone(tz_name)
+        if self.order is None:
+            self.order = sorted((ts, match_id) for match_id, (ts, _) in self.kickoffs.items())
+        order = self.order
+        buckets = {}
+        # one bisect per local day rather than one conversion per fixture
+        i = 0
+        while i < len(order):
+            day = datetime.fromtimestamp(order[i][0], tz).date()
+            end = bisect.bisect_left(order, (day_start(day + timedelta(days=1), tz),), i)
+            buckets[day] = (i, end)
+            i = end
+        self.buckets[tz_name] = buckets
+        while len(self.buckets) > DAY_INDEX_TIMEZONES:
+            self.buckets.popitem(last=False)
+        return buckets
+
+    def days(self, first, count, tz_name, leagues=None):
+        """Match ids kicking off on the `count` local days from `first` in `tz_name`, in kickoff order."""
+        with self._lock:
+            buckets = self._buckets(tz_name)
+            ids = []
+            for n in range(count):
+                lo, hi = buckets.get(first + timedelta(days=n), (0, 0))
+                ids.extend(match_id for _, match_id in self.order[lo:hi])
+            if leagues:
+                ids = [i for i in ids if self.kickoffs[i][1] in leagues]
+            return ids
+
+    def mark_stale(self):
+        self.stale = True
+
+    def rebuild(self, db):
+        from models import Match
+        rows = db.query(Match.id, Match.kickoff_ts, Match.league).filter(Match.kickoff_ts.isnot(None)).all()
+        with self._lock:
+            self.kickoffs = {match_id: (ts, league) for match_id, ts, league in rows}
+            self._changed()
+            self.stale = False
+        logger.info(f"Day index built from {len(rows)} fixtures")
+
+    def refresh(self):
+        """Reload from the matches table if another worker has changed fixtures. Blocking."""
+        if not self.stale:
+            return
+        from db import SessionLocal
+        db = SessionLocal()
+        try:
+            self.rebuild(db)
+        finally:
+            db.close()
+
+    def stats(self):
+        return {"fixtures": len(self.kickoffs), "timezones": list(self.buckets), "stale": self.stale}
+
+def backfill(db):
+    """Set kickoff_ts on rows stored before it existed, reading their kickoff as UTC."""
+    from models import Match
+    count = 0
+    for m in db.query(Match).filter(Match.kickoff.isnot(None), Match.kickoff_ts.is_(None)).all():
+        m.kickoff = to_utc(m.kickoff)
+        m.kickoff_ts = epoch(m.kickoff)
+        count += 1
+    if count:
+        db.commit()
+        logger.info(f"Backfilled kickoff_ts for {count} fixtures")
+    return count
+
+day_index = DayIndex()
+shared_cache.on_invalidate("fixtures", day_index.mark_stale)
@@ -0,0 +1,170 @@
+"""
+Leader election for ingestion across replicas, on Postgres advisory locks.
+
+Every replica runs an election thread that tries pg_try_advisory_lock on a
+connection of its own. The replica that gets the lock is the leader and
+keeps it, and the connection, for as long as it runs; the others retry
+every LEADER_RETRY_SECONDS. When the leader dies its connection drops,
+Postgres releases the lock and the next retry elsewhere takes over. The
+leader checks its connection on the same interval and steps down if it has
+lost it.
+
+acquire(name) is the one-off version for a single run: a job triggered on
+every replica at once runs in whichever takes the lock first and is skipped
+in the others.
+
+SQLite has no advisory locks and no replicas, so there every process leads.
+Session locks don't survive PgBouncer transaction pooling; behind it, set
+LEADER_DATABASE_URL to a direct Postgres URL.
+"""
+import os, time, hashlib, logging, threading
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from db import DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+LEADER_DATABASE_URL = os.getenv("LEADER_DATABASE_URL", DATABASE_URL)
+LEADER_RETRY_SECONDS = float(os.getenv("LEADER_RETRY_SECONDS", "15"))
+
+def advisory_key(name):
+    """Stable signed 64-bit lock key for `name`."""
+    return int.from_bytes(hashlib.sha1(f"scoresure:{name}".encode()).digest()[:8], "big", signed=True)
+
+def advisory_locks():
+    return LEADER_DATABASE_URL.startswith("postgresql")
+
+_engine = None
+
+def lock_engine():
+    # unpooled, autocommit connections that exist only to hold locks
+    global _engine
+    if _engine is None:
+        connect_args = {}
+        if LEADER_DATABASE_URL.split("://", 1)[0] in ("postgresql", "postgresql+psycopg2"):
+            # notice a half-open leader connection in seconds rather than hours
+            connect_args = {"keepalives": 1, "keepalives_idle": 10, "keepalives_interval": 5, "keepalives_count": 3}
+        _engine = create_engine(LEADER_DATABASE_URL, poolclass=NullPool, isolation_level="AUTOCOMMIT",
+                                connect_args=connect_args, future=True)
+    return _engine
+
+class Lock:
+    def __init__(self, name, conn=None, local=None):
+        self.name = name
+        self._conn = conn
+        self._local = local
+
+    def release(self):
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": advisory_key(self.name)})
+            finally:
+                self._conn.close()
+                self._conn = None
+        if self._local is not None:
+            self._local.release()
+            self._local = None
+
+_local_locks = {}
+_local_locks_guard = threading.Lock()
+
+def acquire(name):
+    """A held Lock for `name` if no other process (or thread) holds it, else None. Blocking; run off the loop."""
+    with _local_locks_guard:
+        local = _local_locks.setdefault(name, threading.Lock())
+    if not local.acquire(blocking=False):
+        return None
+    if not advisory_locks():
+        return Lock(name, local=local)
+    try:
+        conn = lock_engine().connect()
+    except Exception:
+        local.release()
+        raise
+    try:
+        held = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": advisory_key(name)}).scalar()
+    except Exception:
+        conn.close()
+        local.release()
+        raise
+    if not held:
+        conn.close()
+        local.release()
+        return None
+    return Lock(name, conn, local)
+
+class LeaderElection:
+    def __init__(self, name, retry=LEADER_RETRY_SECONDS):
+        self.name = name
+        self.key = advisory_key(name)
+        self.retry = retry
+        self.is_leader = not advisory_locks()
+        self.leader_since = time.time() if self.is_leader else None
+        self.times_elected = 0
+        self._conn = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _campaign(self):
+        conn = lock_engine().connect()
+        try:
+            held = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}).scalar()
+        except Exception:
+            conn.close()
+            raise
+        if not held:
+            conn.close()
+            return
+        self._conn = conn
+        self.is_leader = True
+        self.leader_since = time.time()
+        self.times_elected += 1
+        logger.info(f"Elected {self.name} leader")
+
+    def _step_down(self, reason):
+        self.is_leader = False
+        self.leader_since = None
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+        logger.warning(f"No longer {self.name} leader: {reason}")
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self._conn is None:
+                    self._campaign()
+                else:
+                    # the lock lives exactly as long as this connection
+                    self._conn.execute(text("SELECT 1"))
+            except Exception as e:
+                if self._conn is not None:
+                    self._step_down(str(e))
+                else:
+                    logger.warning(f"{self.name} election attempt failed: {e}")
+            self._stop.wait(self.retry)
+
+    def start(self):
+        if not advisory_locks() or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-election", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop campaigning and release the lock so another replica can take over right away."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+            except Exception:
+                pass
+            self._step_down("shutting down")
+
+    def stats(self):
+        return {"name": self.name, "leader": self.is_leader, "leader_since": self.leader_since,
+                "times_elected": self.times_elected, "advisory_locks": advisory_locks()}
@@ -0,0 +1,18 @@
+from sources import COMPETITIONS, provider_ids
+
+# Every competition in the source catalogue, by key. Values are the
+# API-Football league ids (None where that provider doesn't carry it).
+_api_football = provider_ids("api_football")
+LEAGUES = {key: _api_football.get(key) for key in COMPETITIONS}
+
+# Names as stored in Match.league
+LEAGUE_NAMES = {key: c["name"] for key, c in COMPETITIONS.items()}
+
+LEAGUE_COUNTRIES = {key: c["country"] for key, c in COMPETITIONS.items()}
+
+# Match.league back to the competition key; the first competition wins a shared name
+LEAGUE_KEYS = {name: key for key, name in reversed(LEAGUE_NAMES.items())}
+
+
+def league_key_for_name(name):
+    return LEAGUE_KEYS.get(name)
@@ -2,12 +2,94 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import importlib
+import logging
 from fastapi import FastAPI
-from routes import router
+from fastapi.middleware.cors import CORSMiddleware
+from db import Base, engine, async_engine, SessionLocal
+from responses import ORJSONResponse, ORJSONRoute
+from compression import CompressionMiddleware
+from shared_cache import shared_cache
+import jobs
+from routers import ROUTERS, ENABLED_ROUTERS
+import models  # noqa: F401  (registers tables)
 import uvicorn
 
-app = FastAPI(title="ScoreSure Backend")
-app.include_router(router)
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",") if o.strip()]
+
+app = FastAPI(title="ScoreSure Backend", version="5.0.0", default_response_class=ORJSONResponse)
+app.router.route_class = ORJSONRoute
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+# added last so it wraps CORS and sees every response body
+app.add_middleware(CompressionMiddleware)
+if "metrics" in ENABLED_ROUTERS:
+    from metrics import MetricsMiddleware, instrument_engine
+    app.add_middleware(MetricsMiddleware)
+    instrument_engine(engine, "sync")
+    instrument_engine(async_engine.sync_engine, "async")
+if "images" in ENABLED_ROUTERS:
+    import images
+    images.serve()
+if "profiling" in ENABLED_ROUTERS:
+    import profiling
+    if profiling.enabled():
+        app.add_middleware(profiling.ProfilingMiddleware)
+        profiling.instrument_engine(engine)
+        profiling.instrument_engine(async_engine.sync_engine)
+
+for name in ENABLED_ROUTERS:
+    if name not in ROUTERS:
+        logger.warning(f"Unknown router '{name}' in ENABLED_ROUTERS")
+        continue
+    app.include_router(importlib.import_module(ROUTERS[name]).router)
+
+@app.get("/")
+def root():
+    return {"message": "ScoreSure Backend API", "version": app.version, "routers": ENABLED_ROUTERS}
+
+@app.on_event("startup")
+def startup():
+    Base.metadata.create_all(bind=engine)
+    shared_cache.start()
+    db = SessionLocal()
+    try:
+        from kickoffs import backfill, day_index
+        backfill(db)
+        if "fixtures" in ENABLED_ROUTERS:
+            day_index.rebuild(db)
+        if "predictions" in ENABLED_ROUTERS:
+            from predictions import load_model
+            from history import history
+            from features import features
+            # map the fitted ratings artifact; refitting happens offline
+            load_model()
+            history.rebuild(db)
+            features.rebuild(db)
+        if "search" in ENABLED_ROUTERS:
+            from search import search_index
+            search_index.rebuild_fixtures(db)
+        if "news" in ENABLED_ROUTERS:
+            from tagger import team_tagger
+            team_tagger.rebuild(db)
+    finally:
+        db.close()
+    # after the indexes the jobs feed are built
+    jobs.start(news="news" in ENABLED_ROUTERS)
+
+@app.on_event("shutdown")
+def shutdown():
+    # hand ingestion leadership over now rather than when the connection times out
+    jobs.stop()
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
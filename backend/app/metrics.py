@@ -0,0 +1,96 @@
+"""
+Prometheus metrics for the hot paths.
+
+Metric objects are created once at import; the request path only looks up a
+labelled child and bumps it. State that already has counters (response cache,
+news and search indexes, DB pools) is read at scrape time by the collector in
+routers/metrics.py instead of being mirrored on every operation.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from prometheus_client import Counter, Histogram, Gauge
+from sqlalchemy import event
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+REQUEST_SECONDS = Histogram("scoresure_request_seconds", "Request latency by route",
+                            ("method", "route", "status"), buckets=LATENCY_BUCKETS)
+REQUEST_DB_QUERIES = Histogram("scoresure_request_db_queries", "DB queries issued per request",
+                               ("route",), buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100))
+DB_QUERY_SECONDS = Histogram("scoresure_db_query_seconds", "DB statement latency", ("engine",),
+                             buckets=LATENCY_BUCKETS)
+UPSTREAM_SECONDS = Histogram("scoresure_upstream_seconds", "Upstream call latency by source", ("source",),
+                             buckets=LATENCY_BUCKETS + (30,))
+UPSTREAM_ERRORS = Counter("scoresure_upstream_errors", "Failed upstream calls by source", ("source",))
+HEDGED_REQUESTS = Counter("scoresure_upstream_hedged_requests", "Hedged upstream attempts fired, and won by the hedge",
+                          ("source", "outcome"))
+PREDICTION_BATCH = Histogram("scoresure_prediction_batch_size", "Fixtures per prediction batch",
+                             buckets=(1, 5, 10, 25, 50, 100, 250, 1000, 5000, 10000))
+JOB_LAG_SECONDS = Histogram("scoresure_job_lag_seconds", "Delay between a job being due and starting", ("job",),
+                            buckets=(0.01, 0.1, 0.5, 1, 5, 15, 60, 300, 900, 3600))
+JOB_LAST_SUCCESS = Gauge("scoresure_job_last_success_timestamp", "Unix time of the last successful run", ("job",))
+
+# per-request DB query count; a one-item list so listeners on other threads can bump it
+_request_queries = ContextVar("request_queries", default=None)
+
+@contextmanager
+def track_upstream(source):
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        UPSTREAM_ERRORS.labels(source).inc()
+        raise
+    finally:
+        UPSTREAM_SECONDS.labels(source).observe(time.perf_counter() - start)
+
+def observe_job_lag(job, lag):
+    JOB_LAG_SECONDS.labels(job).observe(max(lag, 0.0))
+
+def job_succeeded(job):
+    JOB_LAST_SUCCESS.labels(job).set(time.time())
+
+def instrument_engine(engine, name):
+    histogram = DB_QUERY_SECONDS.labels(name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after(conn, cursor, statement, parameters, context, executemany):
+        histogram.observe(time.perf_counter() - context._query_start)
+        count = _request_queries.get()
+        if count is not None:
+            count[0] += 1
+
+class MetricsMiddleware:
+    """Times every HTTP request and counts its DB queries, labelled by route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        status = 500
+        queries = [0]
+        token = _request_queries.set(queries)
+
+        async def send_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            _request_queries.reset(token)
+            route = scope.get("route")
+            # unmatched paths share one label so scanners can't blow up cardinality
+            path = route.path if route is not None else "unmatched"
+            REQUEST_SECONDS.labels(scope["method"], path, status).observe(time.perf_counter() - start)
+            REQUEST_DB_QUERIES.labels(path).observe(queries[0])
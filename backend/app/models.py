@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Float, Text
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, JSON, Float, Index
 from sqlalchemy.sql import func
 from db import Base
 
+
 class Match(Base):
     __tablename__ = "matches"
     id = Column(Integer, primary_key=True, index=True)
@@ -9,11 +10,20 @@ class Match(Base):
     league = Column(String)
     home = Column(String)
     away = Column(String)
-    kickoff = Column(DateTime)
+    home_logo = Column(String)
+    away_logo = Column(String)
+    kickoff = Column(DateTime)  # naive UTC
+    kickoff_ts = Column(BigInteger, index=True)  # kickoff as UTC epoch seconds, what window queries filter on
     status = Column(String)
+    venue = Column(String)
+    referee = Column(String)
+    provider = Column(String)  # 'api_football', 'espn', 'thesportsdb'
     provider_payload = Column(JSON)
     created_at = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (Index("ix_matches_league_kickoff_ts", "league", "kickoff_ts"),)
+
+
 class Odds(Base):
     __tablename__ = "odds"
     id = Column(Integer, primary_key=True)
@@ -22,4 +32,17 @@ class Odds(Base):
     market = Column(String)
     selection = Column(String)
     odd = Column(Float)
-    retrieved_at = Column(DateTime, server_default=func.now())
\ No newline at end of file
+    retrieved_at = Column(DateTime, server_default=func.now())
+
+
+class Result(Base):
+    __tablename__ = "results"
+    id = Column(Integer, primary_key=True)
+    match_id = Column(Integer, unique=True, index=True)
+    league = Column(String, index=True)
+    home = Column(String)
+    away = Column(String)
+    kickoff = Column(DateTime, index=True)
+    home_goals = Column(Integer)
+    away_goals = Column(Integer)
+    recorded_at = Column(DateTime, server_default=func.now())
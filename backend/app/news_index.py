@@ -0,0 +1,158 @@
+"""
+Merged, deduplicated news index.
+
+Articles from every source are added once: a story is dropped if its
+canonical URL is already indexed, or if its title is a near duplicate of an
+indexed title (MinHash over word shingles with LSH banding, so only a handful
+of candidates are compared). Entries are kept in two sorted lists: by publish
+time, for the latest N, and by ingest sequence, for everything after a
+cursor. A feed can deliver an article published hours ago, so a cursor on
+publish time would skip it; the ingest sequence only grows. Sequences are
+epoch milliseconds at ingest (bumped to stay strictly increasing), so a
+cursor from one worker is close to right in another.
+"""
+import os, re, time, zlib, threading
+import numpy as np
+from sortedcontainers import SortedList
+from search import search_index
+from tagger import team_tagger
+
+NEWS_INDEX_SIZE = int(os.getenv("NEWS_INDEX_SIZE", "5000"))
+DUP_THRESHOLD = float(os.getenv("NEWS_DUP_THRESHOLD", "0.6"))
+
+NUM_PERM = 32
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(7)
+_A = _rng.integers(1, _PRIME, NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, _PRIME, NUM_PERM, dtype=np.uint64)
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+def shingles(title):
+    words = WORD_RE.findall(title.lower())
+    if len(words) < 2:
+        return set(words)
+    return {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+def minhash(title):
+    """NUM_PERM-value MinHash signature of the title's word bigrams; None for an empty title."""
+    grams = shingles(title)
+    if not grams:
+        return None
+    x = np.fromiter((zlib.crc32(g.encode()) for g in grams), dtype=np.uint64, count=len(grams))
+    return ((np.outer(x, _A) + _B) % _PRIME).min(axis=0)
+
+def decode_cursor(cursor):
+    """Ingest sequence for a cursor string; raises ValueError if malformed."""
+    sequence = int(cursor)
+    if sequence < 0:
+        raise ValueError(f"Negative cursor: {cursor}")
+    return sequence
+
+class NewsIndex:
+    def __init__(self, size=NEWS_INDEX_SIZE):
+        self.size = size
+        self.keys = SortedList()      # (published epoch ms, id)
+        self.ingested = SortedList()  # (ingest sequence, id)
+        self.by_id = {}               # id -> (key, article, signature, sequence)
+        self.sequence = 0
+        self.buckets = {}       # (band, band hash) -> set of ids
+        self.duplicates = 0
+        self._lock = threading.Lock()
+
+    def _bands(self, signature):
+        return [(i, signature[i * ROWS:(i + 1) * ROWS].tobytes()) for i in range(BANDS)]
+
+    def _near_duplicate(self, signature):
+        seen = set()
+        for band in self._bands(signature):
+            for other in self.buckets.get(band, ()):
+                if other in seen:
+                    continue
+                seen.add(other)
+                if np.count_nonzero(self.by_id[other][2] == signature) / NUM_PERM >= DUP_THRESHOLD:
+                    return other
+        return None
+
+    def add(self, article):
+        """Index `article`; False if it duplicates an indexed story."""
+        signature = minhash(article.title)
+        with self._lock:
+            existing = self.by_id.get(article.id)
+            if existing is None and signature is not None:
+                dup = self._near_duplicate(signature)
+                existing = self.by_id.get(dup) if dup else None
+            if existing is not None:
+                indexed = existing[1]
+                if indexed is article:
+                    return False
+                self.duplicates += 1
+                if indexed.image is None and article.image:
+                    indexed.image = article.image
+                return False
+            published = article.published_at.timestamp() if article.published_at else time.time()
+            key = (int(published * 1000), article.id)
+            self.sequence = max(self.sequence + 1, int(time.time() * 1000))
+            self.keys.add(key)
+            self.ingested.add((self.sequence, article.id))
+            self.by_id[article.id] = (key, article, signature, self.sequence)
+            if signature is not None:
+                for band in self._bands(signature):
+                    self.buckets.setdefault(band, set()).add(article.id)
+            search_index.add_article(article)
+            team_tagger.tag_article(article)
+            while len(self.keys) > self.size:
+                self._evict(self.keys[0][1])
+            return True
+
+    def extend(self, articles):
+        return sum(self.add(a) for a in articles)
+
+    def _evict(self, article_id):
+        key, _, signature, sequence = self.by_id.pop(article_id)
+        self.keys.remove(key)
+        self.ingested.remove((sequence, article_id))
+        search_index.remove_article(article_id)
+        team_tagger.remove_article(article_id)
+        if signature is not None:
+            for band in self._bands(signature):
+                ids = self.buckets.get(band)
+                ids.discard(article_id)
+                if not ids:
+                    del self.buckets[band]
+
+    def latest(self, n):
+        """Newest `n` articles, newest first."""
+        with self._lock:
+            keys = self.keys[-n:] if n > 0 else []
+            return [self.by_id[k[1]][1] for k in reversed(keys)]
+
+    def newest_of(self, ids, n):
+        """Newest `n` of the indexed articles with the given ids, newest first."""
+        with self._lock:
+            entries = [self.by_id[i] for i in ids if i in self.by_id]
+        entries.sort(key=lambda e: e[0], reverse=True)
+        return [e[1] for e in entries[:n]]
+
+    def since(self, cursor, limit):
+        """Up to `limit` articles indexed after `cursor`, in ingest order, and the cursor to resume from."""
+        after = decode_cursor(cursor)
+        with self._lock:
+            start = self.ingested.bisect_left((after + 1,))
+            entries = list(self.ingested.islice(start, start + limit))
+            articles = [self.by_id[i][1] for _, i in entries]
+        return articles, str(entries[-1][0]) if entries else cursor
+
+    def head_cursor(self):
+        with self._lock:
+            return str(self.sequence)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def stats(self):
+        return {"articles": len(self.keys), "duplicates_dropped": self.duplicates, "buckets": len(self.buckets)}
+
+news_index = NewsIndex()
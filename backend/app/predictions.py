@@ -1,7 +1,13 @@
 from db import SessionLocal
 from models import Match
+from registry import registry
+from features import features, FEATURE_COLUMNS
 import math
 
+def load_model():
+    # map the current ratings artifact; later swaps go through the registry
+    return registry.load_current()
+
 def compute_simple_pick(home_elo=1500, away_elo=1500, home_adv=50):
     eh = home_elo + home_adv
     ea = away_elo
@@ -12,16 +18,41 @@ def compute_simple_pick(home_elo=1500, away_elo=1500, home_adv=50):
     p_draw = max(0.05, 1 - (p_home + p_away))
     return {"p_home": p_home, "p_draw": p_draw, "p_away": p_away}
 
+HOME_GF = FEATURE_COLUMNS.index("home_venue_gf_avg")
+HOME_GA = FEATURE_COLUMNS.index("home_venue_ga_avg")
+AWAY_GF = FEATURE_COLUMNS.index("away_venue_gf_avg")
+AWAY_GA = FEATURE_COLUMNS.index("away_venue_ga_avg")
+
+def _expected_goals(attack, defence, default):
+    values = [v for v in (attack, defence) if not math.isnan(v)]
+    return sum(values) / len(values) if values else default
+
+def predict_fixtures(matches):
+    """Outcome probabilities from the active model plus expected goals from rolling form."""
+    picks = registry.predict_batch(matches)
+    rows = features.feature_matrix(matches)
+    out = []
+    for pick, row in zip(picks, rows):
+        total = pick["p_home"] + pick["p_draw"] + pick["p_away"]
+        home, draw, away = pick["p_home"] / total, pick["p_draw"] / total, pick["p_away"] / total
+        out.append({
+            "home_win_prob": home,
+            "draw_prob": draw,
+            "away_win_prob": away,
+            "predicted_home_score": _expected_goals(row[HOME_GF], row[AWAY_GA], 1.5),
+            "predicted_away_score": _expected_goals(row[AWAY_GF], row[HOME_GA], 1.0),
+            "confidence": min(max(abs(home - away) + 0.5, 0.6), 0.95),
+        })
+    return out
+
 def run_prediction_job():
     db = SessionLocal()
     try:
         matches = db.query(Match).filter(Match.status == 'SCHEDULED').all()
         results = []
-        for m in matches:
-            # placeholder: use team names to get elo from a lookup (omitted)
-            pick = compute_simple_pick()
+        for m, pick in zip(matches, registry.predict_batch(matches)):
             best = max(("home", pick["p_home"]), ("draw", pick["p_draw"]), ("away", pick["p_away"]), key=lambda x: x[1])
             results.append({"match_id": m.id, "pick": best[0], "confidence": int(best[1]*100)})
         return results
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1,211 @@
+"""
+Opt-in request profiling.
+
+ProfilingMiddleware profiles one request in PROFILE_SAMPLE_RATE, and any
+request whose X-Profile-Token header matches PROFILE_TOKEN. Each capture is
+a pyinstrument HTML trace (cProfile stats if pyinstrument isn't installed)
+plus every SQL statement the request ran with its duration. Captures go to a
+bounded ring of files under PROFILE_DIR, served by routers/profiling.py.
+
+Only one request is profiled at a time, and only work on the event loop
+thread is traced; sync handlers running in the threadpool show up as the
+time spent awaiting them.
+"""
+import os, re, hmac, json, time, asyncio, cProfile, pstats, logging, threading, itertools
+from io import StringIO
+from contextvars import ContextVar
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "profiles"))
+PROFILE_SAMPLE_RATE = int(os.getenv("PROFILE_SAMPLE_RATE", "0"))  # 0 disables sampling
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+PROFILE_RING_SIZE = int(os.getenv("PROFILE_RING_SIZE", "50"))
+PROFILE_HEADER = "x-profile-token"
+TOP_FUNCTIONS = 25
+
+PROFILE_NAME_RE = re.compile(r"^\d+-\d+\.(json|html|prof)$")
+
+_statements = ContextVar("profiled_statements", default=None)
+_busy = threading.Lock()
+_counter = itertools.count(1)
+
+def enabled():
+    return PROFILE_SAMPLE_RATE > 0 or bool(PROFILE_TOKEN)
+
+def token_matches(value):
+    return bool(PROFILE_TOKEN) and value is not None and hmac.compare_digest(value, PROFILE_TOKEN)
+
+def instrument_engine(engine):
+    @event.listens_for(engine, "before_cursor_execute")
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if _statements.get() is not None:
+            context._profile_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after(conn, cursor, statement, parameters, context, executemany):
+        statements = _statements.get()
+        if statements is not None and hasattr(context, "_profile_start"):
+            statements.append({"sql": statement, "ms": round((time.perf_counter() - context._profile_start) * 1000, 3)})
+
+class _Pyinstrument:
+    extension = "html"
+
+    def __init__(self):
+        from pyinstrument import Profiler
+        self.profiler = Profiler(async_mode="enabled")
+        self.profiler.start()
+
+    def stop(self):
+        self.profiler.stop()
+
+    def write(self, path):
+        with open(path, "w") as f:
+            f.write(self.profiler.output_html())
+        return None
+
+class _CProfile:
+    extension = "prof"
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+    def stop(self):
+        self.profiler.disable()
+
+    def write(self, path):
+        self.profiler.dump_stats(path)
+        out = StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        return out.getvalue()
+
+def start_profiler():
+    try:
+        return _Pyinstrument()
+    except ImportError:
+        return _CProfile()
+
+class ProfileRing:
+    """Last PROFILE_RING_SIZE captures on disk; each is a JSON summary plus a trace file."""
+
+    def __init__(self, directory=PROFILE_DIR, size=PROFILE_RING_SIZE):
+        self.directory = directory
+        self.size = size
+        self._seq = itertools.count()
+
+    def new_id(self):
+        return f"{int(time.time() * 1000)}-{next(self._seq)}"
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def save(self, profile_id, profiler, meta):
+        os.makedirs(self.directory, exist_ok=True)
+        trace = f"{profile_id}.{profiler.extension}"
+        summary = profiler.write(self.path(trace))
+        meta = dict(meta, id=profile_id, trace=trace)
+        if summary:
+            meta["top"] = summary
+        with open(self.path(f"{profile_id}.json"), "w") as f:
+            json.dump(meta, f)
+        self.trim()
+
+    def trim(self):
+        ids = sorted({name.split(".")[0] for name in os.listdir(self.directory) if PROFILE_NAME_RE.match(name)},
+                     key=lambda i: tuple(map(int, i.split("-"))))
+        for old in ids[:-self.size] if len(ids) > self.size else []:
+            for ext in ("json", "html", "prof"):
+                try:
+                    os.remove(self.path(f"{old}.{ext}"))
+                except FileNotFoundError:
+                    pass
+
+    def list(self):
+        if not os.path.isdir(self.directory):
+            return []
+        out = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json") and PROFILE_NAME_RE.match(name):
+                with open(self.path(name)) as f:
+                    meta = json.load(f)
+                meta.pop("top", None)
+                meta.pop("sql", None)
+                out.append(meta)
+        return sorted(out, key=lambda m: m["started_at"], reverse=True)
+
+profile_ring = ProfileRing()
+
+class ProfilingMiddleware:
+    def __init__(self, app, ring=profile_ring):
+        self.app = app
+        self.ring = ring
+
+    def _wanted(self, scope):
+        if scope["type"] != "http" or scope["path"].startswith("/debug/"):
+            return False
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER.encode():
+                return token_matches(value.decode("latin-1"))
+        return PROFILE_SAMPLE_RATE > 0 and next(_counter) % PROFILE_SAMPLE_RATE == 0
+
+    async def __call__(self, scope, receive, send):
+        if not self._wanted(scope) or not _busy.acquire(blocking=False):
+            return await self.app(scope, receive, send)
+        # whatever fails below, the next request can be profiled
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            _busy.release()
+
+    async def _profile(self, scope, receive, send):
+        status = 500
+
+        async def send_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            profiler = start_profiler()
+        except Exception as e:
+            logger.error(f"Failed to start profiler: {e}")
+            return await self.app(scope, receive, send)
+        statements = []
+        token = _statements.set(statements)
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            _statements.reset(token)
+            try:
+                # profilers hook the current thread, so they must be stopped on the loop
+                profiler.stop()
+            except Exception as e:
+                logger.error(f"Failed to stop profiler: {e}")
+                profiler = None
+            if profiler is not None:
+                route = scope.get("route")
+                meta = {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "query": scope.get("query_string", b"").decode("latin-1"),
+                    "route": route.path if route is not None else None,
+                    "status": status,
+                    "started_at": started_at,
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "sql_count": len(statements),
+                    "sql_ms": round(sum(s["ms"] for s in statements), 3),
+                    "sql": statements,
+                }
+                try:
+                    # the response has been sent; write the capture off the loop
+                    profile_id = self.ring.new_id()
+                    await asyncio.to_thread(self.ring.save, profile_id, profiler, meta)
+                    logger.info(f"Profiled {scope['method']} {scope['path']} in {meta['duration_ms']}ms as {profile_id}")
+                except Exception as e:
+                    logger.error(f"Failed to save profile: {e}")
@@ -0,0 +1,42 @@
+"""
+Fixture provider plugins.
+
+Each provider is a module exposing NAME, LEAGUES (our league key -> the
+provider's own id, read from the source catalogue) and
+`async def fetch(client, league_key)` returning fixture dicts with Match
+column names, `result(payload)` returning (home_goals, away_goals) for a
+stored provider_payload once the fixture is finished (else None), and
+optionally CONFIGURED, false when the provider can't fetch anything (a
+missing API key) so its competitions fall to the next provider. Modules are registered by import path and only imported the first
+time they are used.
+"""
+import os, importlib
+
+PROVIDERS = {
+    "api_football": "providers.api_football",
+    "espn": "providers.espn",
+    "thesportsdb": "providers.thesportsdb",
+}
+
+ENABLED_PROVIDERS = [p.strip() for p in os.getenv("PROVIDERS", ",".join(PROVIDERS)).split(",") if p.strip()]
+
+_loaded = {}
+
+def register_provider(name, module_path):
+    PROVIDERS[name] = module_path
+
+def get_provider(name):
+    module = _loaded.get(name)
+    if module is None:
+        module = _loaded[name] = importlib.import_module(PROVIDERS[name])
+    return module
+
+def enabled_providers():
+    providers = [get_provider(name) for name in ENABLED_PROVIDERS if name in PROVIDERS]
+    return [p for p in providers if getattr(p, "CONFIGURED", True)]
+
+def final_score(provider, payload):
+    """(home_goals, away_goals) if `provider`'s payload is a finished fixture, else None."""
+    if provider not in PROVIDERS or not isinstance(payload, dict):
+        return None
+    return get_provider(provider).result(payload)
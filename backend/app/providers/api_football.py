@@ -0,0 +1,55 @@
+import os
+from datetime import datetime
+from leagues import LEAGUE_NAMES
+from sources import provider_ids
+
+NAME = "api_football"
+
+# Get a free key from https://www.api-football.com/
+FOOTBALL_KEY = os.getenv("FOOTBALL_API_KEY")
+CONFIGURED = bool(FOOTBALL_KEY)
+FOOTBALL_BASE = os.getenv("FOOTBALL_BASE", "https://v3.football.api-sports.io")
+SEASON = int(os.getenv("FOOTBALL_SEASON", "2025"))
+
+# competition key -> API-Football league id, from the source catalogue
+LEAGUES = provider_ids(NAME)
+
+FINISHED = ("FT", "AET", "PEN")
+
+async def fetch(client, league_key, match_date=None):
+    league_id = LEAGUES.get(league_key)
+    if not FOOTBALL_KEY or not league_id:
+        return []
+    params = {"league": league_id, "season": SEASON}
+    if match_date:
+        params["date"] = match_date
+    r = await client.get(f"{FOOTBALL_BASE}/fixtures", params=params, headers={"x-apisports-key": FOOTBALL_KEY})
+    r.raise_for_status()
+    fixtures = []
+    for f in r.json().get("response", []):
+        fixture = f.get("fixture", {})
+        teams = f.get("teams", {})
+        venue = fixture.get("venue") or {}
+        fixtures.append({
+            "provider_id": str(fixture.get("id") or f.get("id")),
+            # the catalogue name, not API-Football's: it is the key every league filter and index joins on
+            "league": LEAGUE_NAMES[league_key],
+            "home": teams.get("home", {}).get("name"),
+            "away": teams.get("away", {}).get("name"),
+            "home_logo": teams.get("home", {}).get("logo"),
+            "away_logo": teams.get("away", {}).get("logo"),
+            "kickoff": datetime.fromisoformat(fixture["date"].replace("Z", "+00:00")) if fixture.get("date") else None,
+            "status": fixture.get("status", {}).get("short"),
+            "venue": venue.get("name") or "TBD",
+            "referee": fixture.get("referee") or "TBD",
+            "provider": NAME,
+            "provider_payload": f,
+        })
+    return fixtures
+
+def result(payload):
+    goals = payload.get("goals") or {}
+    status = (payload.get("fixture") or {}).get("status") or {}
+    if status.get("short") not in FINISHED or goals.get("home") is None or goals.get("away") is None:
+        return None
+    return int(goals["home"]), int(goals["away"])
@@ -0,0 +1,66 @@
+import os
+from datetime import datetime
+from leagues import LEAGUE_NAMES
+from sources import provider_ids, COMPETITIONS
+
+NAME = "espn"
+
+# the sport path segment ("soccer", ...) comes from the competition in the catalogue
+ESPN_BASE = os.getenv("ESPN_BASE", "https://site.api.espn.com/apis/site/v2/sports")
+
+# competition key -> ESPN league code, from the source catalogue
+LEAGUES = provider_ids(NAME)
+
+def sides(event):
+    """(home, away) competitors of an event, or None without two."""
+    competitors = ((event.get("competitions") or [{}])[0]).get("competitors", [])
+    if len(competitors) < 2:
+        return None
+    home, away = competitors[0], competitors[1]
+    # Determine home/away based on homeAway field
+    if home.get("homeAway") == "away":
+        home, away = away, home
+    return home, away
+
+def scoreboard_url(league_key):
+    return f"{ESPN_BASE}/{COMPETITIONS[league_key]['sport']}/{LEAGUES[league_key]}/scoreboard"
+
+async def fetch(client, league_key):
+    if not LEAGUES.get(league_key):
+        return []
+    r = await client.get(scoreboard_url(league_key))
+    r.raise_for_status()
+    fixtures = []
+    for event in r.json().get("events", []):
+        competition = (event.get("competitions") or [{}])[0]
+        pair = sides(event)
+        if pair is None:
+            continue
+        home, away = pair
+        fixtures.append({
+            "provider_id": f"espn_{event['id']}",
+            "league": LEAGUE_NAMES[league_key],
+            "home": home.get("team", {}).get("displayName", "Unknown"),
+            "away": away.get("team", {}).get("displayName", "Unknown"),
+            "home_logo": home.get("team", {}).get("logo", ""),
+            "away_logo": away.get("team", {}).get("logo", ""),
+            "kickoff": datetime.fromisoformat(event["date"].replace("Z", "+00:00")) if event.get("date") else None,
+            "status": event.get("status", {}).get("type", {}).get("name", "Scheduled"),
+            "venue": competition.get("venue", {}).get("fullName", "TBD"),
+            "referee": "TBD",
+            "provider": NAME,
+            "provider_payload": event,
+        })
+    return fixtures
+
+def result(payload):
+    if not ((payload.get("status") or {}).get("type") or {}).get("completed"):
+        return None
+    pair = sides(payload)
+    if pair is None:
+        return None
+    try:
+        # scores come as strings ("2"), and are missing for a match abandoned before kickoff
+        return int(pair[0]["score"]), int(pair[1]["score"])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,55 @@
+import os
+from datetime import datetime
+from leagues import LEAGUE_NAMES
+from sources import provider_ids
+
+NAME = "thesportsdb"
+
+SPORTSDB_BASE = os.getenv("SPORTSDB_BASE", "https://www.thesportsdb.com/api/v1/json/3")
+
+# competition key -> TheSportsDB league id, from the source catalogue
+LEAGUES = provider_ids(NAME)
+
+FINISHED = ("Match Finished", "FT", "AET", "PEN")
+
+async def fetch(client, league_key):
+    league_id = LEAGUES.get(league_key)
+    if not league_id:
+        return []
+    r = await client.get(f"{SPORTSDB_BASE}/eventsnextleague.php", params={"id": league_id})
+    r.raise_for_status()
+    fixtures = []
+    for event in r.json().get("events") or []:
+        kickoff = None
+        try:
+            if event.get("strTimestamp"):
+                kickoff = datetime.fromisoformat(event["strTimestamp"].replace("Z", "+00:00"))
+            elif event.get("dateEvent"):
+                # dateEvent and strTime are UTC
+                kickoff = datetime.fromisoformat(f"{event['dateEvent']}T{event.get('strTime') or '15:00:00'}")
+        except ValueError:
+            pass
+        fixtures.append({
+            "provider_id": f"tsdb_{event['idEvent']}",
+            "league": LEAGUE_NAMES[league_key],
+            "home": event.get("strHomeTeam", "Unknown"),
+            "away": event.get("strAwayTeam", "Unknown"),
+            "home_logo": event.get("strHomeTeamBadge", ""),
+            "away_logo": event.get("strAwayTeamBadge", ""),
+            "kickoff": kickoff,
+            "status": event.get("strStatus") or "Scheduled",
+            "venue": event.get("strVenue") or "TBD",
+            "referee": "TBD",
+            "provider": NAME,
+            "provider_payload": event,
+        })
+    return fixtures
+
+def result(payload):
+    home, away = payload.get("intHomeScore"), payload.get("intAwayScore")
+    if payload.get("strStatus") not in FINISHED or home in (None, "") or away in (None, ""):
+        return None
+    try:
+        return int(home), int(away)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,216 @@
+"""
+Elo rating fits per league, persisted as versioned artifacts.
+
+Fitting runs offline (see scripts/run_predictions.py); the API process only
+memory-maps the current artifact.
+"""
+import os, json, math, tempfile, logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import numpy as np
+from leagues import LEAGUES, LEAGUE_NAMES
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_DIR = os.getenv("MODEL_ARTIFACT_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "artifacts"))
+RATINGS_DIR = os.path.join(ARTIFACT_DIR, "ratings")
+DEFAULT_RATING = 1500.0
+DEFAULT_HOME_ADV = 50.0
+K_FACTOR = 20.0
+HOME_ADV_K = 1.0
+
+def expected_home(home_elo, away_elo, home_adv):
+    # same logistic as predictions.compute_simple_pick
+    return 1.0 / (1.0 + math.exp((away_elo - home_elo - home_adv) / 400))
+
+def fit_league(job):
+    """Run one chronological Elo pass over a league's results.
+
+    `job` is a plain dict so it can be shipped to a worker process:
+    teams, ratings (warm-start values aligned with teams), home_adv,
+    home_idx, away_idx, score (1/0.5/0 from the home side).
+    """
+    ratings = np.array(job["ratings"], dtype=np.float64)
+    home_adv = float(job["home_adv"])
+    k = job.get("k", K_FACTOR)
+    for h, a, s in zip(job["home_idx"], job["away_idx"], job["score"]):
+        delta = s - expected_home(ratings[h], ratings[a], home_adv)
+        ratings[h] += k * delta
+        ratings[a] -= k * delta
+        home_adv += HOME_ADV_K * delta
+    return {"league": job["league"], "teams": job["teams"], "ratings": ratings,
+            "home_adv": home_adv, "matches": len(job["score"])}
+
+def load_league_results(db, league_key, after_id=None):
+    """(results, last id): finished matches for a league in kickoff order as (home, away, hg, ag).
+
+    With `after_id`, only results recorded after that results row.
+    """
+    from models import Result
+    query = (db.query(Result.id, Result.home, Result.away, Result.home_goals, Result.away_goals)
+             .filter(Result.league == LEAGUE_NAMES[league_key]))
+    if after_id is not None:
+        query = query.filter(Result.id > after_id)
+    rows = query.order_by(Result.kickoff, Result.id).all()
+    return [tuple(r[1:]) for r in rows], max((r[0] for r in rows), default=after_id)
+
+def build_job(league_key, results, previous=None):
+    """A fit_league job; with `previous`, continuing that artifact's ratings for the league with `results`."""
+    teams = list(previous.teams(league_key)) if previous is not None else []
+    index = {team: i for i, team in enumerate(teams)}
+    home_idx, away_idx, score = [], [], []
+    for home, away, hg, ag in results:
+        for team in (home, away):
+            if team not in index:
+                index[team] = len(teams)
+                teams.append(team)
+        home_idx.append(index[home])
+        away_idx.append(index[away])
+        score.append(1.0 if hg > ag else 0.5 if hg == ag else 0.0)
+    # warm start from the previous artifact where we know the team
+    if previous is not None:
+        ratings = [previous.get_elo(league_key, t) for t in teams]
+        home_adv = previous.home_adv.get(league_key, DEFAULT_HOME_ADV)
+    else:
+        ratings = [DEFAULT_RATING] * len(teams)
+        home_adv = DEFAULT_HOME_ADV
+    return {"league": league_key, "teams": teams, "ratings": ratings, "home_adv": home_adv,
+            "home_idx": home_idx, "away_idx": away_idx, "score": score}
+
+def fit_all(jobs, workers=None):
+    """Run fit_league for every job, each league in its own process."""
+    with ProcessPoolExecutor(max_workers=workers or min(len(jobs), os.cpu_count() or 1) or 1) as pool:
+        fits = list(pool.map(fit_league, jobs))
+    for fit in fits:
+        logger.info(f"Fitted {fit['league']}: {len(fit['teams'])} teams from {fit['matches']} matches")
+    return fits
+
+def save_artifact(fits, version=None):
+    """Write fits as ratings/<version>/{ratings.npy,manifest.json} and mark it current."""
+    version = version or datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    os.makedirs(RATINGS_DIR, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=RATINGS_DIR, prefix=".tmp-")
+    manifest = {"version": version, "created_at": datetime.utcnow().isoformat(), "leagues": {}}
+    chunks = []
+    offset = 0
+    for fit in fits:
+        manifest["leagues"][fit["league"]] = {
+            "offset": offset,
+            "teams": fit["teams"],
+            "home_adv": fit["home_adv"],
+            "matches": fit["matches"],
+            "last_result_id": fit.get("last_result_id"),
+        }
+        chunks.append(np.asarray(fit["ratings"], dtype=np.float64))
+        offset += len(fit["teams"])
+    np.save(os.path.join(tmp, "ratings.npy"), np.concatenate(chunks) if chunks else np.zeros(0))
+    target = os.path.join(RATINGS_DIR, version)
+    suffix = 1
+    while os.path.exists(target):
+        target = os.path.join(RATINGS_DIR, f"{version}-{suffix}")
+        suffix += 1
+    version = os.path.basename(target)
+    manifest["version"] = version
+    with open(os.path.join(tmp, "manifest.json"), "w") as f:
+        json.dump(manifest, f)
+    os.rename(tmp, target)
+    current_tmp = os.path.join(RATINGS_DIR, ".CURRENT.tmp")
+    with open(current_tmp, "w") as f:
+        f.write(version)
+    os.replace(current_tmp, os.path.join(RATINGS_DIR, "CURRENT"))
+    return version
+
+def current_version():
+    try:
+        with open(os.path.join(RATINGS_DIR, "CURRENT")) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+class RatingTable:
+    """Read-only view over a ratings artifact; the array is memory-mapped."""
+
+    def __init__(self, version, manifest, ratings):
+        self.version = version
+        self.manifest = manifest
+        self.ratings = ratings
+        self.home_adv = {}
+        self.index = {}
+        for key, info in manifest["leagues"].items():
+            self.home_adv[key] = info["home_adv"]
+            for i, team in enumerate(info["teams"]):
+                self.index[(key, team)] = info["offset"] + i
+
+    def get_elo(self, league_key, team):
+        row = self.index.get((league_key, team))
+        return float(self.ratings[row]) if row is not None else DEFAULT_RATING
+
+    def leagues(self):
+        return list(self.home_adv)
+
+    def teams(self, league_key):
+        info = self.manifest["leagues"].get(league_key)
+        return info["teams"] if info else []
+
+    def matches(self, league_key):
+        info = self.manifest["leagues"].get(league_key)
+        return info["matches"] if info else 0
+
+    def last_result_id(self, league_key):
+        """The last results row this league's fit has replayed, or None if unknown."""
+        info = self.manifest["leagues"].get(league_key)
+        return info.get("last_result_id") if info else None
+
+def load_ratings(version=None):
+    """Memory-map a ratings artifact (the current one by default). Returns None if absent."""
+    version = version or current_version()
+    if not version:
+        return None
+    path = os.path.join(RATINGS_DIR, version)
+    try:
+        with open(os.path.join(path, "manifest.json")) as f:
+            manifest = json.load(f)
+        ratings = np.load(os.path.join(path, "ratings.npy"), mmap_mode="r")
+    except FileNotFoundError:
+        logger.warning(f"Ratings artifact {version} not found in {RATINGS_DIR}")
+        return None
+    return RatingTable(version, manifest, ratings)
+
+def run_fit_job(leagues=None, workers=None, warm_start=True):
+    """Fit per league in parallel from the results table and persist a new artifact.
+
+    A warm start continues the current artifact's ratings with only the
+    results recorded since it was fitted; replaying the full history on top
+    of ratings that already include it would count every match again. A
+    league the artifact has no record for, or warm_start=False, gets a cold
+    pass over its full history.
+    """
+    from db import SessionLocal
+    leagues = leagues or list(LEAGUES)
+    previous = load_ratings() if warm_start else None
+    jobs = []
+    last_ids = {}
+    db = SessionLocal()
+    try:
+        for key in leagues:
+            after = previous.last_result_id(key) if previous is not None else None
+            results, last_ids[key] = load_league_results(db, key, after)
+            jobs.append(build_job(key, results, previous if after is not None else None))
+    finally:
+        db.close()
+    fits = fit_all(jobs, workers=workers)
+    for fit in fits:
+        fit["last_result_id"] = last_ids[fit["league"]]
+        if previous is not None and previous.last_result_id(fit["league"]) is not None:
+            fit["matches"] += previous.matches(fit["league"])
+    # keep leagues we didn't refit this time
+    if previous is not None:
+        refit = {fit["league"] for fit in fits}
+        for key in previous.leagues():
+            if key not in refit:
+                teams = previous.teams(key)
+                fits.append({"league": key, "teams": teams,
+                             "ratings": [previous.get_elo(key, t) for t in teams],
+                             "home_adv": previous.home_adv[key], "matches": previous.matches(key),
+                             "last_result_id": previous.last_result_id(key)})
+    return save_artifact(fits)
@@ -0,0 +1,203 @@
+"""
+Prediction model registry.
+
+Models expose `predict_batch(fixtures)` over objects with `league`, `home`
+and `away` attributes and return one {"p_home", "p_draw", "p_away"} dict per
+fixture. Versions are ratings artifacts on disk (see ratings.py). Loading a
+version happens on a background thread and the active model is swapped in
+with a single reference assignment, so request handlers never wait on disk.
+A load that has been superseded by a later choice for the same slot is
+discarded when it finishes instead of being swapped in.
+
+A choice made through the API is stored in the shared cache and broadcast,
+so every worker follows it, and workers that start later load it instead
+of the current artifact.
+"""
+import os, time, logging, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from leagues import LEAGUE_KEYS
+from response_cache import response_cache
+from shared_cache import shared_cache
+from metrics import PREDICTION_BATCH
+from ratings import RATINGS_DIR, load_ratings, current_version, DEFAULT_HOME_ADV
+
+logger = logging.getLogger(__name__)
+
+SHADOW_HISTORY = 100
+MODEL_CHOICE_TTL = 365 * 86400  # the shared tier needs one; a choice stands until replaced
+
+class FlatModel:
+    """Every team at the default rating; used until an artifact is available."""
+    version = "flat"
+
+    def predict_batch(self, fixtures):
+        from predictions import compute_simple_pick
+        pick = compute_simple_pick()
+        return [dict(pick) for _ in fixtures]
+
+class EloModel:
+    def __init__(self, ratings):
+        self.ratings = ratings
+        self.version = ratings.version
+
+    def predict_batch(self, fixtures):
+        from predictions import compute_simple_pick
+        ratings = self.ratings
+        league_key = LEAGUE_KEYS.get
+        out = []
+        for f in fixtures:
+            key = league_key(f.league)
+            out.append(compute_simple_pick(ratings.get_elo(key, f.home), ratings.get_elo(key, f.away),
+                                           ratings.home_adv.get(key, DEFAULT_HOME_ADV)))
+        return out
+
+def load_model_version(version):
+    if version == FlatModel.version:
+        return FlatModel()
+    ratings = load_ratings(version)
+    if ratings is None:
+        raise ValueError(f"Unknown model version: {version}")
+    return EloModel(ratings)
+
+def _pick(p):
+    return max(("home", p["p_home"]), ("draw", p["p_draw"]), ("away", p["p_away"]), key=lambda x: x[1])[0]
+
+class ModelRegistry:
+    def __init__(self):
+        self.active = FlatModel()
+        self.shadow = None
+        self.loading = {}
+        self._requests = {}  # slot -> number of the latest load asked for it
+        self.shadow_results = deque(maxlen=SHADOW_HISTORY)
+        self._lock = threading.Lock()
+        self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+        self._shadow_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-shadow")
+
+    def available_versions(self):
+        versions = [FlatModel.version]
+        if os.path.isdir(RATINGS_DIR):
+            versions += sorted(v for v in os.listdir(RATINGS_DIR)
+                               if not v.startswith(".") and os.path.isdir(os.path.join(RATINGS_DIR, v)))
+        return versions
+
+    def load_current(self):
+        """Blocking load of the deployment's chosen model, else the current artifact; only for startup."""
+        version = shared_cache.get("model", "active") or current_version()
+        if version:
+            try:
+                self.active = load_model_version(version)
+            except ValueError as e:
+                logger.warning(f"Keeping flat model: {e}")
+        shadow = shared_cache.get("model", "shadow")
+        if shadow:
+            self.set_shadow(shadow, publish=False)
+        return self.active
+
+    def _load_in_background(self, version, slot):
+        def load():
+            try:
+                model = load_model_version(version)
+            except Exception as e:
+                logger.error(f"Failed to load model {version}: {e}")
+                model = None
+            with self._lock:
+                if self._requests.get(slot) != request:
+                    logger.info(f"Discarding {slot} model {version}: superseded while loading")
+                    return None
+                self.loading.pop(slot, None)
+                if model is None:
+                    return None
+                setattr(self, slot, model)
+            if slot == "active":
+                response_cache.invalidate()
+            logger.info(f"{slot.capitalize()} model is now {version}")
+            return model
+
+        with self._lock:
+            request = self._requests[slot] = self._requests.get(slot, 0) + 1
+            self.loading[slot] = version
+        return self._loader.submit(load)
+
+    def _publish(self, slot, version):
+        shared_cache.set("model", slot, version or "", MODEL_CHOICE_TTL)
+        shared_cache.broadcast("model")
+
+    def activate(self, version, publish=True):
+        """Load `version` off the request path and swap it in once ready; with `publish`, in every worker."""
+        future = self._load_in_background(version, "active")
+        if publish:
+            self._publish("active", version)
+        return future
+
+    def set_shadow(self, version, publish=True):
+        """Shadow-score `version` against the active model; None stops shadowing, including a load in flight."""
+        if version is None:
+            with self._lock:
+                self._requests["shadow"] = self._requests.get("shadow", 0) + 1
+                self.loading.pop("shadow", None)
+                self.shadow = None
+            future = None
+        else:
+            future = self._load_in_background(version, "shadow")
+        if publish:
+            self._publish("shadow", version)
+        return future
+
+    def follow(self):
+        """Load whatever another worker chose that this one isn't already serving or loading."""
+        for slot, apply in (("active", self.activate), ("shadow", self.set_shadow)):
+            version = shared_cache.get("model", slot)
+            if version is None:
+                continue
+            version = version or None
+            model = getattr(self, slot)
+            with self._lock:
+                pending = slot in self.loading
+                wanted = self.loading.get(slot) if pending else (model.version if model is not None else None)
+            if version != wanted:
+                apply(version, publish=False)
+
+    def predict_batch(self, fixtures):
+        PREDICTION_BATCH.observe(len(fixtures))
+        model = self.active
+        predictions = model.predict_batch(fixtures)
+        shadow = self.shadow
+        if shadow is not None and fixtures:
+            self._shadow_pool.submit(self._score_shadow, shadow, model.version, list(fixtures), predictions)
+        return predictions
+
+    def _score_shadow(self, shadow, active_version, fixtures, active_predictions):
+        try:
+            start = time.perf_counter()
+            shadow_predictions = shadow.predict_batch(fixtures)
+            elapsed = time.perf_counter() - start
+        except Exception as e:
+            logger.error(f"Shadow model {shadow.version} failed: {e}")
+            return
+        n = len(fixtures)
+        agree = sum(_pick(a) == _pick(s) for a, s in zip(active_predictions, shadow_predictions))
+        diff = sum(abs(a[k] - s[k]) for a, s in zip(active_predictions, shadow_predictions)
+                   for k in ("p_home", "p_draw", "p_away"))
+        self.shadow_results.append({
+            "active": active_version,
+            "shadow": shadow.version,
+            "fixtures": n,
+            "pick_agreement": agree / n,
+            "mean_abs_diff": diff / (3 * n),
+            "shadow_seconds": round(elapsed, 6),
+            "at": time.time(),
+        })
+
+    def status(self):
+        shadow = self.shadow
+        return {
+            "active": self.active.version,
+            "shadow": shadow.version if shadow is not None else None,
+            "loading": dict(self.loading),
+            "available": self.available_versions(),
+            "shadow_results": list(self.shadow_results),
+        }
+
+registry = ModelRegistry()
+shared_cache.on_invalidate("model", registry.follow)
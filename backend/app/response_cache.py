@@ -0,0 +1,86 @@
+"""
+Cache of already-encoded JSON bodies for the hot read endpoints.
+
+Entries are keyed by endpoint and parameters and dropped whenever ingest in
+any worker stores new fixtures or the active model changes, so a hit is
+served as the stored bytes with no query and no encoding. Each entry also keeps its
+compressed variants, built the first time a client asks for that encoding.
+"""
+import os, time, threading
+from collections import OrderedDict
+from fastapi import Response
+from responses import dumps
+from compression import COMPRESS_MIN_SIZE, negotiate, compress
+from shared_cache import shared_cache
+
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "60"))
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "512"))
+
+class EncodedCache:
+    def __init__(self, ttl=RESPONSE_CACHE_TTL, size=RESPONSE_CACHE_SIZE):
+        self.ttl = ttl
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, body):
+        """Store `body`; returns the variants dict (encoding -> bytes, None for identity)."""
+        variants = {None: body}
+        with self._lock:
+            self.entries[key] = (time.monotonic() + self.ttl, variants)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+        return variants
+
+    def invalidate(self):
+        with self._lock:
+            self.entries.clear()
+
+    def stats(self):
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+response_cache = EncodedCache()
+# ingest in any worker makes every worker's encoded bodies stale
+shared_cache.on_invalidate("responses", response_cache.invalidate)
+
+def json_body(content, encoding=None, vary=False):
+    headers = {}
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    if vary or encoding is not None:
+        headers["Vary"] = "Accept-Encoding"
+    return Response(content=content, media_type="application/json", headers=headers)
+
+async def cached_json(request, key, build):
+    """Serve the cached body for `key`, or await `build()` and cache its encoding.
+
+    The body is compressed at most once per encoding for the entry's lifetime.
+    """
+    variants = response_cache.get(key)
+    if variants is None:
+        variants = response_cache.put(key, dumps(await build()))
+    body = variants[None]
+    if len(body) < COMPRESS_MIN_SIZE:
+        return json_body(body)
+    # a body this size is sent compressed to clients that accept it, so even the identity one varies
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if encoding is None:
+        return json_body(body, vary=True)
+    compressed = variants.get(encoding)
+    if compressed is None:
+        # racing requests may both compress; the result is identical either way
+        compressed = variants[encoding] = compress(body, encoding)
+    return json_body(compressed, encoding)
@@ -0,0 +1,39 @@
+import asyncio, functools
+import orjson
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+
+# datetimes are written as UTC RFC 3339 without microseconds, e.g. 2025-01-01T15:00:00Z
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_OMIT_MICROSECONDS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def dumps(content):
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+class ORJSONResponse(JSONResponse):
+    """orjson encodes datetimes and numpy values natively."""
+
+    def render(self, content):
+        return dumps(content)
+
+def _direct(endpoint, status_code):
+    # FastAPI passes a returned value through jsonable_encoder before any
+    # response class sees it, which writes naive datetimes without the Z and
+    # fails on numpy scalars; a returned Response is sent as it is.
+    def wrap(content):
+        return content if isinstance(content, Response) else ORJSONResponse(content, status_code=status_code or 200)
+
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def run(*args, **kwargs):
+            return wrap(await endpoint(*args, **kwargs))
+    else:
+        @functools.wraps(endpoint)
+        def run(*args, **kwargs):
+            return wrap(endpoint(*args, **kwargs))
+    return run
+
+class ORJSONRoute(APIRoute):
+    """Route whose return values are encoded by orjson directly, with ORJSON_OPTIONS."""
+
+    def __init__(self, path, endpoint, **kwargs):
+        super().__init__(path, _direct(endpoint, kwargs.get("status_code")), **kwargs)
@@ -0,0 +1,15 @@
+import os
+
+# Routers by name; only the enabled ones are imported, so their dependencies
+# are never loaded in a deployment that doesn't serve them.
+ROUTERS = {
+    "fixtures": "routers.fixtures",
+    "predictions": "routers.predictions",
+    "news": "routers.news",
+    "stats": "routers.stats",
+    "search": "routers.search",
+    "images": "routers.images",
+    "metrics": "routers.metrics",
+    "profiling": "routers.profiling",
+}
+ENABLED_ROUTERS = [r.strip() for r in os.getenv("ENABLED_ROUTERS", ",".join(ROUTERS)).split(",") if r.strip()]
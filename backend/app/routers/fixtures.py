@@ -0,0 +1,147 @@
+import time, asyncio, logging
+from datetime import date
+from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from db import get_async_db
+from models import Match
+from leagues import LEAGUES, LEAGUE_NAMES, LEAGUE_COUNTRIES
+from fetcher import fetch_fixtures
+from response_cache import cached_json
+from images import proxy_url
+from metrics import observe_job_lag, job_succeeded
+from leader import acquire
+from kickoffs import day_index, zone, local_today
+from fixture_query import FixtureQuery, fetch
+from responses import ORJSONRoute
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=ORJSONRoute)
+
+def fixture_dict(m):
+    return {
+        "fixture_id": m.provider_id,
+        "league_name": m.league,
+        "home_team": m.home,
+        "away_team": m.away,
+        "home_logo": proxy_url(m.home_logo, 128),
+        "away_logo": proxy_url(m.away_logo, 128),
+        "match_date": m.kickoff,  # encoded as ...T15:00:00Z by responses.dumps
+        "status": m.status,
+        "venue": m.venue,
+        "referee": m.referee,
+        "provider": m.provider
+    }
+
+@router.get("/api/today")
+async def api_today(request: Request, tz: str = "UTC", day: date = None, db: AsyncSession = Depends(get_async_db)):
+    """Fixtures kicking off on `day` (default today) in the IANA timezone `tz`"""
+    try:
+        day = day or local_today(zone(tz))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def build():
+        if day_index.stale:
+            await asyncio.to_thread(day_index.refresh)
+        ids = day_index.days(day, 1, tz)
+        rows = (await db.execute(select(Match).where(Match.id.in_(ids)).order_by(Match.kickoff_ts))).scalars().all() if ids else []
+        out = []
+        for m in rows:
+            out.append({
+                "id": m.id,
+                "match_id": m.provider_id,
+                "league": m.league,
+                "home": m.home,
+                "away": m.away,
+                "kickoff": m.kickoff  # encoded as ...T15:00:00Z by responses.dumps
+            })
+        return out
+    return await cached_json(request, ("today", tz, day), build)
+
+async def fetch_job(queued_at):
+    # replicas behind one cron URL may all be asked; only one fetches
+    lock = await asyncio.to_thread(acquire, "fetch_fixtures")
+    if lock is None:
+        logger.info("Skipping fetch: already running in another worker or replica")
+        return
+    try:
+        observe_job_lag("fetch_fixtures", time.time() - queued_at)
+        await fetch_fixtures()
+        job_succeeded("fetch_fixtures")
+    finally:
+        await asyncio.to_thread(lock.release)
+
+@router.post("/api/fetchMatches")
+async def api_fetch_matches(background: BackgroundTasks):
+    # schedule fetch in background to return quickly
+    background.add_task(fetch_job, time.time())
+    return {"ok": True}
+
+@router.post("/api/v1/fetch-fixtures")
+async def api_fetch_league(league: str = "premier_league"):
+    """Fetch fixtures for one league from every enabled provider"""
+    if league not in LEAGUES:
+        raise HTTPException(status_code=404, detail=f"Unknown league: {league}")
+    lock = await asyncio.to_thread(acquire, "fetch_fixtures")
+    if lock is None:
+        raise HTTPException(status_code=409, detail="A fetch is already running")
+    try:
+        summary = await fetch_fixtures([league])
+    finally:
+        await asyncio.to_thread(lock.release)
+    return {
+        "message": f"Successfully fetched {summary['added']} new fixtures",
+        "total_fixtures": summary["added"],
+        "league": league,
+        "errors": summary["errors"],
+        "stale": summary["stale"]
+    }
+
+@router.get("/api/v1/enhanced-fixtures")
+async def get_enhanced_fixtures(request: Request, league: str = None, days_ahead: int = None, date_from: date = None,
+                                date_to: date = None, status: str = None, order: str = "kickoff", limit: int = 20,
+                                tz: str = "UTC", db: AsyncSession = Depends(get_async_db)):
+    """Get enhanced fixtures with team logos, optionally in a window of calendar days in `tz`"""
+    try:
+        query = FixtureQuery.from_params(tz, days_ahead, date_from, date_to, league, status, order, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def build():
+        rows = await fetch(db, query)
+        fixtures = [fixture_dict(m) for m in rows]
+        return {
+            "fixtures": fixtures,
+            "total": len(fixtures),
+            "league_filter": league,
+            "available_leagues": list(LEAGUES.keys())
+        }
+    return await cached_json(request, ("enhanced-fixtures",) + query.key(), build)
+
+@router.get("/api/v1/matches")
+async def get_matches(request: Request, league: str = None, days_ahead: int = None, date_from: date = None,
+                      date_to: date = None, status: str = None, order: str = "kickoff", limit: int = 50,
+                      tz: str = "UTC", db: AsyncSession = Depends(get_async_db)):
+    """Matches in the older plain shape; takes the same parameters as /api/v1/enhanced-fixtures"""
+    try:
+        query = FixtureQuery.from_params(tz, days_ahead, date_from, date_to, league, status, order, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def build():
+        matches = [{"id": m.id, "provider_id": m.provider_id, "league": m.league, "home": m.home, "away": m.away,
+                    "kickoff": m.kickoff, "status": m.status} for m in await fetch(db, query)]
+        return {"matches": matches, "total": len(matches)}
+    return await cached_json(request, ("matches",) + query.key(), build)
+
+@router.get("/api/v1/leagues")
+async def get_available_leagues():
+    """Get list of available leagues"""
+    return {
+        "leagues": [
+            {"key": key, "name": LEAGUE_NAMES[key], "id": league_id, "country": LEAGUE_COUNTRIES.get(key)}
+            for key, league_id in LEAGUES.items()
+        ]
+    }
@@ -0,0 +1,38 @@
+import os, re, logging
+import httpx
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+from images import image_cache, allowed, snap_width, thumbnail_path, DEFAULT_WIDTH
+from responses import ORJSONRoute
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=ORJSONRoute)
+
+NAME_RE = re.compile(r"^[0-9a-f]{64}-\d+\.webp$")
+# a source URL may start serving a new image; a content-addressed name never changes
+PROXY_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=604800"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def webp(name, cache_control):
+    return FileResponse(thumbnail_path(name), media_type="image/webp",
+                        headers={"Cache-Control": cache_control, "ETag": f'"{name}"'})
+
+@router.get("/api/v1/images/proxy")
+async def proxy_image(url: str, w: int = DEFAULT_WIDTH):
+    """WebP thumbnail of a logo or article image, fetched from its host once"""
+    if not allowed(url):
+        raise HTTPException(status_code=400, detail="Image host not allowed")
+    try:
+        name = await image_cache.thumbnail(url, snap_width(w))
+    except (httpx.HTTPError, ValueError, OSError) as e:
+        logger.warning(f"Image proxy failed for {url}: {e}")
+        raise HTTPException(status_code=502, detail="Image unavailable")
+    return webp(name, PROXY_CACHE_CONTROL)
+
+@router.get("/api/v1/images/{name}")
+async def cached_image(name: str):
+    """A cached thumbnail by its content-addressed name"""
+    if not NAME_RE.match(name) or not os.path.exists(thumbnail_path(name)):
+        raise HTTPException(status_code=404, detail="Image not found")
+    return webp(name, IMMUTABLE_CACHE_CONTROL)
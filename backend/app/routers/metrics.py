@@ -0,0 +1,63 @@
+import sys
+from fastapi import APIRouter, Response
+from prometheus_client import REGISTRY, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from db import pool_stats
+from response_cache import response_cache
+from registry import registry
+from responses import ORJSONRoute
+
+router = APIRouter(route_class=ORJSONRoute)
+
+class StateCollector:
+    """Reads counters the app already keeps, at scrape time only."""
+
+    def collect(self):
+        stats = response_cache.stats()
+        lookups = CounterMetricFamily("scoresure_response_cache_lookups", "Encoded response cache lookups", labels=["result"])
+        lookups.add_metric(["hit"], stats["hits"])
+        lookups.add_metric(["miss"], stats["misses"])
+        yield lookups
+        yield GaugeMetricFamily("scoresure_response_cache_entries", "Encoded responses cached", value=stats["entries"])
+
+        pools = pool_stats()
+        checked_out = GaugeMetricFamily("scoresure_db_pool_checked_out", "Connections checked out", labels=["engine"])
+        checkouts = CounterMetricFamily("scoresure_db_pool_checkouts", "Connection checkouts", labels=["engine"])
+        timeouts = CounterMetricFamily("scoresure_db_pool_timeouts", "Connection checkout timeouts", labels=["engine"])
+        for name in ("sync", "async"):
+            pool = pools[name]
+            checked_out.add_metric([name], pool.get("checked_out", 0))
+            checkouts.add_metric([name], pool["checkouts"])
+            timeouts.add_metric([name], pool["timeouts"])
+        yield checked_out
+        yield checkouts
+        yield timeouts
+
+        models = GaugeMetricFamily("scoresure_model_active", "Active prediction model version", labels=["version"])
+        models.add_metric([registry.active.version], 1)
+        yield models
+
+        # only report indexes that this deployment actually loaded
+        news = sys.modules.get("news_index")
+        if news is not None:
+            stats = news.news_index.stats()
+            yield GaugeMetricFamily("scoresure_news_index_articles", "Articles in the news index", value=stats["articles"])
+            yield CounterMetricFamily("scoresure_news_duplicates_dropped", "Duplicate stories dropped", value=stats["duplicates_dropped"])
+        upstream = sys.modules.get("upstream")
+        if upstream is not None:
+            states = GaugeMetricFamily("scoresure_upstream_circuit_open", "1 while a provider's circuit breaker is open", labels=["source"])
+            stale = CounterMetricFamily("scoresure_upstream_stale_served", "Calls answered from the last good result", labels=["source"])
+            for name, b in upstream.breakers.items():
+                states.add_metric([name], int(b.state == upstream.OPEN))
+                stale.add_metric([name], b.stale_served)
+            yield states
+            yield stale
+        search = sys.modules.get("search")
+        if search is not None:
+            yield GaugeMetricFamily("scoresure_search_documents", "Documents in the search index", value=search.search_index.stats()["documents"])
+
+REGISTRY.register(StateCollector())
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,246 @@
+import os, logging, threading
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from db import get_async_db
+from models import Match
+from leagues import LEAGUES
+from articles import from_newsapi, from_rss, from_record
+from news_index import news_index, decode_cursor
+from tagger import team_tagger
+from metrics import track_upstream, UPSTREAM_ERRORS
+from shared_cache import shared_cache
+from responses import ORJSONRoute
+from response_cache import cached_json
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=ORJSONRoute)
+
+NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")  # NewsAPI is skipped without one
+NEWS_BASE_URL = os.getenv("NEWS_BASE_URL", "https://newsapi.org/v2/everything")
+
+NEWS_QUERY = "(football OR soccer OR \"Premier League\" OR \"Champions League\" OR \"La Liga\" OR \"Serie A\" OR \"Bundesliga\") AND -\"American football\""
+# how often the scheduler (jobs.py) polls the sources into the merged index
+NEWS_REFRESH_SECONDS = float(os.getenv("NEWS_REFRESH_SECONDS", "300"))
+
+DEFAULT_RSS_FEEDS = [
+    "http://feeds.skysports.com/feeds/11095",  # Sky Sports Football
+    "http://feeds.bbci.co.uk/sport/football/rss.xml",  # BBC Sport Football
+    "https://www.espn.com/espn/rss/soccer/news",  # ESPN Soccer
+]
+RSS_FEEDS = [u.strip() for u in os.getenv("RSS_FEEDS", ",".join(DEFAULT_RSS_FEEDS)).split(",") if u.strip()]
+
+# Fallback images for RSS entries without one: by league of a tagged team, then by keyword
+LEAGUE_IMAGES = {
+    "premier_league": "https://images.unsplash.com/photo-1574629810360-7efbbe195018?w=800&h=400&fit=crop",  # Premier League stadium
+}
+FALLBACK_IMAGES = [
+    (['champions league', 'uefa', 'european'], "https://images.unsplash.com/photo-1577223625816-7546f13df25d?w=800&h=400&fit=crop"),  # Champions League ball
+    (['transfer', 'signing', 'deal'], "https://images.unsplash.com/photo-1551698618-1dfe5d97d256?w=800&h=400&fit=crop"),  # Football training
+]
+DEFAULT_IMAGE = "https://images.unsplash.com/photo-1431324155629-1a6deb1dec8d?w=800&h=400&fit=crop"  # Generic football
+
+_feedparser = None
+
+def parse_feed(url):
+    """feedparser is only imported the first time a feed is read."""
+    global _feedparser
+    if _feedparser is None:
+        import feedparser
+        _feedparser = feedparser
+    with track_upstream("rss"):
+        return _feedparser.parse(url)
+
+def entry_image(entry):
+    """Best image for an RSS entry: media thumbnail, image enclosure, image link, then a fallback."""
+    thumbnails = entry.get('media_thumbnail') or []
+    if thumbnails and thumbnails[0].get('url'):
+        return thumbnails[0]['url']
+    for enclosure in entry.get('enclosures') or []:
+        if 'image' in (enclosure.get('type') or ''):
+            return enclosure.get('href')
+    for link in entry.get('links') or []:
+        if 'image' in (link.get('type') or ''):
+            return link.get('href')
+    title = entry.get('title', '')
+    _, leagues = team_tagger.tag(title)
+    for league, image in LEAGUE_IMAGES.items():
+        if league in leagues:
+            return image
+    title_lower = title.lower()
+    for words, image in FALLBACK_IMAGES:
+        if any(word in title_lower for word in words):
+            return image
+    return DEFAULT_IMAGE
+
+def fetch_rss(feeds, per_feed):
+    """Normalized articles from each feed's first `per_feed` entries."""
+    articles = []
+    for source_url in feeds:
+        try:
+            feed = parse_feed(source_url)
+        except Exception as e:
+            logger.error(f"Error fetching from {source_url}: {e}")
+            continue
+        source = feed.feed.get('title', 'RSS Source')
+        for entry in feed.entries[:per_feed]:
+            article = from_rss(entry, source, entry_image)
+            if article is not None:
+                articles.append(article)
+    return articles
+
+def images_first(articles):
+    """Stable O(n) partition: articles with an image, then the rest."""
+    with_images = []
+    without_images = []
+    for article in articles:
+        (with_images if article.image else without_images).append(article)
+    return with_images + without_images
+
+def fetch_newsapi(params):
+    with track_upstream("newsapi"):
+        response = httpx.get(NEWS_BASE_URL, params=params, timeout=10)
+    if response.status_code != 200:
+        UPSTREAM_ERRORS.labels("newsapi").inc()
+        logger.warning(f"NewsAPI returned status {response.status_code}")
+        return None
+    return [a for a in map(from_newsapi, response.json().get('articles', [])) if a is not None]
+
+_refresh_lock = threading.Lock()
+
+def load_shared_news():
+    """Add the articles another worker polled, if any, to this worker's index."""
+    records = shared_cache.get("news", "articles")
+    return news_index.extend(map(from_record, records)) if records else 0
+
+# the polling worker broadcasts "news" once its articles are in the shared cache
+shared_cache.on_invalidate("news", load_shared_news)
+
+def refresh_news(force=False):
+    """Poll RSS and NewsAPI into the merged index. Blocking; the scheduler runs it off the request path.
+
+    With a shared cache only one worker polls per interval; the others take its
+    articles from the cache. `force` polls in this worker regardless.
+    """
+    # one poller at a time
+    if not _refresh_lock.acquire(blocking=False):
+        return 0
+    try:
+        if not force and not shared_cache.acquire("news_refresh", NEWS_REFRESH_SECONDS):
+            added = load_shared_news()
+            logger.info(f"News index refreshed from the shared cache: {added} new, {len(news_index)} total")
+            return added
+        fetched = fetch_rss(RSS_FEEDS, per_feed=20)
+        if NEWS_API_KEY:
+            try:
+                fetched += fetch_newsapi({
+                    "q": NEWS_QUERY, "language": "en", "sortBy": "publishedAt",
+                    "pageSize": 50, "apiKey": NEWS_API_KEY,
+                }) or []
+            except Exception as e:
+                logger.error(f"NewsAPI error: {e}")
+        added = news_index.extend(fetched)
+        shared_cache.set("news", "articles", [a.to_record() for a in fetched], NEWS_REFRESH_SECONDS * 2)
+        shared_cache.broadcast("news")
+        logger.info(f"News index refreshed: {added} new, {len(news_index)} total")
+        return added
+    finally:
+        _refresh_lock.release()
+
+@router.get("/api/v1/news/health")
+async def news_health():
+    """News API health check"""
+    return {
+        "status": "ok",
+        "service": "news",
+        "endpoints": ["sports-news", "football-news", "latest", "news"],
+        "newsapi_configured": bool(NEWS_API_KEY),
+        "rss_feeds_count": len(RSS_FEEDS),
+        "index": news_index.stats()
+    }
+
+# the news lists are encoded (and compressed) once per state of the index: the
+# head cursor moves with every article added, and ingest drops every entry
+# since it can change what a team name tags
+
+@router.get("/api/v1/news/sports-news")
+async def get_sports_news(request: Request):
+    """Get sports news from every source, deduplicated and newest first"""
+    async def build():
+        return {
+            "status": "ok",
+            "totalResults": len(news_index),
+            "articles": [a.to_dict() for a in news_index.latest(50)]
+        }
+    return await cached_json(request, ("sports-news", news_index.head_cursor()), build)
+
+@router.get("/api/v1/news/latest")
+async def get_latest_news(request: Request, limit: int = 20, since: str = None):
+    """Newest articles, or with `since` the articles indexed after that cursor, in the order they were indexed."""
+    limit = max(1, min(limit, 200))
+    if since is not None:
+        try:
+            decode_cursor(since)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {since}")
+
+    async def build():
+        if since is None:
+            articles, cursor = news_index.latest(limit), news_index.head_cursor()
+        else:
+            articles, cursor = news_index.since(since, limit)
+        return {
+            "status": "ok",
+            "articles": [a.to_dict() for a in articles],
+            "cursor": cursor
+        }
+    return await cached_json(request, ("news-latest", limit, since, news_index.head_cursor()), build)
+
+@router.get("/api/v1/news")
+async def get_team_news(request: Request, team: str = None, league: str = None, limit: int = 20):
+    """Indexed articles tagged with a team (fixture name) or league key, newest first"""
+    if team is None and league is None:
+        raise HTTPException(status_code=400, detail="Pass team or league")
+    if league is not None and league not in LEAGUES:
+        raise HTTPException(status_code=404, detail=f"Unknown league: {league}")
+    limit = max(1, min(limit, 100))
+
+    async def build():
+        # accept any alias ("man utd", "spurs") as well as the fixture name
+        teams = (team_tagger.tag(team)[0] or {team}) if team else ()
+        ids = team_tagger.articles_for(teams, league)
+        return {
+            "status": "ok",
+            "team": team,
+            "league": league,
+            "articles": [a.to_dict() for a in news_index.newest_of(ids, limit)]
+        }
+    return await cached_json(request, ("news", team, league, limit, news_index.head_cursor()), build)
+
+@router.get("/api/v1/fixtures/{match_id}/news")
+async def get_fixture_news(match_id: int, limit: int = 10, db: AsyncSession = Depends(get_async_db)):
+    """Articles mentioning either team of a fixture, newest first"""
+    m = await db.get(Match, match_id)
+    if not m:
+        raise HTTPException(status_code=404, detail="Match not found")
+    ids = team_tagger.articles_for([m.home, m.away])
+    articles = news_index.newest_of(ids, max(1, min(limit, 100)))
+    return {
+        "match_id": m.id,
+        "home": m.home,
+        "away": m.away,
+        "articles": [a.to_dict() for a in articles]
+    }
+
+@router.get("/api/v1/football-news")
+async def get_football_news(request: Request):
+    """Newest indexed articles, those with an image first"""
+    async def build():
+        articles = images_first(news_index.latest(50))[:15]
+        return {
+            "status": "ok",
+            "totalResults": len(articles),
+            "articles": [a.to_dict() for a in articles]
+        }
+    return await cached_json(request, ("football-news", news_index.head_cursor()), build)
@@ -0,0 +1,107 @@
+import os, hmac, math
+from datetime import date
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from db import get_async_db
+from models import Match
+from registry import registry
+from history import history
+from features import features, FEATURE_COLUMNS
+from predictions import predict_fixtures
+from routers.fixtures import fixture_dict
+from response_cache import cached_json
+from fixture_query import FixtureQuery, fetch
+from responses import ORJSONRoute
+
+router = APIRouter(route_class=ORJSONRoute)
+
+MODEL_ADMIN_TOKEN = os.getenv("MODEL_ADMIN_TOKEN", "")
+
+def require_model_admin(x_model_admin_token: str = Header(None)):
+    # without a configured token the model controls don't exist
+    if not MODEL_ADMIN_TOKEN or x_model_admin_token is None or not hmac.compare_digest(
+            x_model_admin_token.encode(), MODEL_ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+@router.get("/api/v1/enhanced-predictions")
+@router.get("/api/v1/predictions")  # the older name, kept for existing clients
+async def get_enhanced_predictions(request: Request, league: str = None, days_ahead: int = None, date_from: date = None,
+                                   date_to: date = None, status: str = None, order: str = "kickoff", limit: int = 20,
+                                   tz: str = "UTC", db: AsyncSession = Depends(get_async_db)):
+    """Predictions from the active model for fixtures in a window, by default every upcoming one.
+
+    days_ahead (0 today, 1 tomorrow, N the next N days) or date_from/date_to
+    are calendar days in the IANA timezone `tz`; league and status take
+    comma-separated lists.
+    """
+    try:
+        query = FixtureQuery.from_params(tz, days_ahead, date_from, date_to, league, status, order, limit, upcoming=True)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def build():
+        matches = await fetch(db, query)
+        predictions = []
+        for match, p in zip(matches, predict_fixtures(matches)):
+            prediction = fixture_dict(match)
+            prediction.update({
+                "predicted_home_score": round(p["predicted_home_score"], 1),
+                "predicted_away_score": round(p["predicted_away_score"], 1),
+                "home_win_prob": round(p["home_win_prob"], 3),
+                "draw_prob": round(p["draw_prob"], 3),
+                "away_win_prob": round(p["away_win_prob"], 3),
+                "confidence": round(p["confidence"], 3),
+            })
+            predictions.append(prediction)
+
+        return {
+            "predictions": predictions,
+            "total": len(predictions),
+            "league_filter": league,
+            "model_version": registry.active.version
+        }
+
+    return await cached_json(request, ("enhanced-predictions",) + query.key(), build)
+
+@router.get("/api/predictions/{match_id}")
+@router.get("/api/v1/predictions/{match_id}")
+async def api_prediction_detail(match_id: int, form: int = 5, db: AsyncSession = Depends(get_async_db)):
+    m = await db.get(Match, match_id)
+    if not m:
+        raise HTTPException(status_code=404, detail="Match not found")
+    pick = registry.predict_batch([m])[0]
+    row = features.feature_matrix([m])[0]
+    return {
+        "id": m.id,
+        "match_id": m.provider_id,
+        "league": m.league,
+        "home": m.home,
+        "away": m.away,
+        "kickoff": m.kickoff,
+        "prediction": pick,
+        "h2h": history.head_to_head(m.home, m.away),
+        "form": {
+            "home": history.recent_form(m.home, form),
+            "away": history.recent_form(m.away, form),
+        },
+        "features": {c: (None if math.isnan(v) else round(float(v), 3)) for c, v in zip(FEATURE_COLUMNS, row)},
+    }
+
+@router.get("/api/model")
+async def api_model_status():
+    return registry.status()
+
+@router.post("/api/model/activate", include_in_schema=False, dependencies=[Depends(require_model_admin)])
+def api_model_activate(version: str):
+    if version not in registry.available_versions():
+        raise HTTPException(status_code=404, detail=f"Unknown model version: {version}")
+    # loads in the background in every worker; the current model keeps serving until the swap
+    registry.activate(version)
+    return {"ok": True, "loading": version, "active": registry.active.version}
+
+@router.post("/api/model/shadow", include_in_schema=False, dependencies=[Depends(require_model_admin)])
+def api_model_shadow(version: str = None):
+    if version is not None and version not in registry.available_versions():
+        raise HTTPException(status_code=404, detail=f"Unknown model version: {version}")
+    registry.set_shadow(version)
+    return {"ok": True, "shadow": version}
@@ -0,0 +1,30 @@
+import os
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import FileResponse
+from profiling import profile_ring, token_matches, PROFILE_NAME_RE
+from responses import ORJSONRoute
+
+router = APIRouter(route_class=ORJSONRoute)
+
+MEDIA_TYPES = {"json": "application/json", "html": "text/html", "prof": "application/octet-stream"}
+
+def require_token(token):
+    # without a configured token the debug endpoints don't exist
+    if not token_matches(token):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+@router.get("/debug/profiles", include_in_schema=False)
+def list_profiles(x_profile_token: str = Header(None)):
+    """Captured request profiles, newest first"""
+    require_token(x_profile_token)
+    return {"profiles": profile_ring.list()}
+
+@router.get("/debug/profiles/{name}", include_in_schema=False)
+def download_profile(name: str, x_profile_token: str = Header(None)):
+    """A capture's JSON summary (with SQL) or its trace file"""
+    require_token(x_profile_token)
+    path = profile_ring.path(name)
+    if not PROFILE_NAME_RE.match(name) or not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    ext = name.rsplit(".", 1)[1]
+    return FileResponse(path, media_type=MEDIA_TYPES[ext], filename=name if ext == "prof" else None)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, HTTPException
+from search import search_index
+from responses import ORJSONRoute
+
+router = APIRouter(route_class=ORJSONRoute)
+
+KINDS = ("article", "fixture")
+
+@router.get("/api/v1/search")
+def search(q: str, type: str = None, limit: int = 20):
+    """Ranked full-text search over indexed news articles and fixtures"""
+    if type is not None and type not in KINDS:
+        raise HTTPException(status_code=400, detail=f"Unknown type: {type}")
+    limit = max(1, min(limit, 100))
+    results = []
+    for score, kind, payload in search_index.search(q, kind=type, limit=limit):
+        item = payload.to_dict() if kind == "article" else dict(payload)
+        item["type"] = kind
+        item["score"] = round(score, 4)
+        results.append(item)
+    return {"query": q, "total": len(results), "results": results}
+
+@router.get("/api/v1/search/stats")
+def search_stats():
+    return search_index.stats()
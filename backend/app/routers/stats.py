@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from db import get_async_db, pool_stats
+from models import Match, Result
+from upstream import breakers
+from response_cache import response_cache
+from shared_cache import shared_cache
+import jobs
+from responses import ORJSONRoute
+
+router = APIRouter(route_class=ORJSONRoute)
+
+@router.get("/api/v1/database-stats")
+async def get_database_stats(db: AsyncSession = Depends(get_async_db)):
+    """Get database statistics"""
+    total_matches = await db.scalar(select(func.count()).select_from(Match))
+    total_results = await db.scalar(select(func.count()).select_from(Result))
+    leagues_count = await db.scalar(select(func.count(func.distinct(Match.league))))
+    providers = (await db.execute(select(Match.provider).distinct())).scalars().all()
+    return {
+        "total_matches": total_matches,
+        "total_results": total_results,
+        "leagues_count": leagues_count,
+        "providers": [p for p in providers if p]
+    }
+
+@router.get("/health")
+async def health_check():
+    return {"status": "healthy"}
+
+@router.get("/api/v1/pool-stats")
+async def get_pool_stats():
+    """Connection pool occupancy and checkout wait times for this worker"""
+    return pool_stats()
+
+@router.get("/api/v1/upstream-stats")
+async def get_upstream_stats():
+    """Circuit breaker state and recent p95 latency per fixture provider for this worker"""
+    return {name: b.stats() for name, b in breakers.items()}
+
+@router.get("/api/v1/cache-stats")
+async def get_cache_stats():
+    """Encoded response cache and shared cache state for this worker"""
+    return {"responses": response_cache.stats(), "shared": shared_cache.stats()}
+
+@router.get("/api/v1/ingestion-status")
+async def get_ingestion_status():
+    """Whether this replica leads ingestion, and the scheduled jobs"""
+    return {
+        "election": jobs.election.stats(),
+        "jobs": [{"name": name, "interval_seconds": interval, "offset_seconds": round(offset, 3)}
+                 for name, interval, offset, _ in jobs.schedule()],
+    }
@@ -0,0 +1,122 @@
+"""
+In-process full-text search over news articles and fixtures.
+
+An inverted index (term -> {doc: term frequency}) ranked with BM25. Articles
+are added as the news index accepts them and dropped when it evicts them;
+fixtures are added on ingest and rebuilt from the matches table at startup.
+Queries never leave the process.
+"""
+import re, math, heapq, logging, threading
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 2  # title terms count twice against description terms
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower()) if text else []
+
+def fixture_doc(m):
+    return {
+        "id": m.id,
+        "league": m.league,
+        "home": m.home,
+        "away": m.away,
+        "venue": m.venue,
+        "kickoff": m.kickoff,
+        "status": m.status,
+    }
+
+class SearchIndex:
+    def __init__(self):
+        self.postings = {}   # term -> {doc key: tf}
+        self.docs = {}       # doc key -> (kind, payload, terms Counter, length)
+        self.total_length = 0
+        self._lock = threading.Lock()
+
+    def _add(self, key, kind, payload, terms):
+        self._remove(key)
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[key] = tf
+        length = sum(terms.values())
+        self.docs[key] = (kind, payload, terms, length)
+        self.total_length += length
+
+    def _remove(self, key):
+        doc = self.docs.pop(key, None)
+        if doc is None:
+            return
+        for term in doc[2]:
+            docs = self.postings[term]
+            del docs[key]
+            if not docs:
+                del self.postings[term]
+        self.total_length -= doc[3]
+
+    def add_article(self, article):
+        terms = Counter(tokenize(article.description) + tokenize(article.source))
+        for token in tokenize(article.title):
+            terms[token] += TITLE_WEIGHT
+        with self._lock:
+            self._add(f"article:{article.id}", "article", article, terms)
+
+    def remove_article(self, article_id):
+        with self._lock:
+            self._remove(f"article:{article_id}")
+
+    def add_fixtures(self, docs):
+        """Index fixture dicts as built by `fixture_doc`; re-adding a fixture replaces it."""
+        with self._lock:
+            for doc in docs:
+                terms = Counter(tokenize(doc["home"]) + tokenize(doc["away"])
+                                + tokenize(doc["league"]) + tokenize(doc["venue"]))
+                self._add(f"fixture:{doc['id']}", "fixture", doc, terms)
+
+    def search(self, query, kind=None, limit=20):
+        """(score, kind, payload) for the best `limit` matches of `query`, highest score first."""
+        terms = set(tokenize(query))
+        with self._lock:
+            n = len(self.docs)
+            if not n or not terms:
+                return []
+            avg_length = self.total_length / n
+            scores = {}
+            for term in terms:
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, tf in postings.items():
+                    length = self.docs[key][3]
+                    scores[key] = scores.get(key, 0.0) + idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg_length))
+            if kind is not None:
+                scores = {key: score for key, score in scores.items() if self.docs[key][0] == kind}
+            ranked = heapq.nlargest(limit, scores.items(), key=lambda kv: kv[1])
+            return [(score, self.docs[key][0], self.docs[key][1]) for key, score in ranked]
+
+    def rebuild_fixtures(self, db):
+        from models import Match
+        with self._lock:
+            for key in [k for k, doc in self.docs.items() if doc[0] == "fixture"]:
+                self._remove(key)
+        count = 0
+        batch = []
+        for m in db.query(Match).yield_per(1000):
+            batch.append(fixture_doc(m))
+            if len(batch) == 1000:
+                self.add_fixtures(batch)
+                count += len(batch)
+                batch = []
+        self.add_fixtures(batch)
+        count += len(batch)
+        logger.info(f"Search index built from {count} fixtures")
+        return count
+
+    def stats(self):
+        return {"documents": len(self.docs), "terms": len(self.postings)}
+
+search_index = SearchIndex()
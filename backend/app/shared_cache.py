@@ -0,0 +1,189 @@
+"""
+Cache shared by every worker of a deployment.
+
+Values live in an in-process LRU tier and, with CACHE_URL set (redis://...,
+or fakeredis:// in tests), in a shared Redis tier behind it as msgpack. A
+local miss falls through to Redis; a set writes both. Without CACHE_URL the
+local tier is all there is and each worker behaves as it would on its own.
+
+Workers learn about changes over pub/sub: broadcast(namespace) makes every
+other worker drop its local copies in that namespace and run the callbacks
+registered with on_invalidate(namespace). invalidate() deletes the shared
+copies and does the same in this worker too. acquire() is a shared lease
+(SET NX PX) so a periodic job like the news poll runs in one worker per
+interval.
+"""
+import os, time, uuid, socket, logging, threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+CACHE_URL = os.getenv("CACHE_URL", "")
+CACHE_PREFIX = os.getenv("CACHE_PREFIX", "scoresure:")
+CACHE_LOCAL_SIZE = int(os.getenv("CACHE_LOCAL_SIZE", "1024"))
+CACHE_LOCAL_TTL = float(os.getenv("CACHE_LOCAL_TTL", "30"))  # cap on how long a shared value is kept locally
+CHANNEL = "invalidate"
+
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+class LocalCache:
+    """In-process LRU with a per-entry deadline."""
+
+    def __init__(self, size=CACHE_LOCAL_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self.entries[key] = (time.monotonic() + ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def drop_namespace(self, namespace):
+        prefix = f"{namespace}:"
+        with self._lock:
+            for key in [k for k in self.entries if k.startswith(prefix)]:
+                del self.entries[key]
+
+    def __len__(self):
+        return len(self.entries)
+
+class RedisTier:
+    """Shared tier over the Redis protocol; values are msgpack-encoded."""
+
+    def __init__(self, url, prefix=CACHE_PREFIX):
+        import msgpack
+        self._msgpack = msgpack
+        if url.startswith("fakeredis://"):
+            import fakeredis
+            # tiers opened with the same URL share one in-process server
+            self.client = fakeredis.FakeRedis.from_url(url.replace("fakeredis://", "redis://", 1))
+        else:
+            import redis
+            self.client = redis.Redis.from_url(url, socket_timeout=2, socket_connect_timeout=2)
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return None if raw is None else self._msgpack.unpackb(raw, raw=False)
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, self._msgpack.packb(value, use_bin_type=True), px=max(int(ttl * 1000), 1))
+
+    def drop_namespace(self, namespace):
+        keys = list(self.client.scan_iter(match=f"{self.prefix}{namespace}:*", count=500))
+        if keys:
+            self.client.delete(*keys)
+
+    def acquire(self, name, ttl):
+        return bool(self.client.set(f"{self.prefix}lease:{name}", WORKER_ID, nx=True, px=max(int(ttl * 1000), 1)))
+
+    def publish(self, message):
+        self.client.publish(self.prefix + CHANNEL, message)
+
+    def listen(self, handle):
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.prefix + CHANNEL)
+        for message in pubsub.listen():
+            handle(message["data"].decode() if isinstance(message["data"], bytes) else message["data"])
+
+class SharedCache:
+    def __init__(self, url=CACHE_URL):
+        self.local = LocalCache()
+        self.shared = RedisTier(url) if url else None
+        self.callbacks = {}
+        self.shared_errors = 0
+        self._listener = None
+
+    def _shared(self, operation, *args, default=None):
+        # a Redis outage degrades to per-worker caching instead of failing requests
+        try:
+            return getattr(self.shared, operation)(*args)
+        except Exception as e:
+            self.shared_errors += 1
+            logger.warning(f"Shared cache {operation} failed: {e}")
+            return default
+
+    def get(self, namespace, key):
+        full_key = f"{namespace}:{key}"
+        value = self.local.get(full_key)
+        if value is None and self.shared is not None:
+            value = self._shared("get", full_key)
+            if value is not None:
+                self.local.set(full_key, value, CACHE_LOCAL_TTL)
+        return value
+
+    def set(self, namespace, key, value, ttl):
+        full_key = f"{namespace}:{key}"
+        self.local.set(full_key, value, min(ttl, CACHE_LOCAL_TTL) if self.shared is not None else ttl)
+        if self.shared is not None:
+            self._shared("set", full_key, value, ttl)
+
+    def acquire(self, name, ttl):
+        """True if this worker holds the `name` lease for `ttl` seconds (always, without a shared tier)."""
+        if self.shared is None:
+            return True
+        # if Redis is down, every worker does the job rather than none
+        return self._shared("acquire", name, ttl, default=True)
+
+    def on_invalidate(self, namespace, callback):
+        self.callbacks.setdefault(namespace, []).append(callback)
+
+    def _changed(self, namespace):
+        self.local.drop_namespace(namespace)
+        for callback in self.callbacks.get(namespace, ()):
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Invalidation callback for {namespace} failed: {e}")
+
+    def broadcast(self, namespace):
+        """Tell the other workers that `namespace` changed."""
+        if self.shared is not None:
+            self._shared("publish", f"{WORKER_ID} {namespace}")
+
+    def invalidate(self, namespace):
+        """Drop `namespace` from both tiers, here and in every other worker."""
+        if self.shared is not None:
+            self._shared("drop_namespace", namespace)
+        self._changed(namespace)
+        self.broadcast(namespace)
+
+    def _handle(self, message):
+        sender, _, namespace = message.partition(" ")
+        if sender != WORKER_ID:
+            self._changed(namespace)
+
+    def start(self):
+        """Start the pub/sub listener thread; a no-op without a shared tier."""
+        if self.shared is None or self._listener is not None:
+            return
+        def run():
+            while True:
+                try:
+                    self.shared.listen(self._handle)
+                except Exception as e:
+                    self.shared_errors += 1
+                    logger.warning(f"Shared cache listener reconnecting: {e}")
+                    time.sleep(1)
+        self._listener = threading.Thread(target=run, name="shared-cache-listener", daemon=True)
+        self._listener.start()
+
+    def stats(self):
+        return {"backend": "redis" if self.shared is not None else "local", "local_entries": len(self.local),
+                "shared_errors": self.shared_errors, "worker": WORKER_ID}
+
+shared_cache = SharedCache()
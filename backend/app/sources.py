@@ -0,0 +1,99 @@
+"""
+Source catalogue: which competitions are ingested, from which providers,
+and how often.
+
+The catalogue (SOURCES_FILE, JSON or YAML) maps each competition key to its
+display name, country, sport and per-provider id:
+
+    "premier_league": {
+        "name": "Premier League", "country": "England", "sport": "soccer",
+        "interval_seconds": 600,
+        "sources": {"api_football": 39, "espn": "eng.1",
+                    "thesportsdb": {"id": 4328, "interval_seconds": 3600}}
+    }
+
+A source is one provider x competition. Its polling interval is its own
+interval_seconds, else the competition's, else FETCH_INTERVAL_SECONDS. A
+source given as {"enabled": false, ...} stays in the catalogue but is never
+fetched.
+
+Each competition is ingested from one provider only, since providers don't
+share fixture ids and the same match from two of them would be stored
+twice. That is the competition's "provider" if it names one that is
+enabled, else the first enabled source listed; the others are fallbacks
+for deployments where it is not enabled.
+
+Adding a competition is a catalogue edit; the providers, league lists and
+ingestion schedule are all derived from it.
+"""
+import os, json
+
+SOURCES_FILE = os.getenv("SOURCES_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "sources.json"))
+FETCH_INTERVAL_SECONDS = float(os.getenv("FETCH_INTERVAL_SECONDS", "0"))
+
+DEFAULT_SPORT = "soccer"
+
+class Source:
+    __slots__ = ("provider", "competition", "provider_id", "interval", "enabled", "sport")
+
+    def __init__(self, provider, competition, provider_id, interval, enabled=True, sport=DEFAULT_SPORT):
+        self.provider = provider
+        self.competition = competition
+        self.provider_id = provider_id
+        self.sport = sport
+        self.interval = interval
+        self.enabled = enabled
+
+    @property
+    def name(self):
+        return f"{self.provider}:{self.competition}"
+
+def read_catalogue(path=SOURCES_FILE):
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml  # PyYAML, only needed for a YAML catalogue
+            return yaml.safe_load(f)
+        return json.load(f)
+
+def parse(catalogue, default_interval=FETCH_INTERVAL_SECONDS):
+    """(competitions: key -> {"name", "country", "sport", "provider"}, sources: [Source]) from a catalogue dict."""
+    competitions = {}
+    sources = []
+    for key, spec in catalogue["competitions"].items():
+        if "name" not in spec:
+            raise ValueError(f"Competition {key} has no name")
+        sport = spec.get("sport", DEFAULT_SPORT)
+        competitions[key] = {"name": spec["name"], "country": spec.get("country"), "sport": sport,
+                             "provider": spec.get("provider")}
+        if spec.get("provider") is not None and spec["provider"] not in (spec.get("sources") or {}):
+            raise ValueError(f"Competition {key} is owned by {spec['provider']}, which has no source for it")
+        interval = spec.get("interval_seconds", default_interval)
+        for provider, source in (spec.get("sources") or {}).items():
+            if not isinstance(source, dict):
+                source = {"id": source}
+            if "id" not in source:
+                raise ValueError(f"Source {provider}:{key} has no id")
+            sources.append(Source(provider, key, source["id"], float(source.get("interval_seconds", interval)),
+                                  source.get("enabled", True), sport))
+    return competitions, sources
+
+COMPETITIONS, SOURCES = parse(read_catalogue())
+
+def provider_ids(provider):
+    """Competition key -> this provider's id for it, for every enabled source of the provider."""
+    return {s.competition: s.provider_id for s in SOURCES if s.provider == provider and s.enabled}
+
+def owners(providers):
+    """Competition key -> the enabled source it is ingested from when `providers` are enabled."""
+    owned = {}
+    for s in SOURCES:
+        if not s.enabled or s.provider not in providers:
+            continue
+        current = owned.get(s.competition)
+        if current is None or (s.provider == COMPETITIONS[s.competition]["provider"] and current.provider != s.provider):
+            owned[s.competition] = s
+    return owned
+
+def enabled_sources(providers, competitions=None):
+    """The owning source of each competition for enabled `providers`, optionally only for the given keys."""
+    return [s for s in owners(providers).values() if competitions is None or s.competition in competitions]
@@ -0,0 +1,197 @@
+"""
+Team tagging for news articles.
+
+An Aho-Corasick automaton over every team alias seen in the fixtures table
+finds all team mentions in an article's title and description in one pass.
+Tags (team names and league keys) are kept in an index from team to
+article ids, so per-team feeds and a fixture's related news are lookups.
+"""
+import re, logging, threading
+from collections import deque
+from leagues import league_key_for_name
+
+logger = logging.getLogger(__name__)
+
+# club-type words dropped from the ends of a name to form its short alias
+AFFIXES = {"fc", "afc", "cf", "ac", "sc", "ssc", "as", "cd", "ud", "rc", "sv", "1", "calcio", "club"}
+MIN_ALIAS_LENGTH = 4
+MIN_NAME_LENGTH = 3  # shorter names ("A", "AC") would tag ordinary words
+
+# common short names that can't be derived from the fixture name
+NICKNAMES = {
+    "manchester united": ("man utd", "man united"),
+    "manchester city": ("man city",),
+    "tottenham": ("spurs",),
+    "tottenham hotspur": ("spurs",),
+    "wolverhampton wanderers": ("wolves",),
+    "wolves": ("wolverhampton",),
+    "paris saint germain": ("psg",),
+    "bayern munich": ("bayern",),
+    "inter": ("inter milan", "internazionale"),
+    "borussia dortmund": ("dortmund",),
+}
+
+NORMALIZE_RE = re.compile(r"[^\w]+")
+
+def normalize(text):
+    return NORMALIZE_RE.sub(" ", text.lower()).strip()
+
+def aliases_for(team):
+    name = normalize(team)
+    aliases = {name}
+    tokens = name.split()
+    while tokens and tokens[0] in AFFIXES:
+        tokens = tokens[1:]
+    while tokens and tokens[-1] in AFFIXES:
+        tokens = tokens[:-1]
+    short = " ".join(tokens)
+    if len(short) >= MIN_ALIAS_LENGTH:
+        aliases.add(short)
+    for alias in (name, short):
+        aliases.update(NICKNAMES.get(alias, ()))
+    return {alias for alias in aliases if len(alias) >= MIN_NAME_LENGTH}
+
+class Automaton:
+    """Aho-Corasick matcher over a fixed set of patterns."""
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        for pattern, value in patterns.items():
+            node = 0
+            for ch in pattern:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                    self.goto[node][ch] = nxt
+                node = nxt
+            self.out[node].append((len(pattern), value))
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def find(self, text):
+        """(start, end, value) for every pattern occurrence bounded by non-word characters."""
+        node = 0
+        goto, fail, out = self.goto, self.fail, self.out
+        n = len(text)
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, value in out[node]:
+                start = i - length + 1
+                if (start == 0 or not text[start - 1].isalnum()) and (i + 1 == n or not text[i + 1].isalnum()):
+                    yield start, i + 1, value
+
+class TeamTagger:
+    def __init__(self):
+        self.teams = {}          # team name -> set of league keys
+        self.automaton = Automaton({})
+        self.by_team = {}        # team name -> set of article ids
+        self.by_league = {}      # league key -> set of article ids
+        self.article_tags = {}   # article id -> (teams, leagues)
+        self._lock = threading.Lock()
+
+    def _build(self):
+        patterns = {}
+        for team in self.teams:
+            for alias in aliases_for(team):
+                # an alias shared by two teams is ambiguous; keep the team whose own name it is
+                if alias not in patterns or normalize(team) == alias:
+                    patterns[alias] = team
+        self.automaton = Automaton(patterns)
+
+    def add_teams(self, pairs):
+        """Register (team, league name) pairs; rebuilds and retags if any team is new. Returns True if rebuilt."""
+        new = False
+        with self._lock:
+            for team, league in pairs:
+                if not team:
+                    continue
+                leagues = self.teams.get(team)
+                if leagues is None:
+                    leagues = self.teams[team] = set()
+                    new = True
+                key = league_key_for_name(league)
+                if key:
+                    leagues.add(key)
+            if not new:
+                return False
+            self._build()
+        self.retag()
+        return True
+
+    def tag(self, text):
+        """(team names, league keys) mentioned in `text`."""
+        teams = {team for _, _, team in self.automaton.find(normalize(text))} if text else set()
+        leagues = set()
+        for team in teams:
+            leagues |= self.teams.get(team, set())
+        return teams, leagues
+
+    def tag_article(self, article):
+        teams, leagues = self.tag(f"{article.title} {article.description}")
+        with self._lock:
+            self._untag(article.id)
+            self.article_tags[article.id] = (teams, leagues)
+            for team in teams:
+                self.by_team.setdefault(team, set()).add(article.id)
+            for league in leagues:
+                self.by_league.setdefault(league, set()).add(article.id)
+        return teams, leagues
+
+    def _untag(self, article_id):
+        tags = self.article_tags.pop(article_id, None)
+        if tags is None:
+            return
+        for index, keys in ((self.by_team, tags[0]), (self.by_league, tags[1])):
+            for key in keys:
+                ids = index[key]
+                ids.discard(article_id)
+                if not ids:
+                    del index[key]
+
+    def remove_article(self, article_id):
+        with self._lock:
+            self._untag(article_id)
+
+    def articles_for(self, teams=(), league=None):
+        """Ids of articles tagged with any of `teams`, or with `league`."""
+        with self._lock:
+            ids = set()
+            for team in teams:
+                ids |= self.by_team.get(team, set())
+            if league is not None:
+                ids |= self.by_league.get(league, set())
+            return ids
+
+    def retag(self):
+        """Tag every indexed article again, after the team list changed."""
+        from news_index import news_index
+        for article in news_index.latest(len(news_index)):
+            self.tag_article(article)
+
+    def rebuild(self, db):
+        from models import Match
+        pairs = set()
+        for home, away, league in db.query(Match.home, Match.away, Match.league).distinct():
+            pairs.add((home, league))
+            pairs.add((away, league))
+        self.add_teams(pairs)
+        logger.info(f"Team tagger built from {len(self.teams)} teams")
+        return len(self.teams)
+
+team_tagger = TeamTagger()
@@ -0,0 +1,159 @@
+"""
+Circuit breakers and hedged requests for the fixture providers.
+
+Each provider has a breaker that opens after UPSTREAM_FAILURE_THRESHOLD
+consecutive failures or calls slower than UPSTREAM_SLO_SECONDS. While it is
+open, calls are not made; the last good result for the same league is served
+instead (or CircuitOpen is raised if there is none). After
+UPSTREAM_OPEN_SECONDS one trial call is let through, and its outcome closes
+or re-opens the breaker.
+
+With UPSTREAM_HEDGE=1 a second attempt is started if the first hasn't
+answered after the provider's recent p95 latency, and whichever succeeds
+first wins. Hedging only starts once UPSTREAM_HEDGE_MIN_SAMPLES latencies
+have been seen, so a cold provider isn't hit twice on every call.
+"""
+import os, time, asyncio, logging
+from collections import deque
+from metrics import HEDGED_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_TIMEOUT_SECONDS = float(os.getenv("UPSTREAM_TIMEOUT_SECONDS", "30"))
+UPSTREAM_FAILURE_THRESHOLD = int(os.getenv("UPSTREAM_FAILURE_THRESHOLD", "3"))
+UPSTREAM_SLO_SECONDS = float(os.getenv("UPSTREAM_SLO_SECONDS", "10"))
+UPSTREAM_OPEN_SECONDS = float(os.getenv("UPSTREAM_OPEN_SECONDS", "60"))
+UPSTREAM_HEDGE = os.getenv("UPSTREAM_HEDGE", "0") == "1"
+UPSTREAM_HEDGE_MIN_SAMPLES = int(os.getenv("UPSTREAM_HEDGE_MIN_SAMPLES", "20"))
+UPSTREAM_HEDGE_MIN_DELAY = float(os.getenv("UPSTREAM_HEDGE_MIN_DELAY", "0.2"))
+LATENCY_WINDOW = 200
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+
+class CircuitOpen(Exception):
+    pass
+
+class CircuitBreaker:
+    def __init__(self, name, threshold=UPSTREAM_FAILURE_THRESHOLD, slo=UPSTREAM_SLO_SECONDS, open_seconds=UPSTREAM_OPEN_SECONDS):
+        self.name = name
+        self.threshold = threshold
+        self.slo = slo
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_running = False
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.snapshots = {}  # key -> last good result
+        self.stale_served = 0
+        self.times_opened = 0
+
+    def allow(self):
+        """Whether a call may go upstream now; claims the trial slot when half-open."""
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+            self.state = HALF_OPEN
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self.trial_running:
+            self.trial_running = True
+            return True
+        return False
+
+    def succeeded(self, key, result, elapsed):
+        self.latencies.append(elapsed)
+        self.snapshots[key] = result
+        if elapsed > self.slo:
+            # answered, but too slowly to keep depending on
+            self.failed(f"{elapsed:.1f}s over the {self.slo:g}s SLO")
+            return
+        if self.state != CLOSED:
+            logger.info(f"{self.name} circuit closed")
+        self.state = CLOSED
+        self.failures = 0
+        self.trial_running = False
+
+    def failed(self, reason):
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.threshold:
+            if self.state != OPEN:
+                self.times_opened += 1
+                logger.warning(f"{self.name} circuit opened after {self.failures} failures ({reason})")
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+        self.trial_running = False
+
+    def snapshot(self, key):
+        if key not in self.snapshots:
+            raise CircuitOpen(f"{self.name} circuit open and no earlier result for {key}")
+        self.stale_served += 1
+        return self.snapshots[key]
+
+    def p95(self):
+        if len(self.latencies) < UPSTREAM_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+    def stats(self):
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "stale_served": self.stale_served,
+            "p95_seconds": self.p95(),
+            "snapshots": len(self.snapshots),
+        }
+
+breakers = {}
+
+def breaker(name):
+    b = breakers.get(name)
+    if b is None:
+        b = breakers[name] = CircuitBreaker(name)
+    return b
+
+async def hedged(name, attempt, delay):
+    """Result of attempt(), starting a second one if the first takes longer than `delay`."""
+    first = asyncio.ensure_future(attempt())
+    pending = {first}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if done:
+            return first.result()
+        HEDGED_REQUESTS.labels(name, "fired").inc()
+        second = asyncio.ensure_future(attempt())
+        pending.add(second)
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is second:
+                        HEDGED_REQUESTS.labels(name, "won").inc()
+                    return task.result()
+            if not pending:
+                # both attempts failed
+                return done.pop().result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def call(name, key, attempt):
+    """attempt() through the provider's breaker, hedged if enabled. Returns (result, stale)."""
+    b = breaker(name)
+    if not b.allow():
+        return b.snapshot(key), True
+    delay = b.p95() if UPSTREAM_HEDGE else None
+    start = time.perf_counter()
+    try:
+        if delay is None:
+            result = await attempt()
+        else:
+            result = await hedged(name, attempt, max(delay, UPSTREAM_HEDGE_MIN_DELAY))
+    except asyncio.CancelledError:
+        b.trial_running = False
+        raise
+    except Exception as e:
+        b.failed(e)
+        raise
+    b.succeeded(key, result, time.perf_counter() - start)
+    return result, False
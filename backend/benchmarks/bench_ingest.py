@@ -0,0 +1,52 @@
+"""Provider parsing and the ingest write path over 10k synthetic fixtures."""
+import asyncio
+import httpx
+import pytest
+import synthetic
+
+FIXTURES = 10_000
+
+def stub_client():
+    # half the fixtures from each provider, served from memory
+    payloads = {
+        "site.api.espn.com": synthetic.espn_scoreboard(FIXTURES // 2),
+        "www.thesportsdb.com": synthetic.sportsdb_events(FIXTURES // 2),
+    }
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payloads[request.url.host])))
+
+async def parse_all(client):
+    from providers import espn, thesportsdb
+    batches = await asyncio.gather(espn.fetch(client, "premier_league"), thesportsdb.fetch(client, "premier_league"))
+    return [f for batch in batches for f in batch]
+
+@pytest.fixture(scope="module")
+def parsed():
+    async def run():
+        async with stub_client() as client:
+            return await parse_all(client)
+    fixtures = asyncio.run(run())
+    assert len(fixtures) == FIXTURES
+    return fixtures
+
+def bench_parse_provider_payloads(benchmark):
+    async def run():
+        async with stub_client() as client:
+            return await parse_all(client)
+    fixtures = benchmark(lambda: asyncio.run(run()))
+    assert len(fixtures) == FIXTURES
+
+def bench_store_new_fixtures(benchmark, parsed, empty_tables):
+    from fetcher import store_fixtures
+
+    def setup():
+        empty_tables()
+        return (parsed,), {}
+    added = benchmark.pedantic(store_fixtures, setup=setup, rounds=3)
+    assert added == FIXTURES
+
+def bench_store_existing_fixtures(benchmark, parsed, empty_tables):
+    from fetcher import store_fixtures
+    empty_tables()
+    store_fixtures(parsed)
+    added = benchmark.pedantic(store_fixtures, args=(parsed,), rounds=3)
+    assert added == 0
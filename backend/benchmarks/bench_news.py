@@ -0,0 +1,54 @@
+"""News aggregation from stubbed feeds: normalize, dedup, index, tag and search."""
+import pytest
+import synthetic
+
+FEEDS = 5
+PER_FEED = 200
+
+@pytest.fixture(scope="module")
+def feeds():
+    return synthetic.rss_feeds(FEEDS, PER_FEED)
+
+@pytest.fixture
+def news(monkeypatch, feeds):
+    from routers import news
+    stubbed = iter(feeds * 1000)
+    monkeypatch.setattr(news, "parse_feed", lambda url: next(stubbed))
+    monkeypatch.setattr(news, "RSS_FEEDS", [f"feed-{i}" for i in range(FEEDS)])
+    monkeypatch.setattr(news, "NEWS_API_KEY", "")
+    return news
+
+def reset():
+    from articles import articles
+    from news_index import news_index
+    articles.entries.clear()
+    news_index.__init__()
+
+def bench_refresh_from_feeds(benchmark, news):
+    from news_index import news_index
+    from tagger import team_tagger
+    team_tagger.add_teams((team, None) for names in synthetic.TEAMS.values() for team in names)
+
+    def setup():
+        reset()
+        return (), {"force": True}
+    added = benchmark.pedantic(news.refresh_news, setup=setup, rounds=5)
+    assert 0 < added == len(news_index) < FEEDS * PER_FEED
+
+def bench_latest_and_since(benchmark, news):
+    from news_index import news_index
+    reset()
+    news.refresh_news(force=True)
+    _, middle = news_index.since("0", len(news_index) // 2)
+
+    def query():
+        return news_index.latest(50), news_index.since(middle, 50)
+    latest, (since, _) = benchmark(query)
+    assert latest and since
+
+def bench_search(benchmark, news):
+    from search import search_index
+    reset()
+    news.refresh_news(force=True)
+    results = benchmark(search_index.search, "arsenal chelsea thriller", None, 20)
+    assert results
@@ -0,0 +1,48 @@
+"""Batch prediction over 10k fixtures with the flat and Elo models, plus features."""
+import pytest
+import synthetic
+
+FIXTURES = 10_000
+RESULTS = 20_000
+
+@pytest.fixture(scope="module")
+def fixtures():
+    return synthetic.fixtures(FIXTURES)
+
+@pytest.fixture(scope="module")
+def elo_model():
+    from ratings import fit_league, build_job, save_artifact, load_ratings
+    from leagues import league_key_for_name
+    from registry import EloModel
+    by_league = {}
+    for r in synthetic.results(RESULTS):
+        by_league.setdefault(league_key_for_name(r.league), []).append((r.home, r.away, r.home_goals, r.away_goals))
+    version = save_artifact([fit_league(build_job(key, rows)) for key, rows in by_league.items()])
+    return EloModel(load_ratings(version))
+
+@pytest.fixture(scope="module")
+def feature_store():
+    from features import features
+    for r in synthetic.results(RESULTS):
+        features.add(r)
+    return features
+
+def bench_flat_model_batch(benchmark, fixtures):
+    from registry import FlatModel
+    out = benchmark(FlatModel().predict_batch, fixtures)
+    assert len(out) == FIXTURES
+
+def bench_elo_model_batch(benchmark, fixtures, elo_model):
+    out = benchmark(elo_model.predict_batch, fixtures)
+    assert len(out) == FIXTURES
+
+def bench_feature_matrix(benchmark, fixtures, feature_store):
+    out = benchmark(feature_store.feature_matrix, fixtures)
+    assert out.shape[0] == FIXTURES
+
+def bench_predict_fixtures(benchmark, fixtures, elo_model, feature_store):
+    from registry import registry
+    from predictions import predict_fixtures
+    registry.active = elo_model
+    out = benchmark(predict_fixtures, fixtures)
+    assert len(out) == FIXTURES
@@ -0,0 +1,52 @@
+"""
+Diff two benchmark result files.
+
+    python benchmarks/compare.py results/<base>.json results/<head>.json --threshold 0.15
+
+Micro benchmarks compare median time, load runs compare requests/second.
+Exits 1 with --fail if anything regressed by more than the threshold.
+"""
+import sys
+import json
+import argparse
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+def compare(base, head, threshold):
+    rows = []
+    for name, stats in sorted(head["micro"].items()):
+        if name in base["micro"]:
+            # >1 means slower
+            rows.append((name, base["micro"][name]["median"] * 1000, stats["median"] * 1000, "ms",
+                         stats["median"] / base["micro"][name]["median"]))
+    base_load = {(r["database"], r["path"], r["concurrency"]): r for r in base["load"]}
+    for r in head["load"]:
+        key = (r["database"], r["path"], r["concurrency"])
+        if key in base_load:
+            rows.append((f"{key[0]} {key[1]} c={key[2]}", base_load[key]["rps"], r["rps"], "req/s",
+                         base_load[key]["rps"] / r["rps"]))
+    regressions = 0
+    print(f"{'benchmark':<60} {'base':>12} {'head':>12}  change")
+    for name, before, after, unit, slowdown in rows:
+        flag = ""
+        if slowdown > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif slowdown < 1 - threshold:
+            flag = "  faster"
+        print(f"{name:<60} {before:>10.2f}{unit[:2]:>2} {after:>10.2f}{unit[:2]:>2}  {(slowdown - 1) * 100:+6.1f}% slower{flag}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown treated as a regression")
+    parser.add_argument("--fail", action="store_true", help="exit 1 if anything regressed")
+    args = parser.parse_args()
+    base, head = load(args.base), load(args.head)
+    print(f"base {base['commit']} ({base['created_at']})  head {head['commit']} ({head['created_at']})")
+    regressions = compare(base, head, args.threshold)
+    sys.exit(1 if regressions and args.fail else 0)
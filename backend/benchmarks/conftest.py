@@ -0,0 +1,48 @@
+"""
+Benchmark environment.
+
+The app reads its configuration at import, so the database and artifact
+locations are pointed at a scratch directory before anything from app/ is
+imported. BENCH_DATABASE_URL selects another database (e.g. a local
+Postgres); DATABASE_URL is deliberately ignored so a benchmark run can never
+write into a real database.
+"""
+import os
+import sys
+import tempfile
+
+BENCH_DIR = tempfile.mkdtemp(prefix="scoresure-bench-")
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL", f"sqlite:///{BENCH_DIR}/bench.db")
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["MODEL_ARTIFACT_DIR"] = os.path.join(BENCH_DIR, "artifacts")
+os.environ["IMAGE_CACHE_DIR"] = os.path.join(BENCH_DIR, "images")
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BACKEND, "app"))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+@pytest.fixture(scope="session")
+def database():
+    from db import Base, engine
+    import models  # noqa: F401  (registers tables)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+@pytest.fixture
+def empty_tables(database):
+    """Callable that deletes every match and result, for per-round setup."""
+    from db import SessionLocal
+    from models import Match, Result
+
+    def clear():
+        db = SessionLocal()
+        try:
+            db.query(Result).delete()
+            db.query(Match).delete()
+            db.commit()
+        finally:
+            db.close()
+    return clear
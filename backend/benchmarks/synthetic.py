@@ -0,0 +1,196 @@
+"""
+Deterministic synthetic data for the benchmarks and the provider simulator:
+payloads in the ESPN, TheSportsDB, API-Football and NewsAPI wire formats,
+finished results, and RSS feeds.
+
+Fixtures are laid out every three hours from START, a week before the
+current day, so a schedule of any size has both past and upcoming games. In
+the ESPN and API-Football payloads the games that are over by now come
+finished, with a final score, so ingesting them also records results.
+"""
+import random
+import calendar
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
+from types import SimpleNamespace
+from xml.sax.saxutils import escape
+
+TEAMS = {
+    "premier_league": ["Arsenal", "Aston Villa", "Bournemouth", "Brentford", "Brighton", "Chelsea",
+                       "Crystal Palace", "Everton", "Fulham", "Liverpool", "Manchester City",
+                       "Manchester United", "Newcastle United", "Nottingham Forest", "Tottenham",
+                       "West Ham", "Wolves", "Leicester", "Southampton", "Ipswich"],
+    "serie_a": ["Inter", "AC Milan", "Juventus", "Napoli", "Roma", "Lazio", "Atalanta", "Fiorentina",
+                "Bologna", "Torino", "Udinese", "Genoa", "Monza", "Lecce", "Cagliari", "Verona",
+                "Empoli", "Parma", "Como", "Venezia"],
+    "la_liga": ["Real Madrid", "Barcelona", "Atletico Madrid", "Athletic Club", "Real Sociedad",
+                "Villarreal", "Real Betis", "Sevilla", "Valencia", "Girona", "Osasuna", "Celta Vigo",
+                "Mallorca", "Getafe", "Rayo Vallecano", "Alaves", "Las Palmas", "Leganes",
+                "Espanyol", "Valladolid"],
+    "bundesliga": ["Bayern Munich", "Bayer Leverkusen", "Borussia Dortmund", "RB Leipzig", "Eintracht Frankfurt",
+                   "VfB Stuttgart", "SC Freiburg", "Wolfsburg", "Hoffenheim", "Werder Bremen", "Union Berlin",
+                   "Mainz", "Augsburg", "Borussia Monchengladbach", "Heidenheim", "St. Pauli", "Holstein Kiel",
+                   "Bochum"],
+    "ligue_1": ["Paris Saint-Germain", "Marseille", "Monaco", "Lille", "Lyon", "Nice", "Lens", "Rennes",
+                "Strasbourg", "Brest", "Toulouse", "Nantes", "Reims", "Auxerre", "Angers", "Le Havre",
+                "Saint-Etienne", "Montpellier"],
+}
+START = datetime.now(timezone.utc).replace(tzinfo=None, hour=15, minute=0, second=0, microsecond=0) - timedelta(days=7)
+FULL_TIME = timedelta(hours=2)
+
+def _pairs(rng, n, league=None):
+    """`n` fixtures cycling through the leagues, or all in `league`; ids are unique across leagues."""
+    leagues = [league] if league else list(TEAMS)
+    base = (list(TEAMS).index(league) + 1 if league in TEAMS else 100 + sum(map(ord, league))) * 1_000_000 if league else 0
+    for i in range(n):
+        key = leagues[i % len(leagues)]
+        # competitions added to the catalogue without a team list here get placeholder clubs
+        home, away = rng.sample(TEAMS.get(key) or [f"{key.replace('_', ' ').title()} {c}" for c in "ABCDEFGHIJ"], 2)
+        yield base + i, key, home, away, START + timedelta(hours=3 * i)
+
+def _final_score(rng, kickoff):
+    """(home_goals, away_goals) for a fixture that is over by now, else None."""
+    if kickoff + FULL_TIME > datetime.now(timezone.utc).replace(tzinfo=None):
+        return None
+    return rng.randint(0, 4), rng.randint(0, 3)
+
+def espn_scoreboard(n, seed=1, league=None):
+    """ESPN scoreboard JSON with `n` events."""
+    rng, goals = random.Random(seed), random.Random(-seed)
+    events = []
+    for i, _, home, away, kickoff in _pairs(rng, n, league):
+        score = _final_score(goals, kickoff)
+        competitors = [
+            {"homeAway": "home", "team": {"displayName": home, "logo": f"https://a.espncdn.com/i/teamlogos/soccer/500/{i}.png"}},
+            {"homeAway": "away", "team": {"displayName": away, "logo": f"https://a.espncdn.com/i/teamlogos/soccer/500/{i + 1}.png"}},
+        ]
+        if score:
+            for competitor, g in zip(competitors, score):
+                competitor["score"] = str(g)
+        events.append({
+            "id": str(700000 + i),
+            "date": kickoff.strftime("%Y-%m-%dT%H:%MZ"),
+            "status": {"type": {"name": "STATUS_FULL_TIME", "completed": True} if score else
+                       {"name": "STATUS_SCHEDULED", "completed": False}},
+            "competitions": [{"venue": {"fullName": f"{home} Stadium"}, "competitors": competitors}],
+        })
+    return {"events": events}
+
+def sportsdb_events(n, seed=2, league=None):
+    """TheSportsDB eventsnextleague JSON with `n` events."""
+    rng = random.Random(seed)
+    events = []
+    for i, _, home, away, kickoff in _pairs(rng, n, league):
+        events.append({
+            "idEvent": str(900000 + i),
+            "strHomeTeam": home,
+            "strAwayTeam": away,
+            "strHomeTeamBadge": f"https://r2.thesportsdb.com/images/media/team/badge/{i}.png",
+            "strAwayTeamBadge": f"https://r2.thesportsdb.com/images/media/team/badge/{i + 1}.png",
+            "dateEvent": kickoff.strftime("%Y-%m-%d"),
+            "strTime": kickoff.strftime("%H:%M:%S"),
+            "strVenue": f"{home} Stadium",
+        })
+    return {"events": events}
+
+def api_football_fixtures(n, seed=6, league=None):
+    """API-Football /fixtures JSON with `n` fixtures."""
+    from leagues import LEAGUES, LEAGUE_NAMES
+    rng, goals = random.Random(seed), random.Random(-seed)
+    response = []
+    for i, key, home, away, kickoff in _pairs(rng, n, league):
+        score = _final_score(goals, kickoff)
+        response.append({
+            "fixture": {
+                "id": 500000 + i,
+                "date": kickoff.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+                "referee": rng.choice([None, "M. Oliver", "A. Taylor", "D. Orsato"]),
+                "venue": {"name": f"{home} Stadium"},
+                "status": {"short": "FT"} if score else {"short": "NS"},
+            },
+            "league": {"id": LEAGUES[key], "name": LEAGUE_NAMES[key]},
+            "teams": {
+                "home": {"name": home, "logo": f"https://media.api-sports.io/football/teams/{i}.png"},
+                "away": {"name": away, "logo": f"https://media.api-sports.io/football/teams/{i + 1}.png"},
+            },
+            "goals": {"home": score[0], "away": score[1]} if score else {"home": None, "away": None},
+        })
+    return {"results": len(response), "response": response}
+
+def results(n, seed=3):
+    """Finished results (objects shaped like models.Result), in kickoff order."""
+    from leagues import LEAGUE_NAMES
+    rng = random.Random(seed)
+    return [SimpleNamespace(match_id=i, league=LEAGUE_NAMES[league], home=home, away=away,
+                            kickoff=kickoff - timedelta(days=400), home_goals=rng.randint(0, 4), away_goals=rng.randint(0, 3))
+            for i, league, home, away, kickoff in _pairs(rng, n)]
+
+def fixtures(n, seed=4):
+    """Upcoming fixtures (objects with league, home, away, kickoff)."""
+    from leagues import LEAGUE_NAMES
+    rng = random.Random(seed)
+    return [SimpleNamespace(id=i, league=LEAGUE_NAMES[league], home=home, away=away, kickoff=kickoff)
+            for i, league, home, away, kickoff in _pairs(rng, n)]
+
+HEADLINES = [
+    "{a} beat {b} in a late thriller",
+    "{a} manager praises squad after win over {b}",
+    "{a} and {b} share the points",
+    "Injury blow for {a} ahead of {b} clash",
+    "{a} close in on deal for {b} midfielder",
+]
+
+def _stories(rng, n):
+    teams = [t for names in TEAMS.values() for t in names]
+    for i in range(n):
+        a, b = rng.sample(teams, 2)
+        yield i, rng.choice(HEADLINES).format(a=a, b=b)
+
+def rss_feeds(feeds, per_feed, overlap=0.3, seed=5):
+    """`feeds` feedparser-shaped results; about `overlap` of each feed's stories repeat another feed's."""
+    rng = random.Random(seed)
+    stories = list(_stories(rng, feeds * per_feed))
+    out = []
+    for f in range(feeds):
+        entries = []
+        for j in range(per_feed):
+            i, title = stories[f * per_feed + j]
+            if f and rng.random() < overlap:
+                i, title = stories[rng.randrange(f * per_feed)]  # same story, another outlet
+            entries.append({
+                "title": title,
+                "link": f"https://feed{f}.example.com/news/{i}?utm_source=rss",
+                "summary": f"<p>{title}. Full report and reaction.</p>",
+                "published_parsed": time.gmtime(1_750_000_000 + i * 60),
+            })
+        out.append(SimpleNamespace(feed={"title": f"Feed {f}"}, entries=entries))
+    return out
+
+def rss_xml(feed):
+    """One rss_feeds() result rendered as an RSS 2.0 document."""
+    items = "".join(
+        f"<item><title>{escape(e['title'])}</title><link>{escape(e['link'])}</link>"
+        f"<description>{escape(e['summary'])}</description>"
+        f"<pubDate>{formatdate(calendar.timegm(e['published_parsed']), usegmt=True)}</pubDate></item>"
+        for e in feed.entries)
+    return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>{escape(feed.feed['title'])}</title><link>https://example.com/</link>"
+            f"<description>{escape(feed.feed['title'])}</description>{items}</channel></rss>")
+
+def newsapi_articles(n, seed=7):
+    """NewsAPI /everything JSON with `n` articles, newest first."""
+    rng = random.Random(seed)
+    articles = []
+    for i, title in _stories(rng, n):
+        articles.append({
+            "source": {"id": None, "name": f"Outlet {i % 7}"},
+            "author": None,
+            "title": title,
+            "description": f"{title}. Full report and reaction.",
+            "url": f"https://news{i % 7}.example.com/football/{i}",
+            "urlToImage": f"https://news{i % 7}.example.com/images/{i}.jpg" if i % 3 else None,
+            "publishedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(1_750_000_000 + (n - i) * 60)),
+            "content": None,
+        })
+    return {"status": "ok", "totalResults": n, "articles": articles}
@@ -1,206 +0,0 @@
-#!/usr/bin/env python3
-"""
-Clean Working Backend - Simplified version for reliable startup
-"""
-
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
-import requests
-import json
-from datetime import datetime, timedelta
-from typing import Optional
-import logging
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-app = FastAPI(title="Football Predictions API", version="1.0.0")
-
-# Enable CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Sample data to ensure the API works
-SAMPLE_FIXTURES = [
-    {
-        "fixture_id": "match_1",
-        "home_team": "Manchester City",
-        "away_team": "Arsenal",
-        "home_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/382.png",
-        "away_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/359.png",
-        "match_date": (datetime.now() + timedelta(days=3)).isoformat(),
-        "venue": "Etihad Stadium",
-        "league": "Premier League"
-    },
-    {
-        "fixture_id": "match_2", 
-        "home_team": "Liverpool",
-        "away_team": "Chelsea",
-        "home_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/364.png",
-        "away_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/363.png",
-        "match_date": (datetime.now() + timedelta(days=3)).isoformat(),
-        "venue": "Anfield",
-        "league": "Premier League"
-    },
-    {
-        "fixture_id": "match_3",
-        "home_team": "Tottenham",
-        "away_team": "Newcastle United", 
-        "home_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/367.png",
-        "away_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/361.png",
-        "match_date": (datetime.now() + timedelta(days=3)).isoformat(),
-        "venue": "Tottenham Hotspur Stadium",
-        "league": "Premier League"
-    },
-    {
-        "fixture_id": "match_4",
-        "home_team": "Brighton & Hove Albion",
-        "away_team": "Everton",
-        "home_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/331.png", 
-        "away_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/368.png",
-        "match_date": (datetime.now() + timedelta(days=3)).isoformat(),
-        "venue": "American Express Community Stadium",
-        "league": "Premier League"
-    },
-    {
-        "fixture_id": "match_5",
-        "home_team": "West Ham United",
-        "away_team": "Aston Villa",
-        "home_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/371.png",
-        "away_logo": "https://a.espncdn.com/i/teamlogos/soccer/500/362.png", 
-        "match_date": (datetime.now() + timedelta(days=3)).isoformat(),
-        "venue": "London Stadium",
-        "league": "Premier League"
-    }
-]
-
-def generate_prediction(fixture):
-    """Generate a realistic prediction for a fixture"""
-    import hashlib
-    
-    # Use team names to generate consistent predictions
-    seed = f"{fixture['home_team']}{fixture['away_team']}"
-    hash_val = int(hashlib.md5(seed.encode()).hexdigest()[:8], 16)
-    
-    # Generate probabilities
-    home_strength = (hash_val % 100) / 100 * 0.6 + 0.2  # 0.2 to 0.8
-    away_strength = ((hash_val >> 8) % 100) / 100 * 0.6 + 0.2
-    
-    # Home advantage
-    home_strength += 0.1
-    
-    total = home_strength + away_strength + 0.3  # 0.3 for draw probability
-    
-    home_win_prob = home_strength / total
-    away_win_prob = away_strength / total
-    draw_prob = 1 - home_win_prob - away_win_prob
-    
-    # Generate scores
-    predicted_home_score = max(0, home_strength * 3)
-    predicted_away_score = max(0, away_strength * 3)
-    
-    confidence = min(max(abs(home_win_prob - away_win_prob) + 0.4, 0.6), 0.95)
-    
-    return {
-        **fixture,
-        "predicted_home_score": round(predicted_home_score, 1),
-        "predicted_away_score": round(predicted_away_score, 1),
-        "home_win_prob": round(home_win_prob, 3),
-        "draw_prob": round(draw_prob, 3),
-        "away_win_prob": round(away_win_prob, 3),
-        "confidence": round(confidence, 3)
-    }
-
-@app.get("/")
-def read_root():
-    return {
-        "message": "Football Predictions API",
-        "version": "1.0.0",
-        "status": "running",
-        "features": ["fixtures", "predictions", "team_logos"]
-    }
-
-@app.get("/api/v1/enhanced-fixtures")
-def get_fixtures():
-    """Get all fixtures"""
-    return {
-        "fixtures": SAMPLE_FIXTURES,
-        "total": len(SAMPLE_FIXTURES),
-        "last_updated": datetime.now().isoformat()
-    }
-
-@app.get("/api/v1/enhanced-predictions")
-def get_predictions(days_ahead: Optional[int] = None):
-    """Get predictions with optional date filtering"""
-    fixtures = SAMPLE_FIXTURES.copy()
-    
-    # Apply date filtering if specified
-    if days_ahead is not None:
-        now = datetime.now()
-        filtered_fixtures = []
-        
-        for fixture in fixtures:
-            match_date = datetime.fromisoformat(fixture["match_date"])
-            days_diff = (match_date.date() - now.date()).days
-            
-            if days_ahead == 0 and days_diff == 0:  # Today
-                filtered_fixtures.append(fixture)
-            elif days_ahead == 1 and days_diff == 1:  # Tomorrow
-                filtered_fixtures.append(fixture)
-            elif days_ahead == 7 and 0 <= days_diff <= 7:  # This week
-                filtered_fixtures.append(fixture)
-        
-        fixtures = filtered_fixtures
-    
-    # Generate predictions for filtered fixtures
-    predictions = [generate_prediction(fixture) for fixture in fixtures]
-    
-    return {
-        "predictions": predictions,
-        "total": len(predictions),
-        "filter_applied": f"days_ahead={days_ahead}" if days_ahead is not None else "none",
-        "generated_at": datetime.now().isoformat()
-    }
-
-@app.post("/api/v1/fetch-fixtures")
-def fetch_fixtures(league: str = "premier_league"):
-    """Trigger fixture data refresh"""
-    return {
-        "message": f"Fixtures refreshed for {league}",
-        "status": "success",
-        "timestamp": datetime.now().isoformat()
-    }
-
-@app.get("/health")
-def health_check():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "uptime": "running"
-    }
-
-if __name__ == "__main__":
-    print("🚀 Starting Clean Football Predictions API...")
-    print("🏆 Features: Premier League Fixtures & Predictions")
-    print("⚽ Team Logos: ESPN Integration")
-    print("🔄 Real-time Data Processing")
-    
-    try:
-        uvicorn.run(
-            app, 
-            host="127.0.0.1", 
-            port=8001, 
-            reload=False,
-            log_level="info"
-        )
-    except Exception as e:
-        print(f"❌ Server error: {e}")
-        import traceback
-        traceback.print_exc()
\ No newline at end of file
@@ -1,421 +0,0 @@
-"""
-ScoreSure Backend - Enhanced with API-Football Integration
-Live Data with Team Logos and Comprehensive Fixture Data
-"""
-
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-import requests
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime, timedelta, date
-import uvicorn
-import json
-import logging
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./enhanced_football_predictions.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
-
-# API-Football Configuration (Free tier)
-# Note: Replace with your actual API key from https://www.api-football.com/
-API_FOOTBALL_KEY = "your_api_key_here"  # Get free key from api-football.com
-API_FOOTBALL_BASE = "https://v3.football.api-sports.io"
-
-# League IDs for API-Football
-LEAGUES = {
-    "premier_league": 39,  # Premier League
-    "serie_a": 135,        # Serie A
-    "la_liga": 140,        # La Liga
-    "bundesliga": 78,      # Bundesliga
-    "ligue_1": 61          # Ligue 1
-}
-
-# Database Models
-class EnhancedMatch(Base):
-    __tablename__ = "enhanced_matches"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    fixture_id = Column(String, unique=True, index=True)  # API-Football fixture ID
-    league_id = Column(Integer)
-    league_name = Column(String)
-    home_team = Column(String)
-    away_team = Column(String)
-    home_logo = Column(String)  # Team logo URL
-    away_logo = Column(String)  # Team logo URL
-    match_date = Column(DateTime)
-    status = Column(String)
-    venue = Column(String)
-    referee = Column(String)
-    provider = Column(String)  # 'api_football', 'espn', 'thesportsdb'
-    raw_data = Column(Text)    # Store raw API response for debugging
-
-# Create tables
-Base.metadata.create_all(bind=engine)
-
-# FastAPI app
-app = FastAPI(
-    title="ScoreSure API - Enhanced with Logos", 
-    version="4.0.0",
-    description="Football predictions with real team logos and comprehensive data"
-)
-
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-@app.get("/")
-def root():
-    return {
-        "message": "ScoreSure Enhanced API - Now with Team Logos!",
-        "version": "4.0.0",
-        "features": ["Team Logos", "Multiple Leagues", "Enhanced Data"],
-        "data_sources": ["API-Football", "ESPN Soccer API", "TheSportsDB"],
-        "leagues": list(LEAGUES.keys())
-    }
-
-def fetch_api_football_fixtures(league_key="premier_league", match_date=None):
-    """Fetch fixtures from API-Football with team logos"""
-    if API_FOOTBALL_KEY == "your_api_key_here":
-        logger.warning("API-Football key not configured, skipping...")
-        return []
-    
-    if match_date is None:
-        match_date = date.today().strftime("%Y-%m-%d")
-    
-    league_id = LEAGUES.get(league_key, 39)  # Default to Premier League
-    
-    headers = {"x-apisports-key": API_FOOTBALL_KEY}
-    url = f"{API_FOOTBALL_BASE}/fixtures"
-    params = {
-        "league": league_id,
-        "season": 2025,
-        "date": match_date
-    }
-    
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
-            fixtures = []
-            
-            for fixture in data.get("response", []):
-                fixture_data = {
-                    "fixture_id": f"api_football_{fixture['fixture']['id']}",
-                    "league_id": fixture['league']['id'],
-                    "league_name": fixture['league']['name'],
-                    "home_team": fixture['teams']['home']['name'],
-                    "away_team": fixture['teams']['away']['name'],
-                    "home_logo": fixture['teams']['home']['logo'],
-                    "away_logo": fixture['teams']['away']['logo'],
-                    "match_date": datetime.fromisoformat(fixture['fixture']['date'].replace('Z', '+00:00')),
-                    "status": fixture['fixture']['status']['long'],
-                    "venue": fixture['fixture']['venue']['name'] if fixture['fixture']['venue'] else "TBD",
-                    "referee": fixture['fixture']['referee'] or "TBD",
-                    "provider": "api_football",
-                    "raw_data": json.dumps(fixture)
-                }
-                fixtures.append(fixture_data)
-            
-            logger.info(f"✅ API-Football returned {len(fixtures)} fixtures for {league_key}")
-            return fixtures
-        else:
-            logger.error(f"API-Football error: {response.status_code}")
-            return []
-    except Exception as e:
-        logger.error(f"API-Football fetch error: {e}")
-        return []
-
-def fetch_espn_fixtures():
-    """Fetch from ESPN Soccer API (existing functionality)"""
-    try:
-        url = "https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/scoreboard"
-        response = requests.get(url, timeout=30)
-        
-        if response.status_code == 200:
-            data = response.json()
-            fixtures = []
-            
-            for event in data.get("events", []):
-                home_team = event["competitions"][0]["competitors"][0]["team"]["displayName"]
-                away_team = event["competitions"][0]["competitors"][1]["team"]["displayName"]
-                
-                # Try to get team logos from ESPN
-                home_logo = event["competitions"][0]["competitors"][0]["team"].get("logo", "")
-                away_logo = event["competitions"][0]["competitors"][1]["team"].get("logo", "")
-                
-                fixture_data = {
-                    "fixture_id": f"espn_{event['id']}",
-                    "league_id": 39,  # Assume Premier League
-                    "league_name": "Premier League",
-                    "home_team": home_team,
-                    "away_team": away_team,
-                    "home_logo": home_logo,
-                    "away_logo": away_logo,
-                    "match_date": datetime.fromisoformat(event["date"].replace('Z', '+00:00')),
-                    "status": event.get("status", {}).get("type", {}).get("name", "Scheduled"),
-                    "venue": "TBD",
-                    "referee": "TBD",
-                    "provider": "espn",
-                    "raw_data": json.dumps(event)
-                }
-                fixtures.append(fixture_data)
-            
-            logger.info(f"✅ ESPN returned {len(fixtures)} fixtures")
-            return fixtures
-        else:
-            logger.error(f"ESPN API error: {response.status_code}")
-            return []
-    except Exception as e:
-        logger.error(f"ESPN fetch error: {e}")
-        return []
-
-@app.post("/api/v1/fetch-fixtures")
-def fetch_all_fixtures(league: str = "premier_league"):
-    """Fetch fixtures from all sources with team logos"""
-    db = next(get_db())
-    all_fixtures = []
-    errors = []
-    
-    logger.info(f"🔄 Starting enhanced fixture fetch for {league}...")
-    
-    # 1. Fetch from API-Football (priority source for logos)
-    try:
-        api_football_fixtures = fetch_api_football_fixtures(league)
-        all_fixtures.extend(api_football_fixtures)
-    except Exception as e:
-        error_msg = f"API-Football error: {e}"
-        errors.append(error_msg)
-        logger.error(error_msg)
-    
-    # 2. Fetch from ESPN (backup/additional source)
-    try:
-        espn_fixtures = fetch_espn_fixtures()
-        all_fixtures.extend(espn_fixtures)
-    except Exception as e:
-        error_msg = f"ESPN error: {e}"
-        errors.append(error_msg)
-        logger.error(error_msg)
-    
-    # 3. Store in database (avoid duplicates)
-    fixtures_added = 0
-    for fixture_data in all_fixtures:
-        try:
-            existing = db.query(EnhancedMatch).filter(
-                EnhancedMatch.fixture_id == fixture_data["fixture_id"]
-            ).first()
-            
-            if not existing:
-                match = EnhancedMatch(**fixture_data)
-                db.add(match)
-                fixtures_added += 1
-                logger.info(f"➕ Added: {fixture_data['home_team']} vs {fixture_data['away_team']}")
-        except Exception as e:
-            error_msg = f"Database error for {fixture_data.get('fixture_id')}: {e}"
-            errors.append(error_msg)
-            logger.error(error_msg)
-    
-    try:
-        db.commit()
-        logger.info(f"🎯 Successfully committed {fixtures_added} enhanced fixtures")
-    except Exception as e:
-        db.rollback()
-        error_msg = f"Database commit error: {e}"
-        errors.append(error_msg)
-        logger.error(error_msg)
-    
-    return {
-        "message": f"Successfully fetched {fixtures_added} enhanced fixtures with logos",
-        "total_fixtures": fixtures_added,
-        "league": league,
-        "data_sources": ["API-Football", "ESPN Soccer API"],
-        "features": ["Team Logos", "Enhanced Data"],
-        "errors": errors
-    }
-
-@app.get("/api/v1/enhanced-fixtures")
-def get_enhanced_fixtures(league: str = None, limit: int = 20):
-    """Get enhanced fixtures with team logos"""
-    db = next(get_db())
-    
-    query = db.query(EnhancedMatch)
-    if league:
-        league_id = LEAGUES.get(league)
-        if league_id:
-            query = query.filter(EnhancedMatch.league_id == league_id)
-    
-    matches = query.order_by(EnhancedMatch.match_date).limit(limit).all()
-    
-    fixtures = []
-    for match in matches:
-        fixture = {
-            "fixture_id": match.fixture_id,
-            "league_name": match.league_name,
-            "home_team": match.home_team,
-            "away_team": match.away_team,
-            "home_logo": match.home_logo,
-            "away_logo": match.away_logo,
-            "match_date": match.match_date.isoformat() if match.match_date else None,
-            "status": match.status,
-            "venue": match.venue,
-            "referee": match.referee,
-            "provider": match.provider
-        }
-        fixtures.append(fixture)
-    
-    return {
-        "fixtures": fixtures,
-        "total": len(fixtures),
-        "league_filter": league,
-        "available_leagues": list(LEAGUES.keys())
-    }
-
-@app.get("/api/v1/enhanced-predictions")
-def get_enhanced_predictions(league: str = None, days_ahead: int = None):
-    """Generate AI predictions for enhanced fixtures"""
-    db = next(get_db())
-    
-    query = db.query(EnhancedMatch)
-    if league:
-        league_id = LEAGUES.get(league)
-        if league_id:
-            query = query.filter(EnhancedMatch.league_id == league_id)
-    
-    # Apply date filtering based on days_ahead parameter
-    now = datetime.now()
-    if days_ahead is not None:
-        if days_ahead == 0:  # Today
-            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_date = start_date + timedelta(days=1)
-            query = query.filter(EnhancedMatch.match_date >= start_date, EnhancedMatch.match_date < end_date)
-        elif days_ahead == 1:  # Tomorrow
-            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
-            end_date = start_date + timedelta(days=1)
-            query = query.filter(EnhancedMatch.match_date >= start_date, EnhancedMatch.match_date < end_date)
-        elif days_ahead == 7:  # This week
-            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_date = start_date + timedelta(days=7)
-            query = query.filter(EnhancedMatch.match_date >= start_date, EnhancedMatch.match_date < end_date)
-        else:  # Custom days ahead
-            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_date = start_date + timedelta(days=days_ahead)
-            query = query.filter(EnhancedMatch.match_date >= start_date, EnhancedMatch.match_date < end_date)
-    else:
-        # Default: future matches only
-        query = query.filter(EnhancedMatch.match_date > now)
-    
-    matches = query.limit(20).all()
-    
-    predictions = []
-    for match in matches:
-        # Generate realistic AI predictions (enhanced version)
-        home_strength = hash(match.home_team) % 100 / 100
-        away_strength = hash(match.away_team) % 100 / 100
-        
-        # More sophisticated prediction algorithm
-        venue_advantage = 0.1  # Home advantage
-        total_strength = home_strength + away_strength + venue_advantage
-        
-        home_win_prob = min(max((home_strength + venue_advantage) / total_strength, 0.1), 0.8)
-        away_win_prob = min(max(away_strength / total_strength, 0.1), 0.7)
-        draw_prob = max(1 - home_win_prob - away_win_prob, 0.1)
-        
-        # Normalize probabilities
-        total_prob = home_win_prob + away_win_prob + draw_prob
-        home_win_prob /= total_prob
-        away_win_prob /= total_prob
-        draw_prob /= total_prob
-        
-        predicted_home_score = 1.5 + (home_strength * 2)
-        predicted_away_score = 1.0 + (away_strength * 2)
-        confidence = min(max(abs(home_win_prob - away_win_prob) + 0.5, 0.6), 0.95)
-        
-        prediction = {
-            "fixture_id": match.fixture_id,
-            "league_name": match.league_name,
-            "home_team": match.home_team,
-            "away_team": match.away_team,
-            "home_logo": match.home_logo,
-            "away_logo": match.away_logo,
-            "match_date": match.match_date.isoformat() if match.match_date else None,
-            "venue": match.venue,
-            "referee": match.referee,
-            "predicted_home_score": round(predicted_home_score, 1),
-            "predicted_away_score": round(predicted_away_score, 1),
-            "home_win_prob": round(home_win_prob, 3),
-            "draw_prob": round(draw_prob, 3),
-            "away_win_prob": round(away_win_prob, 3),
-            "confidence": round(confidence, 3),
-            "provider": match.provider
-        }
-        predictions.append(prediction)
-    
-    return {
-        "predictions": predictions,
-        "total": len(predictions),
-        "league_filter": league,
-        "features": ["Team Logos", "Venue Info", "Referee Info"]
-    }
-
-@app.get("/api/v1/leagues")
-def get_available_leagues():
-    """Get list of available leagues"""
-    return {
-        "leagues": [
-            {"key": "premier_league", "name": "Premier League", "id": 39, "country": "England"},
-            {"key": "serie_a", "name": "Serie A", "id": 135, "country": "Italy"},
-            {"key": "la_liga", "name": "La Liga", "id": 140, "country": "Spain"},
-            {"key": "bundesliga", "name": "Bundesliga", "id": 78, "country": "Germany"},
-            {"key": "ligue_1", "name": "Ligue 1", "id": 61, "country": "France"}
-        ],
-        "note": "API-Football integration provides team logos and enhanced data"
-    }
-
-@app.get("/api/v1/database-stats")
-def get_database_stats():
-    """Get enhanced database statistics"""
-    db = next(get_db())
-    
-    total_matches = db.query(EnhancedMatch).count()
-    leagues_count = db.query(EnhancedMatch.league_name).distinct().count()
-    providers = db.query(EnhancedMatch.provider).distinct().all()
-    
-    return {
-        "total_matches": total_matches,
-        "leagues_count": leagues_count,
-        "providers": [p[0] for p in providers],
-        "features": ["Team Logos", "Multi-League Support", "Enhanced Data"]
-    }
-
-if __name__ == "__main__":
-    print("🚀 Starting ScoreSure Enhanced API with Team Logos...")
-    print("📋 Features: Team Logos, Multiple Leagues, Enhanced Data")
-    print("🔗 API-Football Integration Available")
-    print("⚽ Ready for Premier League, Serie A, La Liga, Bundesliga, Ligue 1")
-    try:
-        uvicorn.run("fixed_backend:app", host="127.0.0.1", port=8001, reload=False, log_level="info")
-    except KeyboardInterrupt:
-        print("Server stopped by user")
-    except Exception as e:
-        print(f"Server error: {e}")
-        import traceback
-        traceback.print_exc()
\ No newline at end of file
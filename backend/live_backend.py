@@ -1,340 +0,0 @@
-"""
-ScoreSure Backend - LIVE REAL DATA ONLY
-Football prediction API with REAL external data sources
-"""
-
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-import requests
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, JSON
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime, timedelta
-import uvicorn
-import json
-
-# Database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./live_predictor.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
-
-# Database Models
-class Match(Base):
-    __tablename__ = "matches"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    provider_id = Column(String, unique=True, index=True)
-    league = Column(String)
-    home = Column(String)
-    away = Column(String)
-    kickoff = Column(DateTime)
-    status = Column(String)
-    source = Column(String)  # 'ESPN' or 'TheSportsDB'
-    raw_data = Column(Text)  # Store raw API response
-
-# Create tables
-Base.metadata.create_all(bind=engine)
-
-# FastAPI app
-app = FastAPI(
-    title="ScoreSure API - LIVE REAL DATA",
-    description="Football predictions with REAL LIVE external data",
-    version="3.0.0"
-)
-
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-@app.get("/")
-def read_root():
-    return {
-        "message": "ScoreSure API - LIVE REAL DATA ONLY",
-        "status": "OPERATIONAL",
-        "data_sources": ["ESPN Soccer API", "TheSportsDB API"],
-        "live_data": True,
-        "version": "3.0.0",
-        "description": "Real live football data from external APIs"
-    }
-
-@app.get("/api/v1/predictions")
-def get_predictions():
-    """Get AI predictions for real upcoming matches"""
-    db = SessionLocal()
-    try:
-        matches = db.query(Match).order_by(Match.kickoff).limit(20).all()
-        
-        if not matches:
-            return {
-                "predictions": [],
-                "message": "No live matches available. Fetching from external APIs...",
-                "live_data": True
-            }
-        
-        predictions = []
-        for match in matches:
-            # Generate realistic predictions based on team names
-            home_strength = hash(match.home) % 100 / 100.0
-            away_strength = hash(match.away) % 100 / 100.0
-            
-            # Calculate probabilities
-            total_strength = home_strength + away_strength + 0.5  # 0.5 for draw factor
-            home_win_prob = (home_strength + 0.1) / total_strength  # Home advantage
-            away_win_prob = away_strength / total_strength
-            draw_prob = 1.0 - home_win_prob - away_win_prob
-            
-            # Normalize probabilities
-            total_prob = home_win_prob + draw_prob + away_win_prob
-            home_win_prob /= total_prob
-            draw_prob /= total_prob 
-            away_win_prob /= total_prob
-            
-            # Generate realistic scores
-            home_goals = round(1.0 + home_strength * 2.5, 1)
-            away_goals = round(0.8 + away_strength * 2.5, 1)
-            
-            prediction = {
-                "match_id": match.id,
-                "home_team": match.home,
-                "away_team": match.away,
-                "match_date": match.kickoff.isoformat() if match.kickoff else None,
-                "league": match.league,
-                "predicted_home_score": home_goals,
-                "predicted_away_score": away_goals,
-                "home_win_prob": round(home_win_prob, 3),
-                "draw_prob": round(draw_prob, 3),
-                "away_win_prob": round(away_win_prob, 3),
-                "confidence": round(0.65 + (abs(home_strength - away_strength) * 0.3), 3),
-                "source": match.source,
-                "status": match.status
-            }
-            predictions.append(prediction)
-        
-        return {
-            "predictions": predictions,
-            "total_matches": len(predictions),
-            "live_data": True,
-            "sources": list(set([p["source"] for p in predictions]))
-        }
-    
-    finally:
-        db.close()
-
-@app.post("/api/v1/fetch-live-fixtures")
-def fetch_live_fixtures():
-    """Fetch REAL live fixtures from external APIs"""
-    db = SessionLocal()
-    total_added = 0
-    
-    try:
-        print("🔄 Fetching LIVE REAL DATA from external APIs...")
-        
-        # 1. ESPN Soccer API - Premier League
-        try:
-            print("📡 Fetching from ESPN Soccer API...")
-            response = requests.get(
-                "http://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/scoreboard",
-                timeout=15
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                events = data.get("events", [])
-                print(f"✅ ESPN: Found {len(events)} live Premier League matches")
-                
-                for event in events:
-                    try:
-                        event_id = event.get("id")
-                        provider_id = f"espn_{event_id}"
-                        
-                        # Check if already exists
-                        existing = db.query(Match).filter(Match.provider_id == provider_id).first()
-                        if existing:
-                            continue
-                            
-                        competitors = event.get("competitions", [{}])[0].get("competitors", [])
-                        if len(competitors) >= 2:
-                            home_team = competitors[0].get("team", {}).get("displayName", "Unknown")
-                            away_team = competitors[1].get("team", {}).get("displayName", "Unknown")
-                            match_date = event.get("date", "")
-                            status = event.get("status", {}).get("type", {}).get("description", "Scheduled")
-                            
-                            # Parse kickoff time
-                            kickoff = None
-                            if match_date:
-                                try:
-                                    kickoff = datetime.fromisoformat(match_date.replace("Z", "+00:00"))
-                                except:
-                                    pass
-                            
-                            # Create match record
-                            match = Match(
-                                provider_id=provider_id,
-                                league="Premier League",
-                                home=home_team,
-                                away=away_team,
-                                kickoff=kickoff,
-                                status=status,
-                                source="ESPN",
-                                raw_data=json.dumps(event)
-                            )
-                            
-                            db.add(match)
-                            total_added += 1
-                            print(f"✅ Added: {home_team} vs {away_team} ({status})")
-                            
-                    except Exception as e:
-                        print(f"❌ Error processing ESPN event: {e}")
-                        continue
-            else:
-                print(f"❌ ESPN API error: {response.status_code}")
-                
-        except Exception as e:
-            print(f"❌ ESPN connection error: {e}")
-        
-        # 2. TheSportsDB API - Multiple leagues
-        try:
-            print("📡 Fetching from TheSportsDB API...")
-            
-            # Premier League and other English leagues
-            league_ids = {
-                "133604": "Premier League",
-                "4328": "Championship", 
-                "4329": "League One",
-                "4330": "League Two"
-            }
-            
-            for league_id, league_name in league_ids.items():
-                try:
-                    response = requests.get(
-                        f"https://www.thesportsdb.com/api/v1/json/3/eventsnext.php?id={league_id}",
-                        timeout=15
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        events = data.get("events", [])
-                        print(f"✅ TheSportsDB: Found {len(events)} matches in {league_name}")
-                        
-                        for event in events[:10]:  # Limit per league
-                            try:
-                                event_id = event.get("idEvent")
-                                provider_id = f"tsdb_{event_id}"
-                                
-                                # Check if already exists
-                                existing = db.query(Match).filter(Match.provider_id == provider_id).first()
-                                if existing:
-                                    continue
-                                
-                                home_team = event.get("strHomeTeam", "Unknown")
-                                away_team = event.get("strAwayTeam", "Unknown")
-                                event_date = event.get("dateEvent", "")
-                                event_time = event.get("strTime", "15:00:00")
-                                
-                                # Parse kickoff time
-                                kickoff = None
-                                if event_date:
-                                    try:
-                                        match_datetime = f"{event_date}T{event_time}"
-                                        kickoff = datetime.fromisoformat(match_datetime)
-                                    except:
-                                        pass
-                                
-                                # Create match record
-                                match = Match(
-                                    provider_id=provider_id,
-                                    league=league_name,
-                                    home=home_team,
-                                    away=away_team,
-                                    kickoff=kickoff,
-                                    status="Scheduled",
-                                    source="TheSportsDB",
-                                    raw_data=json.dumps(event)
-                                )
-                                
-                                db.add(match)
-                                total_added += 1
-                                print(f"✅ Added: {home_team} vs {away_team} ({league_name})")
-                                
-                            except Exception as e:
-                                print(f"❌ Error processing TheSportsDB event: {e}")
-                                continue
-                    else:
-                        print(f"❌ TheSportsDB error for {league_name}: {response.status_code}")
-                        
-                except Exception as e:
-                    print(f"❌ TheSportsDB error for {league_name}: {e}")
-                    
-        except Exception as e:
-            print(f"❌ TheSportsDB connection error: {e}")
-        
-        # Commit all changes (handle constraint violations gracefully)
-        try:
-            db.commit()
-            print(f"🎯 Successfully added {total_added} LIVE real matches to database")
-        except Exception as commit_error:
-            print(f"⚠️ Some duplicates encountered during commit: {commit_error}")
-            db.rollback()
-            
-            # Try to commit individual records to avoid losing all data
-            db.commit()
-        
-        # Get final count from database
-        total_in_db = db.query(Match).count()
-        
-        return {
-            "success": True,
-            "message": f"Successfully fetched LIVE real fixtures (total in DB: {total_in_db})",
-            "total_matches": total_in_db,
-            "sources": ["ESPN Soccer API", "TheSportsDB API"],
-            "live_data": True
-        }
-        
-    except Exception as e:
-        print(f"❌ Fetch error: {e}")
-        db.rollback()
-        return {
-            "success": False,
-            "error": f"Failed to fetch live fixtures: {str(e)}"
-        }
-    finally:
-        db.close()
-
-@app.get("/api/v1/database-stats")
-def get_database_stats():
-    """Get live database statistics"""
-    db = SessionLocal()
-    try:
-        total_matches = db.query(Match).count()
-        espn_matches = db.query(Match).filter(Match.source == "ESPN").count()
-        tsdb_matches = db.query(Match).filter(Match.source == "TheSportsDB").count()
-        upcoming_matches = db.query(Match).filter(
-            Match.kickoff >= datetime.now()
-        ).count()
-        
-        return {
-            "total_matches": total_matches,
-            "espn_matches": espn_matches,
-            "thesportsdb_matches": tsdb_matches,
-            "upcoming_matches": upcoming_matches,
-            "live_data": True
-        }
-    finally:
-        db.close()
-
-@app.get("/health")
-def health_check():
-    return {
-        "status": "healthy", 
-        "live_data": True,
-        "external_apis": ["ESPN", "TheSportsDB"]
-    }
-
-if __name__ == "__main__":
-    uvicorn.run("live_backend:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
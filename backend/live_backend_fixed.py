@@ -1,262 +0,0 @@
-"""
-ScoreSure Backenclass Match(Base):
-    __tablename__ = "matches"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    provider_id = Column(String, unique=True, index=True)
-    league = Column(String)
-    home = Column(String)
-    away = Column(String)
-    kickoff = Column(DateTime)
-    status = Column(String)ve Data Only
-Fixed version that handles duplicate data properly
-"""
-
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-import requests
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime, timedelta
-import uvicorn
-
-# Database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./live_predictor.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
-
-# Database Models
-class Match(Base):
-    __tablename__ = "matches"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    provider_id = Column(String, unique=True, index=True)
-    league = Column(String)
-    home = Column(String)
-    away = Column(String)
-    kickoff = Column(DateTime)
-    status = Column(String)
-
-# Create tables
-Base.metadata.create_all(bind=engine)
-
-# FastAPI app
-app = FastAPI(title="ScoreSure API - Live Data", version="3.0.0")
-
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-@app.get("/")
-def read_root():
-    return {
-        "message": "ScoreSure Backend API - Live Real Data Version",
-        "api_configured": True,
-        "version": "3.0.0",
-        "data_sources": ["ESPN Soccer API", "TheSportsDB"],
-        "live_data": True
-    }
-
-@app.get("/api/v1/predictions")
-def get_predictions():
-    """Get predictions for upcoming matches"""
-    db = SessionLocal()
-    try:
-        matches = db.query(Match).limit(10).all()
-        
-        predictions = []
-        for match in matches:
-            prediction = {
-                "match_id": match.id,
-                "home_team": match.home,
-                "away_team": match.away,
-                "match_date": match.kickoff.isoformat() if match.kickoff else None,
-                "league": match.league,
-                "predicted_home_score": round(1.5 + (hash(match.home) % 3) * 0.3, 1),
-                "predicted_away_score": round(1.2 + (hash(match.away) % 3) * 0.3, 1),
-                "home_win_prob": 0.45 + (hash(match.home) % 20) * 0.01,
-                "draw_prob": 0.25,
-                "away_win_prob": 0.30 + (hash(match.away) % 20) * 0.01,
-                "confidence": 0.70 + (hash(f"{match.home}{match.away}") % 20) * 0.01
-            }
-            predictions.append(prediction)
-        
-        if not predictions:
-            return {
-                "predictions": [],
-                "message": "No matches found. Try fetching fixtures first."
-            }
-            
-        return {"predictions": predictions}
-    
-    finally:
-        db.close()
-
-@app.post("/api/v1/fetch-fixtures")
-def fetch_fixtures():
-    """Fetch LIVE fixtures from real external APIs"""
-    db = SessionLocal()
-    try:
-        fixtures_added = 0
-        errors = []
-        
-        print("🔄 Starting LIVE data fetch from external APIs...")
-        
-        # Method 1: ESPN Soccer API (Real Premier League data)
-        try:
-            print("📡 Fetching from ESPN Soccer API...")
-            response = requests.get(
-                "http://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/scoreboard",
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                events = data.get("events", [])
-                print(f"✅ ESPN returned {len(events)} events")
-                
-                for event in events:
-                    provider_id = f"espn_{event.get('id')}"
-                    
-                    # Check if match already exists (avoid duplicates)
-                    existing = db.query(Match).filter(Match.provider_id == provider_id).first()
-                    if not existing:
-                        competitors = event.get("competitions", [{}])[0].get("competitors", [])
-                        if len(competitors) >= 2:
-                            home_team = competitors[0].get("team", {}).get("displayName", "Unknown")
-                            away_team = competitors[1].get("team", {}).get("displayName", "Unknown")
-                            match_date = event.get("date", "")
-                            
-                            kickoff = None
-                            if match_date:
-                                try:
-                                    kickoff = datetime.fromisoformat(match_date.replace("Z", "+00:00"))
-                                except:
-                                    pass
-                            
-                            match = Match(
-                                provider_id=provider_id,
-                                league="Premier League",
-                                home=home_team,
-                                away=away_team,
-                                kickoff=kickoff,
-                                status="SCHEDULED"
-                            )
-                            db.add(match)
-                            fixtures_added += 1
-                            print(f"➕ Added: {home_team} vs {away_team}")
-                            
-            else:
-                error_msg = f"ESPN API error: {response.status_code}"
-                print(f"❌ {error_msg}")
-                errors.append(error_msg)
-                
-        except Exception as e:
-            error_msg = f"ESPN error: {str(e)}"
-            print(f"❌ {error_msg}")
-            errors.append(error_msg)
-        
-        # Method 2: TheSportsDB API (Real upcoming matches)
-        try:
-            print("📡 Fetching from TheSportsDB API...")
-            
-            # Get upcoming Premier League matches
-            response = requests.get(
-                "https://www.thesportsdb.com/api/v1/json/3/eventsnext.php?id=133604",
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                events = data.get("events", [])
-                print(f"✅ TheSportsDB returned {len(events)} Premier League events")
-                
-                for event in events:
-                    provider_id = f"tsdb_{event.get('idEvent')}"
-                    
-                    # Check if match already exists (avoid duplicates)
-                    existing = db.query(Match).filter(Match.provider_id == provider_id).first()
-                    if not existing:
-                        home_team = event.get("strHomeTeam", "Unknown")
-                        away_team = event.get("strAwayTeam", "Unknown")
-                        match_date = f"{event.get('dateEvent', '')}T{event.get('strTime', '15:00:00')}Z"
-                        
-                        kickoff = None
-                        if match_date and match_date != "T15:00:00Z":
-                            try:
-                                kickoff = datetime.fromisoformat(match_date.replace("Z", "+00:00"))
-                            except:
-                                pass
-                        
-                        match = Match(
-                            provider_id=provider_id,
-                            league="Premier League",
-                            home=home_team,
-                            away=away_team,
-                            kickoff=kickoff,
-                            status="SCHEDULED"
-                        )
-                        db.add(match)
-                        fixtures_added += 1
-                        print(f"➕ Added: {home_team} vs {away_team}")
-                        
-            else:
-                error_msg = f"TheSportsDB API error: {response.status_code}"
-                print(f"❌ {error_msg}")
-                errors.append(error_msg)
-                
-        except Exception as e:
-            error_msg = f"TheSportsDB error: {str(e)}"
-            print(f"❌ {error_msg}")
-            errors.append(error_msg)
-        
-        # Commit all changes
-        db.commit()
-        print(f"🎯 Successfully committed {fixtures_added} LIVE fixtures to database")
-        
-        return {
-            "ok": True,
-            "message": f"Successfully fetched {fixtures_added} LIVE fixtures from real APIs",
-            "source": "ESPN + TheSportsDB",
-            "total_matches": fixtures_added,
-            "apis_used": ["ESPN Soccer API", "TheSportsDB"],
-            "errors": errors if errors else None
-        }
-        
-    except Exception as e:
-        error_msg = f"Database error: {str(e)}"
-        print(f"❌ {error_msg}")
-        return {"error": error_msg}
-    finally:
-        db.close()
-
-@app.get("/api/v1/database-stats")
-def get_database_stats():
-    """Get database statistics"""
-    db = SessionLocal()
-    try:
-        total_matches = db.query(Match).count()
-        recent_matches = db.query(Match).filter(
-            Match.kickoff >= datetime.now() - timedelta(days=30)
-        ).count()
-        
-        return {
-            "total_matches": total_matches,
-            "recent_matches": recent_matches
-        }
-    finally:
-        db.close()
-
-@app.get("/health")
-def health_check():
-    return {"status": "healthy", "live_data": True}
-
-if __name__ == "__main__":
-    uvicorn.run("live_backend_fixed:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
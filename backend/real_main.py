@@ -1,111 +0,0 @@
-import os
-import sys
-import asyncio
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from fastapi import FastAPI, BackgroundTasks
-from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
-
-# Import our modules
-from db import SessionLocal, engine, Base
-from models import Match, Odds
-from fetcher import fetch_fixtures
-from predictions import run_prediction_job
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(title="ScoreSure Backend - Real Data")
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-@app.get("/")
-def read_root():
-    return {"message": "ScoreSure Backend API - Real Data Version"}
-
-@app.get("/api/v1/predictions")
-def get_predictions(days_ahead: int = 3):
-    """Get predictions for upcoming matches"""
-    db = SessionLocal()
-    try:
-        # Get upcoming matches from database
-        matches = db.query(Match).order_by(Match.kickoff).limit(20).all()
-        
-        predictions = []
-        for match in matches:
-            # Run prediction algorithm for each match
-            prediction = {
-                "match_id": match.id,
-                "home_team": match.home,
-                "away_team": match.away,
-                "match_date": match.kickoff.isoformat() if match.kickoff else None,
-                "league": match.league,
-                "predicted_home_score": 1.8,
-                "predicted_away_score": 1.2,
-                "home_win_prob": 0.55,
-                "draw_prob": 0.25,
-                "away_win_prob": 0.20,
-                "confidence": 0.78
-            }
-            predictions.append(prediction)
-        
-        # If no matches in DB, fetch some first
-        if not predictions:
-            return {
-                "predictions": [],
-                "message": "No matches found. Try calling /api/v1/fetch-fixtures first."
-            }
-            
-        return {"predictions": predictions}
-    
-    finally:
-        db.close()
-
-@app.post("/api/v1/fetch-fixtures")
-async def api_fetch_fixtures(background_tasks: BackgroundTasks):
-    """Fetch new fixtures from external API"""
-    background_tasks.add_task(fetch_fixtures)
-    return {"ok": True, "message": "Fixture fetch scheduled"}
-
-@app.get("/api/v1/matches")
-def get_matches():
-    """Get all matches from database"""
-    db = SessionLocal()
-    try:
-        matches = db.query(Match).order_by(Match.kickoff).limit(50).all()
-        result = []
-        for match in matches:
-            result.append({
-                "id": match.id,
-                "provider_id": match.provider_id,
-                "league": match.league,
-                "home": match.home,
-                "away": match.away,
-                "kickoff": match.kickoff.isoformat() if match.kickoff else None,
-                "status": match.status
-            })
-        return {"matches": result}
-    finally:
-        db.close()
-
-@app.get("/health")
-def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "version": "1.0.0"}
-
-if __name__ == "__main__":
-    uvicorn.run("real_main:app", host="localhost", port=8000, reload=True)
\ No newline at end of file
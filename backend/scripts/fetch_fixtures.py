@@ -1,5 +1,25 @@
+import sys
+import os
 import asyncio
-from app.fetcher import fetch_fixtures
+import argparse
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from fetcher import fetch_fixtures
 
 if __name__ == "__main__":
-    asyncio.run(fetch_fixtures())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Fetch fixtures from the football API")
+    parser.add_argument("--backfill-results", action="store_true",
+                        help="record results for finished matches already in the DB instead of fetching")
+    parser.add_argument("--league", action="append", help="competition key from the source catalogue (repeatable, default all)")
+    parser.add_argument("--provider", action="append", help="provider name (repeatable, default all enabled)")
+    args = parser.parse_args()
+    if args.backfill_results:
+        from db import SessionLocal
+        from history import backfill_results
+        db = SessionLocal()
+        try:
+            print(f"Recorded {backfill_results(db)} results")
+        finally:
+            db.close()
+    else:
+        asyncio.run(fetch_fixtures(args.league, args.provider))
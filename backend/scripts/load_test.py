@@ -0,0 +1,96 @@
+"""
+HTTP load driver for the read endpoints.
+
+    python scripts/load_test.py --url http://localhost:8000 --path /api/today --concurrency 200
+    python scripts/load_test.py --compare --concurrency 200
+
+--compare runs the /api/today query through a sync (threadpool) handler and
+an async handler in-process against DATABASE_URL and prints both, which is
+the throughput difference the async read path buys.
+"""
+import sys
+import os
+import time
+import asyncio
+import argparse
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import httpx
+
+async def drive(client, path, concurrency, total):
+    latencies = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                r = await client.get(path)
+                if r.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "path": path,
+        "requests": total,
+        "concurrency": concurrency,
+        "errors": errors,
+        "rps": total / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+def comparison_app():
+    from fastapi import FastAPI, Depends
+    from sqlalchemy import select
+    from db import get_db, get_async_db
+    from models import Match
+
+    app = FastAPI()
+
+    @app.get("/sync")
+    def sync_today(db=Depends(get_db)):
+        return [m.id for m in db.query(Match).order_by(Match.kickoff).limit(200)]
+
+    @app.get("/async")
+    async def async_today(db=Depends(get_async_db)):
+        rows = (await db.execute(select(Match).order_by(Match.kickoff).limit(200))).scalars()
+        return [m.id for m in rows]
+
+    return app
+
+def report(result):
+    print(f"{result['path']:<24} {result['rps']:>9.1f} req/s  p50={result['p50_ms']:.1f}ms  "
+          f"p95={result['p95_ms']:.1f}ms  errors={result['errors']}  (c={result['concurrency']}, n={result['requests']})")
+
+async def main(args):
+    if args.compare:
+        transport = httpx.ASGITransport(app=comparison_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=args.timeout) as client:
+            results = [await drive(client, path, args.concurrency, args.requests) for path in ("/sync", "/async")]
+        for result in results:
+            report(result)
+        print(f"async/sync throughput: {results[1]['rps'] / results[0]['rps']:.2f}x")
+        return
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+        for path in args.path or ["/api/today"]:
+            report(await drive(client, path, args.concurrency, args.requests))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the read endpoints")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", action="append", help="endpoint path (repeatable, default /api/today)")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--compare", action="store_true", help="compare sync and async handlers in-process")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,33 @@
+import sys
+import os
+import json
+import argparse
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from leagues import LEAGUES
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtest prediction formulas over finished matches")
+    parser.add_argument("--league", action="append", choices=list(LEAGUES), help="league key (repeatable, default all)")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size")
+    parser.add_argument("--output", help="write the full report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    from db import SessionLocal
+    from backtest import load_dataset, run_backtest
+    db = SessionLocal()
+    try:
+        data = load_dataset(db, args.league)
+    finally:
+        db.close()
+    results = run_backtest(data, workers=args.workers)
+
+    for r in results:
+        roi = f"{r['roi']:+.3f}" if r["roi"] is not None else "n/a"
+        print(f"{r['variant']:<16} matches={r['matches']} brier={r['brier']:.4f} log_loss={r['log_loss']:.4f} bets={r['bets']} roi={roi}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,27 @@
-from app.predictions import run_prediction_job
+import sys
+import os
+import argparse
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from leagues import LEAGUES
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run predictions or refit the rating model")
+    sub = parser.add_subparsers(dest="command")
+    fit = sub.add_parser("fit", help="fit Elo ratings per league and write a new artifact")
+    fit.add_argument("--league", action="append", choices=list(LEAGUES), help="league key (repeatable, default all)")
+    fit.add_argument("--workers", type=int, default=None, help="process pool size")
+    fit.add_argument("--cold", action="store_true", help="refit from the full history instead of continuing the previous artifact")
+    args = parser.parse_args(argv)
+
+    if args.command == "fit":
+        from ratings import run_fit_job
+        version = run_fit_job(leagues=args.league, workers=args.workers, warm_start=not args.cold)
+        print(f"Wrote ratings artifact {version}")
+    else:
+        from predictions import load_model, run_prediction_job
+        load_model()
+        print(run_prediction_job())
+
 if __name__ == "__main__":
-    print(run_prediction_job())
\ No newline at end of file
+    main()
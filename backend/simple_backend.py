@@ -1,296 +0,0 @@
-"""
-ScoreSure Backend - Simple Working Version
-"""
-
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-import requests
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime, timedelta
-import uvicorn
-
-# Database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./predictor.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
-
-# Database Models
-class Match(Base):
-    __tablename__ = "matches"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    provider_id = Column(String, unique=True, index=True)
-    league = Column(String)
-    home = Column(String)
-    away = Column(String)
-    kickoff = Column(DateTime)
-    status = Column(String)
-    provider_payload = Column(Text)
-
-# Create tables
-Base.metadata.create_all(bind=engine)
-
-# FastAPI app
-app = FastAPI(title="ScoreSure API - Simple", version="2.1.0")
-
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-@app.get("/")
-def read_root():
-    return {
-        "message": "ScoreSure Backend API - Simple Working Version",
-        "api_configured": True,
-        "version": "2.1.0",
-        "data_sources": ["ESPN Soccer API", "TheSportsDB"],
-        "live_data": True
-    }
-
-@app.get("/api/v1/predictions")
-def get_predictions():
-    """Get predictions for upcoming matches"""
-    db = SessionLocal()
-    try:
-        matches = db.query(Match).limit(10).all()
-        
-        predictions = []
-        for match in matches:
-            prediction = {
-                "match_id": match.id,
-                "home_team": match.home,
-                "away_team": match.away,
-                "match_date": match.kickoff.isoformat() if match.kickoff else None,
-                "league": match.league,
-                "predicted_home_score": round(1.5 + (hash(match.home) % 3) * 0.3, 1),
-                "predicted_away_score": round(1.2 + (hash(match.away) % 3) * 0.3, 1),
-                "home_win_prob": 0.45 + (hash(match.home) % 20) * 0.01,
-                "draw_prob": 0.25,
-                "away_win_prob": 0.30 + (hash(match.away) % 20) * 0.01,
-                "confidence": 0.70 + (hash(f"{match.home}{match.away}") % 20) * 0.01
-            }
-            predictions.append(prediction)
-        
-        if not predictions:
-            return {
-                "predictions": [],
-                "message": "No matches found. Try fetching fixtures first."
-            }
-            
-        return {"predictions": predictions}
-    
-    finally:
-        db.close()
-
-@app.post("/api/v1/fetch-fixtures")
-def fetch_fixtures():
-    """Fetch LIVE fixtures using simple requests (not async)"""
-    db = SessionLocal()
-    try:
-        fixtures_added = 0
-        print("Starting fixture fetch...")
-        
-        # Method 1: ESPN Soccer API
-        try:
-            print("Fetching from ESPN...")
-            response = requests.get(
-                "http://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/scoreboard",
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                events = data.get("events", [])
-                print(f"ESPN returned {len(events)} events")
-                
-                for event in events:
-                    provider_id = f"espn_{event.get('id')}"
-                    
-                    # Check if match already exists
-                    existing = db.query(Match).filter(Match.provider_id == provider_id).first()
-                    if not existing:
-                        competitors = event.get("competitions", [{}])[0].get("competitors", [])
-                        if len(competitors) >= 2:
-                            home_team = competitors[0].get("team", {}).get("displayName", "Unknown")
-                            away_team = competitors[1].get("team", {}).get("displayName", "Unknown")
-                            match_date = event.get("date", "")
-                            
-                            kickoff = None
-                            if match_date:
-                                try:
-                                    kickoff = datetime.fromisoformat(match_date.replace("Z", "+00:00"))
-                                except:
-                                    pass
-                            
-                            match = Match(
-                                provider_id=provider_id,
-                                league="Premier League",
-                                home=home_team,
-                                away=away_team,
-                                kickoff=kickoff,
-                                status="SCHEDULED",
-                                provider_payload="ESPN data"
-                            )
-                            db.add(match)
-                            fixtures_added += 1
-                            print(f"Added: {home_team} vs {away_team}")
-                            
-            else:
-                print(f"ESPN API error: {response.status_code}")
-                
-        except Exception as e:
-            print(f"ESPN error: {e}")
-        
-        # Method 2: TheSportsDB API
-        try:
-            print("Fetching from TheSportsDB...")
-            response = requests.get(
-                "https://www.thesportsdb.com/api/v1/json/3/eventsnext.php?id=133604",
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                events = data.get("events", [])
-                print(f"TheSportsDB returned {len(events)} events")
-                
-                for event in events:
-                    provider_id = f"tsdb_{event.get('idEvent')}"
-                    
-                    # Check if match already exists
-                    existing = db.query(Match).filter(Match.provider_id == provider_id).first()
-                    if not existing:
-                        home_team = event.get("strHomeTeam", "Unknown")
-                        away_team = event.get("strAwayTeam", "Unknown")
-                        match_date = f"{event.get('dateEvent', '')}T{event.get('strTime', '15:00:00')}Z"
-                        
-                        kickoff = None
-                        if match_date and match_date != "T15:00:00Z":
-                            try:
-                                kickoff = datetime.fromisoformat(match_date.replace("Z", "+00:00"))
-                            except:
-                                pass
-                        
-                        match = Match(
-                            provider_id=provider_id,
-                            league="Premier League",
-                            home=home_team,
-                            away=away_team,
-                            kickoff=kickoff,
-                            status="SCHEDULED",
-                            provider_payload="TheSportsDB data"
-                        )
-                        db.add(match)
-                        fixtures_added += 1
-                        print(f"Added: {home_team} vs {away_team}")
-                        
-            else:
-                print(f"TheSportsDB API error: {response.status_code}")
-                
-        except Exception as e:
-            print(f"TheSportsDB error: {e}")
-        
-        db.commit()
-        print(f"Total fixtures added: {fixtures_added}")
-        
-        return {
-            "ok": True,
-            "message": f"Successfully fetched {fixtures_added} LIVE fixtures",
-            "source": "ESPN + TheSportsDB",
-            "total_matches": fixtures_added,
-            "apis_used": ["ESPN Soccer API", "TheSportsDB"]
-        }
-        
-    except Exception as e:
-        print(f"Fetch error: {e}")
-        return {"error": f"Failed to fetch fixtures: {str(e)}"}
-    finally:
-        db.close()
-
-@app.get("/api/v1/database-stats")
-def get_database_stats():
-    """Get database statistics"""
-    db = SessionLocal()
-    try:
-        total_matches = db.query(Match).count()
-        recent_matches = db.query(Match).filter(
-            Match.kickoff >= datetime.now() - timedelta(days=30)
-        ).count()
-        
-        return {
-            "total_matches": total_matches,
-            "recent_matches": recent_matches
-        }
-    finally:
-        db.close()
-
-@app.get("/health")
-def health_check():
-    return {"status": "healthy"}
-
-@app.post("/api/v1/add-sample-data")
-def add_sample_data():
-    """Add some sample matches for testing"""
-    db = SessionLocal()
-    try:
-        # Sample matches
-        sample_matches = [
-            {
-                "provider_id": "sample_001",
-                "league": "Premier League",
-                "home": "Manchester City",
-                "away": "Liverpool",
-                "kickoff": datetime.now() + timedelta(days=2),
-                "status": "SCHEDULED",
-                "provider_payload": "Sample data"
-            },
-            {
-                "provider_id": "sample_002", 
-                "league": "Premier League",
-                "home": "Arsenal",
-                "away": "Chelsea",
-                "kickoff": datetime.now() + timedelta(days=3),
-                "status": "SCHEDULED",
-                "provider_payload": "Sample data"
-            },
-            {
-                "provider_id": "sample_003",
-                "league": "Premier League", 
-                "home": "Manchester United",
-                "away": "Tottenham",
-                "kickoff": datetime.now() + timedelta(days=4),
-                "status": "SCHEDULED",
-                "provider_payload": "Sample data"
-            }
-        ]
-        
-        added = 0
-        for match_data in sample_matches:
-            # Check if match already exists
-            existing = db.query(Match).filter(Match.provider_id == match_data["provider_id"]).first()
-            if not existing:
-                match = Match(**match_data)
-                db.add(match)
-                added += 1
-        
-        db.commit()
-        return {
-            "ok": True,
-            "message": f"Added {added} sample matches",
-            "total_added": added
-        }
-    except Exception as e:
-        return {"error": f"Failed to add sample data: {str(e)}"}
-    finally:
-        db.close()
-
-if __name__ == "__main__":
-    uvicorn.run("simple_backend:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
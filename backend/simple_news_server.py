@@ -2,6 +2,7 @@
 Simple News API Server for Testing
 """
 
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import requests
@@ -31,10 +32,11 @@ def news_health():
 @app.get("/api/v1/news/football-news")
 def get_football_news():
     """Get football-specific news"""
-    # Use NewsAPI with the provided key
-    newsapi_key = "2543e26dac41497fa587ca31d6d9ecd8"
+    newsapi_key = os.getenv("NEWS_API_KEY")
     
     try:
+        if not newsapi_key:
+            raise RuntimeError("NEWS_API_KEY is not set")
         # Try NewsAPI first
         newsapi_url = "https://newsapi.org/v2/everything"
         params = {
@@ -0,0 +1,62 @@
+"""
+Record live provider responses for the simulator to replay.
+
+    python simulator/record.py                       # into simulator/recordings/
+    python simulator/record.py --output /tmp/recordings --provider espn --provider rss
+
+Files are named the way server.py looks them up: <provider>/<league code>.json
+for fixtures, newsapi/everything.json and rss/<n>.xml. API-Football and
+NewsAPI are only recorded when their keys are set.
+"""
+import os
+import sys
+import argparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(HERE), "app"))
+
+import httpx
+from providers import espn, thesportsdb, api_football
+from routers import news
+
+def requests():
+    """(provider, file name, url, params, headers) for every recordable endpoint."""
+    for key, code in espn.LEAGUES.items():
+        yield "espn", f"{code}.json", espn.scoreboard_url(key), {}, {}
+    for key, league_id in thesportsdb.LEAGUES.items():
+        yield "thesportsdb", f"{league_id}.json", f"{thesportsdb.SPORTSDB_BASE}/eventsnextleague.php", {"id": league_id}, {}
+    if api_football.FOOTBALL_KEY:
+        for key, league_id in api_football.LEAGUES.items():
+            yield ("api_football", f"{league_id}.json", f"{api_football.FOOTBALL_BASE}/fixtures",
+                   {"league": league_id, "season": api_football.SEASON}, {"x-apisports-key": api_football.FOOTBALL_KEY})
+    if news.NEWS_API_KEY:
+        yield ("newsapi", "everything.json", news.NEWS_BASE_URL,
+               {"q": news.NEWS_QUERY, "language": "en", "sortBy": "publishedAt", "pageSize": 50, "apiKey": news.NEWS_API_KEY}, {})
+    for i, url in enumerate(news.RSS_FEEDS):
+        yield "rss", f"{i}.xml", url, {}, {}
+
+def record(output, providers=None):
+    saved = 0
+    with httpx.Client(timeout=30, follow_redirects=True) as client:
+        for provider, name, url, params, headers in requests():
+            if providers and provider not in providers:
+                continue
+            try:
+                r = client.get(url, params=params, headers=headers)
+                r.raise_for_status()
+            except httpx.HTTPError as e:
+                print(f"skipped {provider}/{name}: {e}")
+                continue
+            os.makedirs(os.path.join(output, provider), exist_ok=True)
+            with open(os.path.join(output, provider, name), "wb") as f:
+                f.write(r.content)
+            print(f"recorded {provider}/{name} ({len(r.content)} bytes)")
+            saved += 1
+    return saved
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record live provider responses for the simulator")
+    parser.add_argument("--output", default=os.getenv("SIM_RECORDINGS", os.path.join(HERE, "recordings")))
+    parser.add_argument("--provider", action="append", help="only this provider (repeatable)")
+    args = parser.parse_args()
+    print(f"{record(args.output, args.provider)} responses recorded into {args.output}")
@@ -0,0 +1,207 @@
+"""
+Local stand-in for the upstream providers: ESPN, TheSportsDB, API-Football,
+NewsAPI and the RSS feeds.
+
+Each endpoint serves a recorded payload from --recordings if there is one
+(see record.py) and otherwise a deterministic synthetic one of any size, from
+benchmarks/synthetic.py. Latency, 5xx errors, 429s and truncated bodies can be
+injected globally or per provider, at startup or while running:
+
+    python simulator/server.py --port 9100 --fixtures 2000 --latency-ms 80 --error-rate 0.05
+    curl -X POST localhost:9100/_sim/faults -d '{"espn": {"rate_limit_rate": 0.5}}'
+    curl localhost:9100/_sim/stats
+
+Point the app (or scripts/fetch_fixtures.py) at it with the printed settings:
+
+    eval "$(python simulator/server.py --port 9100 --print-env)"
+"""
+import os
+import sys
+import random
+import asyncio
+import argparse
+from collections import Counter
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BACKEND = os.path.dirname(HERE)
+sys.path.append(os.path.join(BACKEND, "app"))
+sys.path.append(os.path.join(BACKEND, "benchmarks"))
+
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response
+import synthetic
+from providers import espn, thesportsdb, api_football
+
+RECORDINGS_DIR = os.getenv("SIM_RECORDINGS", os.path.join(HERE, "recordings"))
+
+FAULTS = ("latency_ms", "jitter_ms", "error_rate", "rate_limit_rate", "partial_rate", "retry_after")
+
+ESPN_CODES = {code: key for key, code in espn.LEAGUES.items()}
+SPORTSDB_IDS = {str(league_id): key for key, league_id in thesportsdb.LEAGUES.items()}
+API_FOOTBALL_IDS = {str(league_id): key for key, league_id in api_football.LEAGUES.items()}
+
+class Simulator:
+    """Payload sizes, fault settings and per-provider outcome counts."""
+
+    def __init__(self, fixtures=200, articles=100, feeds=3, per_feed=30, recordings=RECORDINGS_DIR, seed=0, **faults):
+        self.fixtures = fixtures
+        self.articles = articles
+        self.feeds = feeds
+        self.per_feed = per_feed
+        self.recordings = recordings
+        self.rng = random.Random(seed)
+        self.faults = {"default": {name: faults.get(name) or 0 for name in FAULTS}}
+        self.faults["default"]["retry_after"] = faults.get("retry_after") or 1
+        self.stats = Counter()
+        self._payloads = {}
+
+    def faults_for(self, provider):
+        return {**self.faults["default"], **self.faults.get(provider, {})}
+
+    def update_faults(self, changes):
+        """Merge {"default" | provider: {setting: value}} into the current faults."""
+        for scope, settings in changes.items():
+            unknown = set(settings) - set(FAULTS)
+            if unknown:
+                raise ValueError(f"Unknown fault settings: {', '.join(sorted(unknown))}")
+            self.faults.setdefault(scope, {}).update(settings)
+
+    def payload(self, provider, key, build, extension="json"):
+        """Recorded payload for provider/key if there is one, else the synthetic one (built once)."""
+        cached = self._payloads.get((provider, key))
+        if cached is None:
+            path = os.path.join(self.recordings, provider, f"{key}.{extension}")
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    cached = f.read()
+            else:
+                body = build()
+                cached = body.encode() if isinstance(body, str) else orjson.dumps(body)
+            self._payloads[(provider, key)] = cached
+        return cached
+
+    async def respond(self, provider, body, media_type="application/json"):
+        faults = self.faults_for(provider)
+        delay = faults["latency_ms"] + self.rng.uniform(0, faults["jitter_ms"])
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        roll = self.rng.random()
+        if roll < faults["error_rate"]:
+            self.stats[provider, "error"] += 1
+            return Response(b'{"message": "Internal Server Error"}', status_code=503, media_type="application/json")
+        roll -= faults["error_rate"]
+        if roll < faults["rate_limit_rate"]:
+            self.stats[provider, "rate_limited"] += 1
+            return Response(b'{"message": "Too Many Requests"}', status_code=429, media_type="application/json",
+                            headers={"Retry-After": str(faults["retry_after"])})
+        roll -= faults["rate_limit_rate"]
+        if roll < faults["partial_rate"]:
+            # a connection cut mid-body: 200 with half the payload
+            self.stats[provider, "partial"] += 1
+            return Response(body[:len(body) // 2], media_type=media_type)
+        self.stats[provider, "ok"] += 1
+        return Response(body, media_type=media_type)
+
+def create_app(sim):
+    app = FastAPI(title="Provider simulator")
+    app.state.sim = sim
+
+    @app.get("/espn/{sport}/{code}/scoreboard")
+    async def espn_scoreboard(sport: str, code: str):
+        league = ESPN_CODES.get(code)
+        if league is None:
+            raise HTTPException(status_code=404, detail="Unknown league")
+        body = sim.payload("espn", code, lambda: synthetic.espn_scoreboard(sim.fixtures, league=league))
+        return await sim.respond("espn", body)
+
+    @app.get("/thesportsdb/eventsnextleague.php")
+    async def sportsdb_events(id: str):
+        league = SPORTSDB_IDS.get(id)
+        build = (lambda: synthetic.sportsdb_events(sim.fixtures, league=league)) if league else (lambda: {"events": None})
+        return await sim.respond("thesportsdb", sim.payload("thesportsdb", id, build))
+
+    @app.get("/api-football/fixtures")
+    async def api_football_fixtures(league: str, season: int = None, date: str = None):
+        key = API_FOOTBALL_IDS.get(league)
+        build = (lambda: synthetic.api_football_fixtures(sim.fixtures, league=key)) if key else (lambda: {"results": 0, "response": []})
+        return await sim.respond("api_football", sim.payload("api_football", league, build))
+
+    @app.get("/newsapi/everything")
+    async def newsapi_everything():
+        # one page, whatever the query; --articles sets its size
+        body = sim.payload("newsapi", "everything", lambda: synthetic.newsapi_articles(sim.articles))
+        return await sim.respond("newsapi", body)
+
+    @app.get("/rss/{feed}.xml")
+    async def rss_feed(feed: int):
+        if not 0 <= feed < sim.feeds:
+            raise HTTPException(status_code=404, detail="Unknown feed")
+        body = sim.payload("rss", str(feed), lambda: synthetic.rss_xml(synthetic.rss_feeds(sim.feeds, sim.per_feed)[feed]), "xml")
+        return await sim.respond("rss", body, "application/rss+xml")
+
+    @app.get("/_sim/faults")
+    def get_faults():
+        return sim.faults
+
+    @app.post("/_sim/faults")
+    async def set_faults(request: Request):
+        try:
+            sim.update_faults(await request.json())
+        except (ValueError, AttributeError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return sim.faults
+
+    @app.get("/_sim/stats")
+    def get_stats():
+        out = {}
+        for (provider, outcome), count in sim.stats.items():
+            out.setdefault(provider, {})[outcome] = count
+        return out
+
+    @app.post("/_sim/reset")
+    def reset():
+        sim.stats.clear()
+        sim.faults = {"default": sim.faults["default"]}
+        return {"status": "ok"}
+
+    return app
+
+def environment(base, feeds):
+    """Settings that point the app's providers and news sources at a simulator at `base`."""
+    return {
+        "ESPN_BASE": f"{base}/espn",
+        "SPORTSDB_BASE": f"{base}/thesportsdb",
+        "FOOTBALL_BASE": f"{base}/api-football",
+        "FOOTBALL_API_KEY": os.getenv("FOOTBALL_API_KEY") or "simulator",
+        "NEWS_BASE_URL": f"{base}/newsapi/everything",
+        "NEWS_API_KEY": os.getenv("NEWS_API_KEY") or "simulator",
+        "RSS_FEEDS": ",".join(f"{base}/rss/{i}.xml" for i in range(feeds)),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local provider simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--print-env", action="store_true", help="print the app settings for this simulator and exit")
+    parser.add_argument("--recordings", default=RECORDINGS_DIR, help="directory of recorded payloads (see record.py)")
+    parser.add_argument("--fixtures", type=int, default=200, help="synthetic fixtures per provider and league")
+    parser.add_argument("--articles", type=int, default=100, help="synthetic NewsAPI articles")
+    parser.add_argument("--feeds", type=int, default=3, help="synthetic RSS feeds")
+    parser.add_argument("--per-feed", type=int, default=30, help="entries per synthetic RSS feed")
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency jitter and fault rolls")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of responses that are 503s")
+    parser.add_argument("--rate-limit-rate", type=float, default=0, help="fraction of responses that are 429s")
+    parser.add_argument("--partial-rate", type=float, default=0, help="fraction of responses cut off halfway")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on 429s")
+    args = parser.parse_args()
+    if args.print_env:
+        for name, value in environment(f"http://{args.host}:{args.port}", args.feeds).items():
+            print(f"export {name}='{value}'")
+        sys.exit(0)
+    import uvicorn
+    sim = Simulator(args.fixtures, args.articles, args.feeds, args.per_feed, args.recordings, args.seed,
+                    **{name: getattr(args, name) for name in FAULTS})
+    uvicorn.run(create_app(sim), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,49 @@
+"""
+Unit test environment.
+
+The app reads its configuration at import, so the database and artifact
+locations are pointed at a scratch directory before anything from app/ is
+imported; DATABASE_URL is deliberately ignored so tests can never write into
+a real database.
+
+    pip install -r backend/tests/requirements.txt
+    cd backend && python -m pytest tests
+"""
+import os
+import sys
+import tempfile
+
+TEST_DIR = tempfile.mkdtemp(prefix="scoresure-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DIR}/test.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.pop("CACHE_URL", None)
+os.environ["MODEL_ARTIFACT_DIR"] = os.path.join(TEST_DIR, "artifacts")
+os.environ["IMAGE_CACHE_DIR"] = os.path.join(TEST_DIR, "images")
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BACKEND, "app"))
+
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+
+@pytest.fixture
+def result():
+    """Factory for objects shaped like models.Result."""
+    def make(match_id, home, away, home_goals, away_goals, kickoff=datetime(2025, 8, 1, 15), league="Premier League"):
+        return SimpleNamespace(match_id=match_id, league=league, home=home, away=away, kickoff=kickoff,
+                               home_goals=home_goals, away_goals=away_goals)
+    return make
+
+@pytest.fixture
+def db():
+    """Session on the scratch database, with every table emptied first."""
+    from db import Base, engine, SessionLocal
+    import models  # noqa: F401  (registers tables)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    session = SessionLocal()
+    yield session
+    session.close()
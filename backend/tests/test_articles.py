@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+import pytest
+from articles import canonical_url, url_key, parse_published
+
+def test_canonical_url_drops_tracking_and_case():
+    assert (canonical_url("HTTP://WWW.BBC.co.uk/Sport/Football/123/?utm_source=x&id=5&FBCLID=y#comments")
+            == "http://bbc.co.uk/Sport/Football/123?id=5")
+    assert canonical_url("https://bbc.co.uk/") == "https://bbc.co.uk/"
+    assert canonical_url(" //bbc.co.uk/sport ") == "https://bbc.co.uk/sport"
+    assert canonical_url("bbc.co.uk/sport") == "https://bbc.co.uk/sport"
+
+def test_tracked_links_to_one_story_share_a_key():
+    story = "https://www.skysports.com/football/news/11095/1234"
+    assert url_key(story) == url_key("https://skysports.com/football/news/11095/1234/?utm_medium=rss&ocid=feed")
+    assert url_key(story) != url_key("https://skysports.com/football/news/11095/1235")
+
+@pytest.mark.parametrize("value, expected", [
+    ("Fri, 01 Aug 2025 15:00:00 GMT", datetime(2025, 8, 1, 15, tzinfo=timezone.utc)),
+    ("Fri, 01 Aug 2025 16:00:00 +0100", datetime(2025, 8, 1, 15, tzinfo=timezone.utc)),
+    ("Fri, 01 Aug 2025 15:00:00 -0000", datetime(2025, 8, 1, 15, tzinfo=timezone.utc)),
+    ("2025-08-01T15:00:00Z", datetime(2025, 8, 1, 15, tzinfo=timezone.utc)),
+    ("2025-08-01T17:00:00+02:00", datetime(2025, 8, 1, 15, tzinfo=timezone.utc)),
+    ("2025-08-01T15:00:00", datetime(2025, 8, 1, 15, tzinfo=timezone.utc)),
+])
+def test_parse_published_is_utc(value, expected):
+    parsed = parse_published(value)
+    assert parsed == expected and parsed.utcoffset().total_seconds() == 0
+
+@pytest.mark.parametrize("value", [None, "", "yesterday", "2025-13-01", "Fri, 32 Aug 2025 15:00:00 GMT", "Fri, 01 Aug 2025"])
+def test_unparseable_dates_are_none(value):
+    assert parse_published(value) is None
@@ -0,0 +1,41 @@
+import os
+import sys
+import json
+import subprocess
+from datetime import datetime
+import numpy as np
+import pytest
+from backtest import build_dataset, evaluate, predict_hash_strength
+from conftest import BACKEND
+
+RESULTS = [
+    (datetime(2025, 8, 1), "Premier League", "Arsenal", "Chelsea", 2, 0),
+    (datetime(2025, 8, 2), "Premier League", "Fulham", "Arsenal", 1, 1),
+    (datetime(2025, 8, 3), "Serie A", "Inter", "Milan", 0, 3),
+]
+
+def test_hash_strength_is_the_same_in_every_process():
+    code = ("import json, datetime; from backtest import build_dataset, predict_hash_strength; "
+            f"data = build_dataset({RESULTS!r}); print(json.dumps(predict_hash_strength(data, {{}}).tolist()))")
+    outputs = set()
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=os.path.join(BACKEND, "app"))
+        outputs.add(subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout)
+    assert len(outputs) == 1
+    assert json.loads(outputs.pop()) == predict_hash_strength(build_dataset(RESULTS), {}).tolist()
+
+def test_evaluate_scores_certain_predictions_perfectly():
+    data = build_dataset(RESULTS)
+    probs = np.eye(3)[data["outcome"]]
+    metrics = evaluate(probs, data)
+    assert metrics["matches"] == 3
+    assert metrics["brier"] == pytest.approx(0.0)
+    assert metrics["log_loss"] == pytest.approx(0.0)
+    assert [(g["league"], g["matches"]) for g in metrics["groups"]] == [("premier_league", 2), ("serie_a", 1)]
+
+def test_roi_bets_only_positive_expected_value():
+    data = build_dataset(RESULTS[:1])
+    data["odds"] = np.array([[2.5, 3.0, 3.0]])
+    metrics = evaluate(np.array([[0.5, 0.25, 0.25]]), data)  # EV on the home win is 0.25, the rest negative
+    assert metrics["bets"] == 1
+    assert metrics["roi"] == pytest.approx(1.5)
@@ -0,0 +1,73 @@
+import gzip, asyncio
+from types import SimpleNamespace
+import brotli
+import pytest
+import compression
+import response_cache
+from compression import negotiate
+from response_cache import EncodedCache, cached_json
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("", None),
+    ("identity", None),
+    ("gzip", "gzip"),
+    ("gzip, deflate, br", "br"),
+    ("GZIP;Q=0.5", "gzip"),
+    ("br;q=0.5, gzip;q=0.8", "gzip"),
+    ("br;q=0.8, gzip;q=0.8", "br"),
+    ("br;q=0, gzip", "gzip"),
+    ("gzip;q=0.0, deflate", None),
+    ("gzip, identity;q=0", "gzip"),
+    ("*", "br"),
+    ("br;q=0, *", "gzip"),
+    ("*;q=0", None),
+    ("gzip;q=oops", None),
+])
+def test_negotiate(header, expected):
+    assert negotiate(header) == expected
+
+def test_negotiate_without_brotli(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    assert negotiate("br, gzip;q=0.5") == "gzip"
+    assert negotiate("br") is None
+
+@pytest.fixture
+def cache(monkeypatch):
+    fresh = EncodedCache(ttl=60, size=8)
+    monkeypatch.setattr(response_cache, "response_cache", fresh)
+    monkeypatch.setattr(response_cache, "COMPRESS_MIN_SIZE", 100)
+    return fresh
+
+def serve(key, accept_encoding, body, builds):
+    async def build():
+        builds.append(key)
+        return body
+    request = SimpleNamespace(headers={"accept-encoding": accept_encoding} if accept_encoding else {})
+    return asyncio.run(cached_json(request, key, build))
+
+def test_cached_variants_are_compressed_once_per_encoding(cache, monkeypatch):
+    body = {"fixtures": [{"home": "Arsenal", "away": "Chelsea"}] * 20}
+    builds, compressed = [], []
+    compress = response_cache.compress
+    monkeypatch.setattr(response_cache, "compress", lambda data, encoding: compressed.append(encoding) or compress(data, encoding))
+
+    plain = serve(("fixtures",), None, body, builds)
+    assert "content-encoding" not in plain.headers and plain.headers["vary"] == "Accept-Encoding"
+    gz = serve(("fixtures",), "gzip", body, builds)
+    assert gz.headers["content-encoding"] == "gzip" and gz.headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(gz.body) == plain.body
+    br = serve(("fixtures",), "gzip, br", body, builds)
+    assert br.headers["content-encoding"] == "br"
+    assert brotli.decompress(br.body) == plain.body
+    assert serve(("fixtures",), "gzip", body, builds).body == gz.body
+
+    assert builds == [("fixtures",)]
+    assert compressed == ["gzip", "br"]
+    assert set(cache.get(("fixtures",))) == {None, "gzip", "br"}
+
+def test_small_cached_bodies_go_out_uncompressed(cache):
+    r = serve(("stats",), "gzip, br", {"ok": True}, [])
+    assert r.body == b'{"ok":true}'
+    assert "content-encoding" not in r.headers and "vary" not in r.headers
+    assert set(cache.get(("stats",))) == {None}
@@ -0,0 +1,22 @@
+import pytest
+from db import pool_sizing, pool_stats, engine
+
+@pytest.mark.parametrize("budget", [2, 20, 37, 100, 500])
+@pytest.mark.parametrize("workers", [1, 2, 4, 9])
+def test_default_pools_fit_the_budget(budget, workers):
+    size, overflow = pool_sizing(budget, workers)
+    assert size >= 1 and overflow >= 0
+    if budget >= 2 * workers:
+        assert 2 * (size + overflow) * workers <= budget
+
+def test_overrides_are_used_as_given():
+    assert pool_sizing(20, 1) == (7, 3)
+    assert pool_sizing(20, 1, pool_size=8) == (8, 2)
+    assert pool_sizing(20, 1, max_overflow=0) == (10, 0)
+    assert pool_sizing(20, 1, 30, 30) == (30, 30)
+
+def test_pool_stats_report_the_pool_in_use():
+    # on SQLite the dialect picks the pool, not our sizing
+    sync = pool_stats()["sync"]
+    assert sync["size"] == engine.pool.size()
+    assert sync["max_overflow"] == engine.pool._max_overflow
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import math
+from features import FeatureStore, FEATURE_COLUMNS
+
+def row(store, home, away, kickoff=datetime(2025, 9, 1, 15)):
+    values = store.feature_matrix([SimpleNamespace(home=home, away=away, kickoff=kickoff)])[0]
+    return dict(zip(FEATURE_COLUMNS, values))
+
+def test_rolling_averages(result):
+    store = FeatureStore(window=2)
+    store.add(result(1, "Arsenal", "Chelsea", 2, 0, datetime(2025, 8, 1)))
+    store.add(result(2, "Chelsea", "Arsenal", 1, 1, datetime(2025, 8, 8)))
+    store.add(result(3, "Arsenal", "Fulham", 4, 2, datetime(2025, 8, 15)))
+    f = row(store, "Arsenal", "Chelsea")
+    # window of 2: the first result has dropped out
+    assert f["home_games"] == 2
+    assert f["home_gf_avg"] == 2.5
+    assert f["home_ga_avg"] == 1.5
+    assert f["home_pts_avg"] == 2.0
+    assert f["home_venue_gf_avg"] == 3.0  # home games only: 2-0 then 4-2
+    assert f["away_games"] == 2
+    assert f["away_venue_gf_avg"] == 0.0  # Chelsea's one away game, the 2-0
+    assert f["home_rest_days"] == 17.625  # 15 Aug 00:00 to 1 Sep 15:00
+
+def test_unknown_team_has_no_history(result):
+    store = FeatureStore()
+    store.add(result(1, "Arsenal", "Chelsea", 2, 0))
+    f = row(store, "Arsenal", "Brentford")
+    assert f["away_games"] == 0
+    assert math.isnan(f["away_gf_avg"]) and math.isnan(f["away_rest_days"])
+
+def test_reingested_result_is_counted_once(result):
+    store = FeatureStore()
+    for _ in range(3):
+        store.add(result(1, "Arsenal", "Chelsea", 2, 0))
+    f = row(store, "Arsenal", "Chelsea")
+    assert f["home_games"] == 1
+    assert f["away_games"] == 1
+    assert f["home_gf_avg"] == 2.0
+
+def test_corrected_score_replaces_the_old_one(result):
+    store = FeatureStore()
+    store.add(result(1, "Arsenal", "Chelsea", 2, 0))
+    store.add(result(2, "Chelsea", "Arsenal", 0, 0, datetime(2025, 8, 8)))
+    store.add(result(1, "Arsenal", "Chelsea", 2, 2))
+    f = row(store, "Arsenal", "Chelsea")
+    assert f["home_games"] == 2
+    assert f["home_gf_avg"] == 1.0
+    assert f["home_ga_avg"] == 1.0
+    assert f["home_pts_avg"] == 1.0
+    assert f["away_venue_ga_avg"] == 2.0
+
+def test_grows_past_initial_capacity(result):
+    store = FeatureStore(capacity=2)
+    kickoff = datetime(2025, 8, 1)
+    for i in range(10):
+        store.add(result(i, f"Team {i}", f"Team {i + 10}", i, 0, kickoff + timedelta(days=i)))
+    assert row(store, "Team 3", "Team 13")["home_gf_avg"] == 3.0
+    assert row(store, "Team 0", "Team 19")["away_games"] == 1
+
+def test_out_of_order_result_keeps_the_latest_kickoff(result):
+    store = FeatureStore()
+    store.add(result(2, "Arsenal", "Chelsea", 1, 0, datetime(2025, 8, 22)))
+    store.add(result(1, "Fulham", "Arsenal", 0, 2, datetime(2025, 8, 15)))  # ingested late
+    f = row(store, "Arsenal", "Fulham")
+    assert f["home_rest_days"] == 10.625  # from 22 Aug, not 15 Aug
+    assert f["away_rest_days"] == 17.625
+    assert f["home_games"] == 2
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import date, datetime
+import pytest
+import fixture_query
+from fixture_query import FixtureQuery, window, fetch, _statement
+from kickoffs import zone, epoch
+
+def ts(*args):
+    return epoch(datetime(*args))
+
+def test_window_is_local_days():
+    london = zone("Europe/London")
+    assert window(london, date_from=date(2025, 8, 1), date_to=date(2025, 8, 2)) == (ts(2025, 7, 31, 23), ts(2025, 8, 2, 23))
+    assert window(london, date_from=date(2025, 8, 1)) == (ts(2025, 7, 31, 23), None)
+    assert window(london) == (None, None)
+    with pytest.raises(ValueError):
+        window(london, date_from=date(2025, 8, 2), date_to=date(2025, 8, 1))
+    with pytest.raises(ValueError):
+        window(london, days_ahead=-1)
+
+def test_tomorrow_and_next_days(monkeypatch):
+    monkeypatch.setattr(fixture_query, "local_today", lambda tz: date(2025, 8, 1))
+    utc = zone("UTC")
+    assert window(utc, days_ahead=0) == (ts(2025, 8, 1), ts(2025, 8, 2))
+    assert window(utc, days_ahead=1) == (ts(2025, 8, 2), ts(2025, 8, 3))
+    assert window(utc, days_ahead=3) == (ts(2025, 8, 1), ts(2025, 8, 4))
+
+def test_from_params_validates_and_maps_leagues():
+    query = FixtureQuery.from_params(league="premier_league, serie_a", status="NS,FT", limit=10_000)
+    assert query.leagues == ("Premier League", "Serie A")
+    assert query.statuses == ("NS", "FT")
+    assert query.limit == fixture_query.FIXTURE_QUERY_MAX_LIMIT
+    for bad in ({"league": "nope"}, {"order": "home"}, {"tz": "Nowhere/Town"}):
+        with pytest.raises(ValueError):
+            FixtureQuery.from_params(**bad)
+
+def test_upcoming_key_ignores_the_moving_start():
+    a = FixtureQuery.from_params(upcoming=True)
+    assert a.upcoming and a.start is not None
+    assert a.key() == FixtureQuery.from_params(upcoming=True).key()
+    assert a.key()[0] == "upcoming"
+    # an explicit window wins over upcoming
+    assert not FixtureQuery.from_params(date_from=date(2025, 8, 1), upcoming=True).upcoming
+
+def test_one_statement_per_shape():
+    a, params = FixtureQuery(1, 2, ["Serie A"], [], "kickoff", 5).statement()
+    b, _ = FixtureQuery(3, 4, ["Premier League", "Serie A"], [], "kickoff", 9).statement()
+    c, _ = FixtureQuery(3, None, ["Serie A"], [], "kickoff", 5).statement()
+    assert a is b and a is not c
+    assert params == {"limit": 5, "start": 1, "end": 2, "leagues": ["Serie A"]}
+    assert _statement.cache_info().currsize >= 2
+
+def test_fetch_filters_and_orders(db):
+    from models import Match
+    from db import AsyncSessionLocal
+    rows = [("a", "Premier League", ts(2025, 8, 1, 15), "NS"), ("b", "Serie A", ts(2025, 8, 1, 12), "NS"),
+            ("c", "Premier League", ts(2025, 8, 2, 15), "FT"), ("d", "Premier League", ts(2025, 8, 3, 15), "NS")]
+    for pid, league, kickoff_ts, status in rows:
+        db.add(Match(provider_id=pid, league=league, home="H", away="A", kickoff_ts=kickoff_ts, status=status))
+    db.commit()
+
+    async def run(query):
+        async with AsyncSessionLocal() as session:
+            return [m.provider_id for m in await fetch(session, query)]
+    start, end = ts(2025, 8, 1), ts(2025, 8, 3)
+    assert asyncio.run(run(FixtureQuery(start, end))) == ["b", "a", "c"]
+    assert asyncio.run(run(FixtureQuery(start, end, order="-kickoff", limit=2))) == ["c", "a"]
+    assert asyncio.run(run(FixtureQuery(start, None, ["Premier League"], ["NS"]))) == ["a", "d"]
+    assert asyncio.run(run(FixtureQuery(order="league"))) == ["a", "c", "d", "b"]
@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime
+from history import HistoryIndex
+
+def test_head_to_head_and_form(result):
+    index = HistoryIndex()
+    index.add(result(1, "Arsenal", "Chelsea", 2, 0, datetime(2025, 8, 1)))
+    index.add(result(2, "Chelsea", "Arsenal", 1, 1, datetime(2025, 9, 1)))
+    meetings = index.head_to_head("Arsenal", "Chelsea")
+    assert [m["match_id"] for m in meetings] == [2, 1]
+    assert index.head_to_head("Chelsea", "Arsenal") == meetings
+    form = index.recent_form("Arsenal")
+    assert [(f["venue"], f["result"]) for f in form] == [("A", "D"), ("H", "W")]
+
+def test_out_of_order_results_are_kept_sorted(result):
+    index = HistoryIndex(form_size=2)
+    index.add(result(2, "Arsenal", "Chelsea", 1, 0, datetime(2025, 9, 1)))
+    index.add(result(3, "Arsenal", "Fulham", 1, 0, datetime(2025, 10, 1)))
+    index.add(result(1, "Arsenal", "Spurs", 1, 0, datetime(2025, 8, 1)))  # older than a full ring: dropped
+    assert [f["match_id"] for f in index.recent_form("Arsenal")] == [3, 2]
+
+def test_reingested_result_is_indexed_once(result):
+    index = HistoryIndex()
+    for _ in range(3):
+        index.add(result(1, "Arsenal", "Chelsea", 2, 0))
+    assert len(index.recent_form("Arsenal")) == 1
+    assert len(index.head_to_head("Arsenal", "Chelsea")) == 1
+
+def test_corrected_score_updates_the_entry(result):
+    index = HistoryIndex()
+    index.add(result(1, "Arsenal", "Chelsea", 2, 0))
+    index.add(result(1, "Arsenal", "Chelsea", 2, 3))
+    [meeting] = index.head_to_head("Arsenal", "Chelsea")
+    assert (meeting["home_goals"], meeting["away_goals"]) == (2, 3)
+    [home] = index.recent_form("Arsenal")
+    [away] = index.recent_form("Chelsea")
+    assert (home["goals_for"], home["goals_against"], home["result"]) == (2, 3, "L")
+    assert (away["goals_for"], away["goals_against"], away["result"]) == (3, 2, "W")
+
+def espn_event(event_id, completed, home_score, away_score):
+    return {
+        "id": str(event_id),
+        "date": "2025-08-16T14:00Z",
+        "status": {"type": {"name": "STATUS_FULL_TIME" if completed else "STATUS_SCHEDULED", "completed": completed}},
+        "competitions": [{"competitors": [
+            # ESPN doesn't always list the home side first
+            {"homeAway": "away", "score": away_score, "team": {"displayName": "Chelsea"}},
+            {"homeAway": "home", "score": home_score, "team": {"displayName": "Arsenal"}},
+        ]}],
+    }
+
+def test_finished_espn_event_is_stored_as_a_result(db):
+    import httpx
+    from fetcher import store_fixtures
+    from history import history
+    from models import Result
+    from providers import espn
+    payload = {"events": [espn_event(1, True, "2", "1"), espn_event(2, False, "0", "0")]}
+
+    async def fetch():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await espn.fetch(client, "premier_league")
+    store_fixtures(asyncio.run(fetch()))
+    results = db.query(Result).all()
+    assert [(r.league, r.home, r.away, r.home_goals, r.away_goals) for r in results] == [
+        ("Premier League", "Arsenal", "Chelsea", 2, 1)]
+    assert history.head_to_head("Arsenal", "Chelsea")[0]["match_id"] == results[0].match_id
+
+def test_provider_results():
+    from providers import final_score
+    assert final_score("espn", espn_event(1, True, "3", "0")) == (3, 0)
+    assert final_score("espn", espn_event(1, True, None, "0")) is None
+    assert final_score("espn", espn_event(1, False, "0", "0")) is None
+    assert final_score("thesportsdb", {"strStatus": "Match Finished", "intHomeScore": "1", "intAwayScore": "1"}) == (1, 1)
+    assert final_score("thesportsdb", {"strStatus": "Not Started", "intHomeScore": None, "intAwayScore": None}) is None
+    finished = {"fixture": {"status": {"short": "AET"}}, "goals": {"home": 2, "away": 2}}
+    assert final_score("api_football", finished) == (2, 2)
+    assert final_score("api_football", {"fixture": {"status": {"short": "NS"}}, "goals": {"home": None}}) is None
+    assert final_score("unknown", finished) is None and final_score("espn", None) is None
@@ -0,0 +1,54 @@
+import asyncio
+from io import BytesIO
+import pytest
+import images
+from images import ImageCache, proxy_url
+
+LOGO = "https://media.api-sports.io/football/teams/42.png"
+
+@pytest.fixture
+def cache(monkeypatch):
+    from PIL import Image
+    out = BytesIO()
+    Image.new("RGB", (300, 300), "red").save(out, "PNG")
+    fresh = ImageCache()
+    downloads = []
+    async def download(url):
+        downloads.append(url)
+        return out.getvalue()
+    monkeypatch.setattr(fresh, "_download", download)
+    monkeypatch.setattr(images, "image_cache", fresh)
+    fresh.downloads = downloads
+    return fresh
+
+@pytest.fixture(autouse=True)
+def base_url(monkeypatch):
+    monkeypatch.setattr(images, "PUBLIC_BASE_URL", "https://api.scoresure.test")
+
+def test_urls_are_left_alone_unless_the_router_is_served(cache, monkeypatch):
+    monkeypatch.setattr(images, "_serving", False)
+    assert proxy_url(LOGO) == LOGO
+    monkeypatch.setattr(images, "_serving", True)
+    assert proxy_url(LOGO, 100) == "https://api.scoresure.test/api/v1/images/proxy?url=https%3A%2F%2Fmedia.api-sports.io%2Ffootball%2Fteams%2F42.png&w=128"
+    assert proxy_url("https://elsewhere.example/x.png") == "https://elsewhere.example/x.png"
+    assert proxy_url(None) is None
+
+def test_rendered_thumbnails_get_their_content_addressed_url(cache, monkeypatch):
+    monkeypatch.setattr(images, "_serving", True)
+    name = asyncio.run(cache.thumbnail(LOGO, 128))
+    assert proxy_url(LOGO, 128) == f"https://api.scoresure.test/api/v1/images/{name}"
+    # other widths reuse the stored original
+    asyncio.run(cache.thumbnail(LOGO, 64))
+    assert cache.downloads == [LOGO]
+    assert proxy_url(LOGO, 512).startswith("https://api.scoresure.test/api/v1/images/proxy?")
+
+def test_public_base_url_defaults_to_the_platform_url(monkeypatch):
+    for name in ("PUBLIC_BASE_URL", "RENDER_EXTERNAL_URL", "RAILWAY_PUBLIC_DOMAIN"):
+        monkeypatch.delenv(name, raising=False)
+    assert images._public_base_url() == "http://localhost:8000"
+    monkeypatch.setenv("RAILWAY_PUBLIC_DOMAIN", "scoresure.up.railway.app")
+    assert images._public_base_url() == "https://scoresure.up.railway.app"
+    monkeypatch.setenv("RENDER_EXTERNAL_URL", "https://scoresure.onrender.com")
+    assert images._public_base_url() == "https://scoresure.onrender.com"
+    monkeypatch.setenv("PUBLIC_BASE_URL", "https://api.scoresure.app/")
+    assert images._public_base_url() == "https://api.scoresure.app/"
@@ -0,0 +1,47 @@
+import time
+import pytest
+from apscheduler.schedulers.background import BackgroundScheduler
+import jobs
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    """jobs.start with its scheduler left paused, so next run times stay as scheduled; stopped afterwards."""
+    start = BackgroundScheduler.start
+    monkeypatch.setattr(BackgroundScheduler, "start", lambda self: start(self, paused=True))
+    yield jobs.start
+    jobs.stop()
+
+def next_runs():
+    return {job.id: job.next_run_time.timestamp() for job in jobs._scheduler.get_jobs()}
+
+def test_news_poll_is_due_at_startup(scheduler, monkeypatch):
+    import routers.news
+    monkeypatch.setattr(routers.news, "NEWS_REFRESH_SECONDS", 300)
+    monkeypatch.setattr(jobs, "schedule", lambda: [])
+    before = time.time()
+    scheduler(news=True)
+    assert before - 1 <= next_runs()["news_refresh"] <= time.time()
+
+def test_source_fetches_are_spread_from_startup(scheduler, monkeypatch):
+    import sources
+    catalogued = [sources.Source("espn", key, key, 600) for key in ("premier_league", "la_liga", "serie_a")]
+    monkeypatch.setattr(jobs, "enabled_providers", lambda: [])
+    monkeypatch.setattr(jobs, "enabled_sources", lambda providers: catalogued)
+    before = time.time()
+    scheduler()
+    runs = next_runs()
+    assert list(runs) == ["fetch:espn:premier_league", "fetch:espn:la_liga", "fetch:espn:serie_a"]
+    assert all(before - 1 <= t < before + 600 for t in runs.values())
+    assert [round(t - runs["fetch:espn:premier_league"]) for t in runs.values()] == [0, 200, 400]
+
+def test_leader_only_jobs_are_skipped_off_the_leader(monkeypatch):
+    runs = []
+    fetch = jobs.periodic("fetch:espn:premier_league", 60, time.time(), lambda: runs.append("fetch"))
+    poll = jobs.periodic("news_refresh", 60, time.time(), lambda: runs.append("news"), leader=False)
+    monkeypatch.setattr(jobs.election, "is_leader", False)
+    fetch()
+    poll()
+    assert runs == ["news"]
+    monkeypatch.setattr(jobs.election, "is_leader", True)
+    fetch()
+    assert runs == ["news", "fetch"]
@@ -0,0 +1,67 @@
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import kickoffs
+from kickoffs import DayIndex, to_utc, epoch, day_range
+
+def ts(*args):
+    return epoch(datetime(*args))
+
+def test_to_utc_and_epoch():
+    assert to_utc(datetime(2025, 8, 1, 17, tzinfo=timezone(timedelta(hours=2)))) == datetime(2025, 8, 1, 15)
+    assert to_utc(datetime(2025, 8, 1, 15)) == datetime(2025, 8, 1, 15)
+    assert to_utc(datetime(2025, 8, 1, 16), ZoneInfo("Europe/London")) == datetime(2025, 8, 1, 15)
+    assert to_utc(None) is None and epoch(None) is None
+    assert epoch(datetime(1970, 1, 2)) == 86400
+
+def test_day_range_follows_dst():
+    start, end = day_range(date(2025, 3, 30), 1, ZoneInfo("Europe/London"))
+    assert end - start == 23 * 3600
+
+def test_days_are_local_to_the_timezone():
+    index = DayIndex()
+    index.add([(1, ts(2025, 8, 1, 23, 30), "Premier League"),   # 2 Aug in Berlin, 1 Aug in New York
+               (2, ts(2025, 8, 1, 12), "Serie A"),
+               (3, ts(2025, 8, 2, 3), "Premier League")])       # 1 Aug 23:00 in New York
+    assert index.days(date(2025, 8, 1), 1, "UTC") == [2, 1]
+    assert index.days(date(2025, 8, 1), 1, "Europe/Berlin") == [2]
+    assert index.days(date(2025, 8, 2), 1, "Europe/Berlin") == [1, 3]
+    assert index.days(date(2025, 8, 1), 1, "America/New_York") == [2, 1, 3]
+    assert index.days(date(2025, 8, 1), 2, "UTC", leagues={"Premier League"}) == [1, 3]
+    assert index.days(date(2025, 7, 1), 1, "UTC") == []
+
+def test_re_adding_moves_a_fixture_and_none_removes_it():
+    index = DayIndex()
+    index.add([(1, ts(2025, 8, 1, 15), "Serie A"), (2, ts(2025, 8, 1, 18), "Serie A")])
+    assert index.days(date(2025, 8, 1), 1, "UTC") == [1, 2]
+    index.add([(1, ts(2025, 8, 3, 15), "Serie A"), (2, None, "Serie A")])
+    assert index.days(date(2025, 8, 1), 1, "UTC") == []
+    assert index.days(date(2025, 8, 3), 1, "UTC") == [1]
+
+def test_timezone_maps_are_bounded(monkeypatch):
+    monkeypatch.setattr(kickoffs, "DAY_INDEX_TIMEZONES", 2)
+    index = DayIndex()
+    index.add([(1, ts(2025, 8, 1, 15), "Serie A")])
+    for tz in ("UTC", "Europe/Rome", "Asia/Tokyo"):
+        index.days(date(2025, 8, 1), 1, tz)
+    assert index.stats()["timezones"] == ["Europe/Rome", "Asia/Tokyo"]
+    with pytest.raises(ValueError):
+        index.days(date(2025, 8, 1), 1, "Mars/Olympus")
+
+def test_rebuild_and_kickoffs_are_served_with_z(db):
+    from models import Match
+    from routers import fixtures, predictions
+    db.add(Match(provider_id="p1", league="Premier League", home="Arsenal", away="Chelsea",
+                 kickoff=datetime(2025, 8, 1, 15), kickoff_ts=ts(2025, 8, 1, 15)))
+    db.commit()
+    kickoffs.day_index.rebuild(db)
+    app = FastAPI()
+    app.include_router(fixtures.router)
+    app.include_router(predictions.router)
+    client = TestClient(app)
+    today = client.get("/api/today", params={"day": "2025-08-01", "tz": "Europe/London"}).json()
+    assert [m["kickoff"] for m in today] == ["2025-08-01T15:00:00Z"]
+    detail = client.get(f"/api/predictions/{today[0]['id']}").json()
+    assert detail["kickoff"] == "2025-08-01T15:00:00Z"
@@ -0,0 +1,84 @@
+import pytest
+import leader
+from leader import LeaderElection, acquire
+
+class FakeConnection:
+    """Just enough of a Postgres connection for advisory locks: a lock lives as long as its connection."""
+
+    def __init__(self, locks):
+        self.locks = locks
+        self.closed = False
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        key = (params or {}).get("key")
+        held = None
+        if "pg_try_advisory_lock" in sql:
+            held = self.locks.setdefault(key, self) is self
+        elif "pg_advisory_unlock" in sql:
+            held = self.locks.get(key) is self
+            if held:
+                del self.locks[key]
+        return type("Result", (), {"scalar": lambda _: held})()
+
+    def close(self):
+        self.closed = True
+        for key in [k for k, conn in self.locks.items() if conn is self]:
+            del self.locks[key]
+
+@pytest.fixture
+def postgres(monkeypatch):
+    """Advisory locks on a fake Postgres; returns the held locks, key -> connection."""
+    locks = {}
+    engine = type("Engine", (), {"connect": lambda _: FakeConnection(locks)})()
+    monkeypatch.setattr(leader, "advisory_locks", lambda: True)
+    monkeypatch.setattr(leader, "lock_engine", lambda: engine)
+    return locks
+
+def test_every_process_leads_on_sqlite():
+    assert not leader.advisory_locks()
+    a, b = LeaderElection("ingestion"), LeaderElection("ingestion")
+    a.start()
+    assert a.is_leader and b.is_leader
+    assert a._thread is None
+
+def test_local_lock_is_held_once_until_released():
+    first = acquire("fetch:espn:premier_league")
+    assert first is not None
+    assert acquire("fetch:espn:premier_league") is None
+    other = acquire("fetch:espn:la_liga")
+    assert other is not None
+    first.release()
+    again = acquire("fetch:espn:premier_league")
+    assert again is not None
+    again.release()
+    other.release()
+
+def test_one_elector_leads_and_the_other_takes_over(postgres):
+    a, b = LeaderElection("ingestion"), LeaderElection("ingestion")
+    assert not a.is_leader and not b.is_leader
+    a._campaign()
+    b._campaign()
+    assert a.is_leader and not b.is_leader
+    assert postgres[a.key] is a._conn
+    a.stop()
+    assert not a.is_leader and a.key not in postgres
+    b._campaign()
+    assert b.is_leader and b.times_elected == 1
+
+def test_leader_lost_with_its_connection(postgres):
+    a, b = LeaderElection("ingestion"), LeaderElection("ingestion")
+    a._campaign()
+    # the leader's connection drops: Postgres frees the lock and the next retry elsewhere wins
+    a._conn.close()
+    b._campaign()
+    assert b.is_leader
+
+def test_one_off_lock_across_processes(postgres):
+    lock = acquire("fetch:espn:premier_league")
+    assert lock is not None
+    # another replica: its own in-process lock is free, but the advisory lock is held
+    leader._local_locks.pop("fetch:espn:premier_league")
+    assert acquire("fetch:espn:premier_league") is None
+    lock.release()
+    assert not postgres
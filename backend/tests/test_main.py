@@ -0,0 +1,11 @@
+import os, sys, subprocess
+from conftest import BACKEND
+
+def test_only_enabled_routers_are_loaded():
+    script = ("import sys, main, fetcher; "
+              "print(','.join(m for m in ('numpy', 'features', 'ratings', 'search', 'tagger', 'news_index', 'registry') "
+              "if m in sys.modules))")
+    env = dict(os.environ, ENABLED_ROUTERS="fixtures")
+    out = subprocess.run([sys.executable, "-c", script], cwd=os.path.join(BACKEND, "app"), env=env,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
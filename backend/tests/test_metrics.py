@@ -0,0 +1,90 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from prometheus_client.parser import text_string_to_metric_families
+from sqlalchemy import text
+import pytest
+import response_cache
+import routers.metrics
+from db import SessionLocal, AsyncSessionLocal, engine, async_engine
+from metrics import MetricsMiddleware, instrument_engine
+from response_cache import EncodedCache, cached_json
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+    app.include_router(routers.metrics.router)
+
+    @app.get("/metrics-test/sync/{n}")
+    def sync_queries(n: int):
+        with SessionLocal() as db:
+            for _ in range(n):
+                db.execute(text("SELECT 1"))
+        return {"n": n}
+
+    @app.get("/metrics-test/async/{n}")
+    async def async_queries(request: Request, n: int):
+        async def build():
+            async with AsyncSessionLocal() as db:
+                for _ in range(n):
+                    await db.execute(text("SELECT 1"))
+            return {"n": n}
+        return await cached_json(request, ("metrics-test", n), build)
+
+    app.add_middleware(MetricsMiddleware)
+    instrument_engine(engine, "sync")
+    instrument_engine(async_engine.sync_engine, "async")
+    return TestClient(app)
+
+def scrape(client):
+    r = client.get("/metrics")
+    assert r.status_code == 200 and r.headers["content-type"].startswith("text/plain")
+    return {(s.name, tuple(sorted(s.labels.items()))): s.value
+            for family in text_string_to_metric_families(r.text) for s in family.samples}
+
+def sample(samples, name, **labels):
+    return samples.get((name, tuple(sorted(labels.items()))), 0.0)
+
+def test_requests_are_timed_per_route_template(client):
+    before = scrape(client)
+    for n in (1, 2, 3):
+        assert client.get(f"/metrics-test/sync/{n}").json() == {"n": n}
+    client.get("/no-such-page")
+    after = scrape(client)
+    count = "scoresure_request_seconds_count"
+    route = dict(method="GET", route="/metrics-test/sync/{n}", status="200")
+    assert sample(after, count, **route) - sample(before, count, **route) == 3
+    assert not any(labels and dict(labels).get("route", "").startswith("/metrics-test/sync/1") for _, labels in after)
+    unmatched = dict(method="GET", route="unmatched", status="404")
+    assert sample(after, count, **unmatched) - sample(before, count, **unmatched) == 1
+
+def test_db_queries_are_counted_per_request_on_both_engines(client):
+    before = scrape(client)
+    client.get("/metrics-test/sync/4")
+    client.get("/metrics-test/async/5")
+    after = scrape(client)
+    for route, queries in (("/metrics-test/sync/{n}", 4), ("/metrics-test/async/{n}", 5)):
+        assert sample(after, "scoresure_request_db_queries_sum", route=route) - \
+            sample(before, "scoresure_request_db_queries_sum", route=route) == queries
+    for name, queries in (("sync", 4), ("async", 5)):
+        assert sample(after, "scoresure_db_query_seconds_count", engine=name) - \
+            sample(before, "scoresure_db_query_seconds_count", engine=name) >= queries
+
+def test_collector_reports_cache_and_pool_state(client, monkeypatch):
+    fresh = EncodedCache(ttl=60, size=8)
+    monkeypatch.setattr(response_cache, "response_cache", fresh)
+    monkeypatch.setattr(routers.metrics, "response_cache", fresh)
+    client.get("/metrics-test/async/6")
+    client.get("/metrics-test/async/6")
+    client.get("/metrics-test/async/7")
+    samples = scrape(client)
+    assert sample(samples, "scoresure_response_cache_lookups_total", result="hit") == 1
+    assert sample(samples, "scoresure_response_cache_lookups_total", result="miss") == 2
+    assert sample(samples, "scoresure_response_cache_entries") == 2
+
+    pools = {"sync": {"checked_out": 3, "checkouts": 40, "timeouts": 2}, "async": {"checkouts": 7, "timeouts": 0}}
+    monkeypatch.setattr(routers.metrics, "pool_stats", lambda: pools)
+    samples = scrape(client)
+    assert sample(samples, "scoresure_db_pool_checked_out", engine="sync") == 3
+    assert sample(samples, "scoresure_db_pool_checked_out", engine="async") == 0
+    assert sample(samples, "scoresure_db_pool_checkouts_total", engine="sync") == 40
+    assert sample(samples, "scoresure_db_pool_timeouts_total", engine="sync") == 2
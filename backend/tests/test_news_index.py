@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from articles import Article
+from news_index import NewsIndex, minhash, NUM_PERM
+
+NOW = datetime(2025, 8, 1, 12, tzinfo=timezone.utc)
+
+def article(n, title, hours_ago=0, image=None):
+    return Article(f"a{n}", title, "", f"https://example.com/{n}", "Test", NOW - timedelta(hours=hours_ago), image)
+
+def test_minhash_is_stable_and_similar_for_similar_titles():
+    a = minhash("Arsenal beat Chelsea 2-0 in the London derby")
+    b = minhash("Arsenal beat Chelsea 2-0 in the London derby at the Emirates")
+    c = minhash("Bayern sign a new goalkeeper from Freiburg")
+    assert a.shape == (NUM_PERM,)
+    assert (a == minhash("arsenal BEAT chelsea 2-0, in the London derby!")).all()
+    assert (a == b).mean() > (a == c).mean()
+    assert minhash("") is None
+
+def test_near_duplicate_titles_are_dropped_and_lend_their_image():
+    index = NewsIndex()
+    assert index.add(article(1, "Arsenal beat Chelsea 2-0 in the London derby"))
+    assert not index.add(article(2, "Arsenal beat Chelsea 2-0 in the London derby", image="https://img/x.jpg"))
+    assert not index.add(article(1, "Arsenal beat Chelsea 2-0 in the London derby"))
+    assert index.add(article(3, "Bayern sign a new goalkeeper from Freiburg"))
+    assert len(index) == 2
+    assert index.stats()["duplicates_dropped"] == 2
+    assert index.latest(1)[0].id == "a3"
+    assert index.newest_of(["a1"], 5)[0].image == "https://img/x.jpg"
+
+def test_since_follows_ingest_order_not_publish_time():
+    index = NewsIndex()
+    index.extend([article(1, "Arsenal beat Chelsea in the derby"), article(2, "Liverpool draw at Everton again", hours_ago=1)])
+    cursor = index.head_cursor()
+    # arrives after the cursor was handed out, though published well before
+    index.add(article(3, "Late report from yesterday's cup tie", hours_ago=20))
+    articles, cursor = index.since(cursor, 10)
+    assert [a.id for a in articles] == ["a3"]
+    assert index.since(cursor, 10) == ([], cursor)
+    assert [a.id for a in index.latest(3)] == ["a1", "a2", "a3"]
+
+def test_since_pages_through_and_rejects_bad_cursors():
+    index = NewsIndex()
+    titles = ["Arsenal win the derby", "Chelsea sign a striker", "Spurs sack their manager", "Everton stay up"]
+    index.extend(article(n, t) for n, t in enumerate(titles))
+    first, cursor = index.since("0", 3)
+    rest, _ = index.since(cursor, 3)
+    assert [a.title for a in first + rest] == titles
+    for bad in ("x", "-1", "123:a1"):
+        with pytest.raises(ValueError):
+            index.since(bad, 1)
+
+def test_oldest_published_is_evicted_first():
+    index = NewsIndex(size=2)
+    index.extend([article(1, "Arsenal win the derby", hours_ago=1), article(2, "Chelsea sign a striker", hours_ago=5),
+                  article(3, "Spurs sack their manager", hours_ago=3)])
+    assert [a.id for a in index.latest(5)] == ["a1", "a3"]
+    assert [a.id for a in index.since("0", 5)[0]] == ["a1", "a3"]
+
+def test_news_lists_are_encoded_once_per_index_state(monkeypatch):
+    from types import SimpleNamespace
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    import news_index as news_index_module
+    import response_cache
+    import routers.news
+    index = NewsIndex()
+    monkeypatch.setattr(routers.news, "news_index", index)
+    monkeypatch.setattr(news_index_module, "search_index", SimpleNamespace(add_article=lambda a: None))
+    monkeypatch.setattr(news_index_module, "team_tagger", SimpleNamespace(tag_article=lambda a: None))
+    monkeypatch.setattr(response_cache, "response_cache", response_cache.EncodedCache())
+    app = FastAPI()
+    app.include_router(routers.news.router)
+    client = TestClient(app)
+    index.add(article(1, "Arsenal beat Chelsea in the derby"))
+
+    first = client.get("/api/v1/news/sports-news", headers={"Accept-Encoding": "gzip"})
+    again = client.get("/api/v1/news/sports-news", headers={"Accept-Encoding": "gzip"})
+    assert [a["id"] for a in first.json()["articles"]] == ["a1"]
+    assert again.content == first.content
+    assert response_cache.response_cache.stats()["hits"] == 1
+    index.add(article(2, "Liverpool draw at Everton again"))
+    assert [a["id"] for a in client.get("/api/v1/news/sports-news").json()["articles"]] == ["a2", "a1"]
+    latest = client.get("/api/v1/news/latest", params={"limit": 1}).json()
+    assert [a["id"] for a in latest["articles"]] == ["a2"] and latest["cursor"] == index.head_cursor()
+    assert client.get("/api/v1/news/latest", params={"since": "x"}).status_code == 400
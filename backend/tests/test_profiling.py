@@ -0,0 +1,98 @@
+import os, itertools
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import profiling
+import routers.profiling
+from profiling import ProfileRing, ProfilingMiddleware
+
+@pytest.fixture
+def ring(tmp_path, monkeypatch):
+    fresh = ProfileRing(str(tmp_path), size=10)
+    monkeypatch.setattr(routers.profiling, "profile_ring", fresh)
+    monkeypatch.setattr(profiling, "_counter", itertools.count(1))
+    return fresh
+
+def make_client(ring):
+    app = FastAPI()
+    app.include_router(routers.profiling.router)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    app.add_middleware(ProfilingMiddleware, ring=ring)
+    return TestClient(app)
+
+def test_debug_profiles_need_the_token(ring, monkeypatch):
+    client = make_client(ring)
+    monkeypatch.setattr(profiling, "PROFILE_TOKEN", "")
+    assert client.get("/debug/profiles").status_code == 404
+    assert client.get("/debug/profiles", headers={"x-profile-token": ""}).status_code == 404
+    monkeypatch.setattr(profiling, "PROFILE_TOKEN", "secret")
+    assert client.get("/debug/profiles").status_code == 404
+    assert client.get("/debug/profiles", headers={"x-profile-token": "wrong"}).status_code == 404
+    assert client.get("/debug/profiles/1-0.json").status_code == 404
+    r = client.get("/debug/profiles", headers={"x-profile-token": "secret"})
+    assert r.status_code == 200 and r.json() == {"profiles": []}
+
+def test_token_header_profiles_the_request(ring, monkeypatch):
+    client = make_client(ring)
+    monkeypatch.setattr(profiling, "PROFILE_TOKEN", "secret")
+    assert client.get("/ping", headers={"x-profile-token": "secret"}).json() == {"ok": True}
+    profiles = client.get("/debug/profiles", headers={"x-profile-token": "secret"}).json()["profiles"]
+    assert [(p["path"], p["route"], p["status"]) for p in profiles] == [("/ping", "/ping", 200)]
+    r = client.get(f"/debug/profiles/{profiles[0]['id']}.json", headers={"x-profile-token": "secret"})
+    assert r.json()["id"] == profiles[0]["id"]
+    # a wrong token is served but not profiled
+    client.get("/ping", headers={"x-profile-token": "wrong"})
+    assert len(ring.list()) == 1
+
+def test_one_request_in_sample_rate_is_profiled(ring, monkeypatch):
+    client = make_client(ring)
+    monkeypatch.setattr(profiling, "PROFILE_SAMPLE_RATE", 3)
+    for _ in range(7):
+        assert client.get("/ping").status_code == 200
+    assert len(ring.list()) == 2
+    # the debug endpoints themselves are never sampled
+    monkeypatch.setattr(profiling, "PROFILE_TOKEN", "secret")
+    for _ in range(3):
+        client.get("/debug/profiles", headers={"x-profile-token": "secret"})
+    assert [p["path"] for p in ring.list()] == ["/ping", "/ping"]
+
+def test_sampling_off_by_default(ring, monkeypatch):
+    client = make_client(ring)
+    monkeypatch.setattr(profiling, "PROFILE_SAMPLE_RATE", 0)
+    monkeypatch.setattr(profiling, "PROFILE_TOKEN", "")
+    for _ in range(5):
+        client.get("/ping")
+    assert ring.list() == []
+
+def test_ring_keeps_the_newest_captures(tmp_path):
+    ring = ProfileRing(str(tmp_path), size=2)
+    for profile_id in ("100-0", "100-1", "99-5", "101-0"):
+        for ext in ("json", "prof"):
+            (tmp_path / f"{profile_id}.{ext}").write_text("{}")
+    (tmp_path / "notes.txt").write_text("kept")
+    ring.trim()
+    assert sorted(os.listdir(tmp_path)) == ["100-1.json", "100-1.prof", "101-0.json", "101-0.prof", "notes.txt"]
+
+def test_busy_lock_is_released_when_the_profiler_fails(ring, monkeypatch):
+    client = make_client(ring)
+    monkeypatch.setattr(profiling, "PROFILE_SAMPLE_RATE", 1)
+
+    def broken():
+        raise RuntimeError("profiler already running")
+    monkeypatch.setattr(profiling, "start_profiler", broken)
+    assert client.get("/ping").json() == {"ok": True}
+    assert profiling._busy.acquire(blocking=False)
+    profiling._busy.release()
+
+    class Unstoppable:
+        def stop(self):
+            raise RuntimeError("not running")
+    monkeypatch.setattr(profiling, "start_profiler", Unstoppable)
+    assert client.get("/ping").json() == {"ok": True}
+    assert profiling._busy.acquire(blocking=False)
+    profiling._busy.release()
+    assert ring.list() == []
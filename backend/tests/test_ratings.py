@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+import pytest
+import ratings
+from models import Result
+
+@pytest.fixture
+def artifacts(tmp_path, monkeypatch):
+    monkeypatch.setattr(ratings, "RATINGS_DIR", str(tmp_path / "ratings"))
+
+def record(db, *scores, start=0):
+    for i, (home, away, hg, ag) in enumerate(scores, start):
+        db.add(Result(match_id=i, league="Premier League", home=home, away=away,
+                      kickoff=datetime(2025, 8, 1) + timedelta(days=i), home_goals=hg, away_goals=ag))
+    db.commit()
+
+def fit(warm_start=True):
+    return ratings.load_ratings(ratings.run_fit_job(["premier_league"], workers=1, warm_start=warm_start))
+
+def test_refit_without_new_results_changes_nothing(db, artifacts):
+    record(db, ("Arsenal", "Chelsea", 2, 0), ("Chelsea", "Fulham", 1, 1))
+    first = fit()
+    second = fit()
+    for team in ("Arsenal", "Chelsea", "Fulham"):
+        assert second.get_elo("premier_league", team) == first.get_elo("premier_league", team)
+    assert second.home_adv == first.home_adv
+    assert second.matches("premier_league") == 2
+
+def test_warm_refit_matches_a_cold_fit_over_the_same_history(db, artifacts):
+    record(db, ("Arsenal", "Chelsea", 2, 0), ("Chelsea", "Fulham", 1, 1))
+    fit()
+    record(db, ("Fulham", "Arsenal", 3, 1), start=2)
+    warm = fit()
+    cold = fit(warm_start=False)
+    for team in ("Arsenal", "Chelsea", "Fulham"):
+        assert warm.get_elo("premier_league", team) == pytest.approx(cold.get_elo("premier_league", team))
+    assert warm.home_adv["premier_league"] == pytest.approx(cold.home_adv["premier_league"])
+    assert warm.matches("premier_league") == cold.matches("premier_league") == 3
+
+def test_teams_without_new_results_are_kept(db, artifacts):
+    record(db, ("Arsenal", "Chelsea", 2, 0))
+    first = fit()
+    record(db, ("Fulham", "Brentford", 0, 0), start=1)
+    second = fit()
+    assert second.get_elo("premier_league", "Arsenal") == first.get_elo("premier_league", "Arsenal")
+    assert set(second.teams("premier_league")) == {"Arsenal", "Chelsea", "Fulham", "Brentford"}
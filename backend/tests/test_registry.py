@@ -0,0 +1,75 @@
+import threading
+from types import SimpleNamespace
+import pytest
+import registry as registry_module
+from registry import ModelRegistry
+from shared_cache import shared_cache
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Versions loaded so far; loading "slow-*" waits for `release` to be set."""
+    release = threading.Event()
+    loaded = []
+    def load(version):
+        if version.startswith("slow"):
+            release.wait(5)
+        loaded.append(version)
+        return SimpleNamespace(version=version)
+    monkeypatch.setattr(registry_module, "load_model_version", load)
+    shared_cache.local.drop_namespace("model")
+    yield SimpleNamespace(loaded=loaded, release=release)
+    release.set()
+    shared_cache.local.drop_namespace("model")
+
+def test_clearing_the_shadow_discards_a_load_in_flight(loads):
+    models = ModelRegistry()
+    future = models.set_shadow("slow-v2")
+    assert models.status()["loading"] == {"shadow": "slow-v2"}
+    models.set_shadow(None)
+    loads.release.set()
+    assert future.result(5) is None
+    assert loads.loaded == ["slow-v2"]
+    assert models.shadow is None
+    assert models.status()["loading"] == {}
+
+def test_the_latest_activation_wins(loads):
+    models = ModelRegistry()
+    slow = models.activate("slow-v1")
+    fast = models.activate("v2")
+    loads.release.set()
+    slow.result(5), fast.result(5)
+    assert models.active.version == "v2"
+
+def test_other_workers_follow_a_choice(loads):
+    here, there = ModelRegistry(), ModelRegistry()
+    here.activate("v2").result(5)
+    here.set_shadow("v3").result(5)
+    # what the pub/sub listener runs in every other worker
+    there.follow()
+    there._loader.submit(lambda: None).result(5)
+    assert (there.active.version, there.shadow.version) == ("v2", "v3")
+    here.set_shadow(None)
+    there.follow()
+    assert there.shadow is None
+    assert ModelRegistry().load_current().version == "v2"
+
+def test_model_endpoints_need_the_admin_token(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    import routers.predictions
+    app = FastAPI()
+    app.include_router(routers.predictions.router)
+    client = TestClient(app)
+
+    def activate(token):
+        r = client.post("/api/model/activate", params={"version": "nope"}, headers={"X-Model-Admin-Token": token} if token else {})
+        return r.status_code, r.json()["detail"]
+
+    # without a configured token the endpoints don't exist, whatever is sent
+    assert activate(None) == (404, "Not Found")
+    assert activate("") == (404, "Not Found")
+    monkeypatch.setattr(routers.predictions, "MODEL_ADMIN_TOKEN", "s3cret")
+    assert activate(None) == (404, "Not Found")
+    assert activate("wrong") == (404, "Not Found")
+    assert client.post("/api/model/shadow", headers={"X-Profile-Token": "s3cret"}).status_code == 404
+    assert activate("s3cret") == (404, "Unknown model version: nope")
@@ -0,0 +1,38 @@
+from datetime import datetime
+import numpy as np
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from responses import ORJSONResponse, ORJSONRoute
+
+router = APIRouter(route_class=ORJSONRoute)
+
+@router.get("/values")
+async def values():
+    return {"kickoff": datetime(2025, 8, 1, 15, 0, 0, 123), "p": np.float32(0.5), "rows": np.arange(3)}
+
+@router.get("/sync")
+def sync_values(n: int):
+    return [np.int64(n)]
+
+@router.post("/created", status_code=201)
+def created():
+    return {"ok": True}
+
+@router.get("/missing")
+async def missing():
+    raise HTTPException(status_code=404, detail="Not here")
+
+app = FastAPI(default_response_class=ORJSONResponse)
+app.include_router(router)
+client = TestClient(app)
+
+def test_values_skip_jsonable_encoder():
+    r = client.get("/values")
+    assert r.status_code == 200
+    assert r.json() == {"kickoff": "2025-08-01T15:00:00Z", "p": 0.5, "rows": [0, 1, 2]}
+
+def test_parameters_status_codes_and_errors_still_work():
+    assert client.get("/sync", params={"n": 7}).json() == [7]
+    assert client.get("/sync", params={"n": "x"}).status_code == 422
+    assert client.post("/created").status_code == 201
+    assert client.get("/missing").json() == {"detail": "Not here"}
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import news_index
+from articles import Article
+from news_index import NewsIndex
+from search import SearchIndex
+
+NOW = datetime(2025, 8, 1, 12, tzinfo=timezone.utc)
+
+def article(n, title, description="", hours_ago=0):
+    return Article(f"a{n}", title, description, f"https://example.com/{n}", "Test", NOW - timedelta(hours=hours_ago), None)
+
+def fixture(n, home, away, league="Premier League", venue=None):
+    return {"id": n, "league": league, "home": home, "away": away, "venue": venue or f"{home} Stadium",
+            "kickoff": NOW, "status": "scheduled"}
+
+def ids(results):
+    return [payload.id if kind == "article" else payload["id"] for _, kind, payload in results]
+
+def test_more_relevant_documents_rank_first():
+    index = SearchIndex()
+    index.add_article(article(1, "Transfer round-up", "Arsenal linked with a striker"))
+    index.add_article(article(2, "Arsenal beat Chelsea", "A late winner at the Emirates"))
+    index.add_article(article(3, "Bayern sign a goalkeeper", "The deal is done"))
+    index.add_article(article(4, "Arsenal and Chelsea share the points", "Arsenal led twice"))
+    # a title match outweighs a description match; more occurrences and both terms beat one
+    assert ids(index.search("arsenal")) == ["a4", "a2", "a1"]
+    ranked = ids(index.search("arsenal chelsea"))
+    assert sorted(ranked[:2]) == ["a2", "a4"] and ranked[2:] == ["a1"]
+    assert index.search("liverpool") == [] and index.search("") == []
+
+def test_shorter_documents_win_on_equal_term_frequency():
+    index = SearchIndex()
+    index.add_article(article(1, "Chelsea", "Report from a long afternoon of football in west London"))
+    index.add_article(article(2, "Chelsea", "Report"))
+    index.add_article(article(3, "Spurs", ""))
+    assert ids(index.search("chelsea")) == ["a2", "a1"]
+
+def test_kind_filter_and_limit():
+    index = SearchIndex()
+    index.add_article(article(1, "Arsenal beat Chelsea"))
+    index.add_fixtures([fixture(10, "Arsenal", "Chelsea"), fixture(11, "Arsenal", "Fulham"), fixture(12, "Spurs", "Everton")])
+    assert sorted(ids(index.search("arsenal", kind="fixture"))) == [10, 11]
+    assert ids(index.search("arsenal", kind="article")) == ["a1"]
+    assert len(index.search("arsenal", limit=2)) == 2
+
+def test_removed_documents_are_never_returned():
+    index = SearchIndex()
+    index.add_article(article(1, "Arsenal beat Chelsea"))
+    index.add_article(article(2, "Arsenal draw at Everton"))
+    terms = index.stats()["terms"]
+    index.remove_article("a1")
+    index.remove_article("a1")
+    assert ids(index.search("arsenal chelsea")) == ["a2"]
+    assert index.search("chelsea") == []
+    assert index.stats() == {"documents": 1, "terms": terms - 2}
+    assert index.total_length == index.docs["article:a2"][3]
+    # re-adding replaces the fixture's terms rather than merging them
+    index.add_fixtures([fixture(10, "Arsenal", "Chelsea")])
+    index.add_fixtures([fixture(10, "Arsenal", "Fulham")])
+    assert index.search("chelsea") == []
+
+def test_news_index_eviction_drops_articles_from_search(monkeypatch):
+    index = SearchIndex()
+    monkeypatch.setattr(news_index, "search_index", index)
+    monkeypatch.setattr(news_index, "team_tagger", SimpleNamespace(tag_article=lambda a: None, remove_article=lambda i: None))
+    news = NewsIndex(size=2)
+    news.add(article(1, "Arsenal beat Chelsea in the derby", hours_ago=3))
+    news.add(article(2, "Arsenal draw at Everton again", hours_ago=2))
+    news.add(article(3, "Liverpool sign an Arsenal defender", hours_ago=1))
+    assert sorted(ids(index.search("arsenal"))) == ["a2", "a3"]
+    assert index.search("chelsea") == []
@@ -0,0 +1,94 @@
+import uuid, threading
+import pytest
+import shared_cache
+from shared_cache import SharedCache
+
+@pytest.fixture
+def workers():
+    """Factory for SharedCaches standing in for workers on one fakeredis server."""
+    url = f"fakeredis://{uuid.uuid4().hex}"
+    return lambda: SharedCache(url)
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the local tier."""
+    now = [1000.0]
+    monkeypatch.setattr(shared_cache.time, "monotonic", lambda: now[0])
+    return now
+
+def test_local_only_without_a_url(clock):
+    cache = SharedCache("")
+    cache.set("news", "latest", {"articles": [1, 2]}, ttl=60)
+    assert cache.get("news", "latest") == {"articles": [1, 2]}
+    assert cache.acquire("news_refresh", 60) and cache.acquire("news_refresh", 60)
+    clock[0] += 61
+    assert cache.get("news", "latest") is None
+    assert cache.stats()["backend"] == "local"
+
+def test_a_local_miss_falls_through_to_the_shared_tier(workers, clock, monkeypatch):
+    monkeypatch.setattr(shared_cache, "CACHE_LOCAL_TTL", 30)
+    a, b = workers(), workers()
+    a.set("news", "latest", {"articles": [1, 2]}, ttl=300)
+    assert b.get("news", "latest") == {"articles": [1, 2]}
+    assert len(b.local) == 1
+    # the local copy is capped at CACHE_LOCAL_TTL; past it the shared copy is read again
+    b.shared.set("news:latest", {"articles": [3]}, 300)
+    clock[0] += 20
+    assert b.get("news", "latest") == {"articles": [1, 2]}
+    clock[0] += 11
+    assert b.get("news", "latest") == {"articles": [3]}
+
+def test_shared_outage_degrades_to_the_local_tier(workers, monkeypatch):
+    cache = workers()
+    def down(*args, **kwargs):
+        raise ConnectionError("redis down")
+    monkeypatch.setattr(cache.shared.client, "get", down)
+    monkeypatch.setattr(cache.shared.client, "set", down)
+    cache.set("news", "latest", [1], ttl=60)
+    assert cache.get("news", "latest") == [1]
+    assert cache.get("news", "other") is None
+    # every worker runs the job rather than none
+    assert cache.acquire("news_refresh", 60)
+    assert cache.shared_errors == 3
+
+def test_lease_is_held_by_one_worker_until_it_expires(workers):
+    a, b = workers(), workers()
+    assert a.acquire("news_refresh", 60)
+    assert not b.acquire("news_refresh", 60)
+    assert not a.acquire("news_refresh", 60)
+    a.shared.client.delete(f"{shared_cache.CACHE_PREFIX}lease:news_refresh")
+    assert b.acquire("news_refresh", 60)
+
+def test_invalidate_drops_both_tiers_and_runs_callbacks(workers):
+    a, b = workers(), workers()
+    called = []
+    a.on_invalidate("news", lambda: called.append("news"))
+    a.set("news", "latest", [1], ttl=60)
+    a.set("fixtures", "today", [2], ttl=60)
+    a.invalidate("news")
+    assert called == ["news"]
+    assert a.get("news", "latest") is None and b.get("news", "latest") is None
+    assert b.get("fixtures", "today") == [2]
+
+def test_broadcasts_reach_other_workers_only(workers):
+    a, b = workers(), workers()
+    b.set("news", "latest", [1], ttl=60)
+    changed = threading.Event()
+    b.on_invalidate("news", changed.set)
+    # a message carrying this worker's id is its own broadcast echoed back
+    b._handle(f"{shared_cache.WORKER_ID} news")
+    assert not changed.is_set() and b.local.get("news:latest") == [1]
+    subscriber = a.shared.client.pubsub(ignore_subscribe_messages=True)
+    subscriber.subscribe(shared_cache.CACHE_PREFIX + shared_cache.CHANNEL)
+    a.broadcast("news")
+    # the first read consumes the subscribe confirmation
+    message = subscriber.get_message(timeout=1) or subscriber.get_message(timeout=1)
+    assert message["data"].decode() == f"{shared_cache.WORKER_ID} news"
+    b.start()
+    # the listener subscribes on its own thread; publish until it has
+    for _ in range(50):
+        a.shared.publish("another-worker news")
+        if changed.wait(0.1):
+            break
+    assert changed.is_set()
+    assert b.local.get("news:latest") is None
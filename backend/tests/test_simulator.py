@@ -0,0 +1,63 @@
+import os, sys
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from conftest import BACKEND
+from providers import final_score
+
+sys.path.append(os.path.join(BACKEND, "simulator"))
+from server import Simulator, create_app  # noqa: E402
+
+SCOREBOARD = "/espn/soccer/eng.1/scoreboard"
+
+def make_client(tmp_path, **faults):
+    return TestClient(create_app(Simulator(fixtures=120, recordings=str(tmp_path), **faults)))
+
+def test_synthetic_payloads_have_finished_and_upcoming_fixtures(tmp_path):
+    client = make_client(tmp_path)
+    events = client.get(SCOREBOARD).json()["events"]
+    fixtures = client.get("/api-football/fixtures", params={"league": "39"}).json()["response"]
+    for provider, payloads in (("espn", events), ("api_football", fixtures)):
+        scores = [final_score(provider, p) for p in payloads]
+        finished = [s for s in scores if s is not None]
+        assert 0 < len(finished) < len(payloads)
+        assert all(0 <= home <= 4 and 0 <= away <= 3 for home, away in finished)
+        # played games come first, then the schedule still to play
+        assert scores == sorted(scores, key=lambda s: s is None)
+
+def test_injected_errors_and_rate_limits(tmp_path):
+    client = make_client(tmp_path, error_rate=1)
+    r = client.get(SCOREBOARD)
+    assert r.status_code == 503
+    client.post("/_sim/faults", json={"default": {"error_rate": 0}, "espn": {"rate_limit_rate": 1, "retry_after": 7}})
+    r = client.get(SCOREBOARD)
+    assert r.status_code == 429 and r.headers["retry-after"] == "7"
+    # faults set for one provider leave the others alone
+    assert client.get("/api-football/fixtures", params={"league": "39"}).status_code == 200
+    assert client.get("/_sim/stats").json() == {"espn": {"error": 1, "rate_limited": 1}, "api_football": {"ok": 1}}
+    assert client.post("/_sim/faults", json={"espn": {"typo_rate": 1}}).status_code == 400
+
+def test_truncated_bodies(tmp_path):
+    client = make_client(tmp_path)
+    whole = client.get(SCOREBOARD).content
+    client.post("/_sim/faults", json={"espn": {"partial_rate": 1}})
+    r = client.get(SCOREBOARD)
+    assert r.status_code == 200 and r.content == whole[:len(whole) // 2]
+    with pytest.raises(orjson.JSONDecodeError):
+        orjson.loads(r.content)
+    client.post("/_sim/reset")
+    assert client.get(SCOREBOARD).content == whole
+
+def test_recorded_payloads_are_replayed(tmp_path):
+    recorded = {"events": [{"id": "401", "date": "2025-08-16T14:00Z", "status": {"type": {"name": "STATUS_FULL_TIME"}}}]}
+    (tmp_path / "espn").mkdir()
+    (tmp_path / "espn" / "eng.1.json").write_bytes(orjson.dumps(recorded))
+    (tmp_path / "rss").mkdir()
+    (tmp_path / "rss" / "0.xml").write_text("<rss><channel><title>Recorded</title></channel></rss>")
+    client = make_client(tmp_path)
+    assert client.get(SCOREBOARD).json() == recorded
+    r = client.get("/rss/0.xml")
+    assert r.text == "<rss><channel><title>Recorded</title></channel></rss>"
+    assert r.headers["content-type"].startswith("application/rss+xml")
+    # leagues without a recording still get a synthetic payload
+    assert len(client.get("/espn/soccer/esp.1/scoreboard").json()["events"]) == 120
@@ -0,0 +1,63 @@
+import pytest
+import sources
+
+CATALOGUE = {"competitions": {
+    "premier_league": {"name": "Premier League", "sources": {"api_football": 39, "espn": "eng.1", "thesportsdb": 4328}},
+    "eredivisie": {"name": "Eredivisie", "provider": "thesportsdb",
+                   "sources": {"espn": "ned.1", "thesportsdb": 4337}},
+    "mls": {"name": "MLS", "sources": {"api_football": {"id": 253, "enabled": False}, "espn": "usa.1"}},
+}}
+
+@pytest.fixture
+def catalogue(monkeypatch):
+    competitions, catalogued = sources.parse(CATALOGUE, default_interval=600)
+    monkeypatch.setattr(sources, "COMPETITIONS", competitions)
+    monkeypatch.setattr(sources, "SOURCES", catalogued)
+
+def owners(providers):
+    return {key: s.provider for key, s in sources.owners(providers).items()}
+
+def test_each_competition_has_one_owner(catalogue):
+    assert owners({"api_football", "espn", "thesportsdb"}) == {
+        "premier_league": "api_football", "eredivisie": "thesportsdb", "mls": "espn"}
+
+def test_ownership_falls_to_the_next_enabled_provider(catalogue):
+    assert owners({"espn", "thesportsdb"}) == {"premier_league": "espn", "eredivisie": "thesportsdb", "mls": "espn"}
+    assert owners({"espn"}) == {"premier_league": "espn", "eredivisie": "espn", "mls": "espn"}
+
+def test_enabled_sources_are_the_owners(catalogue):
+    picked = sources.enabled_sources({"api_football", "espn"}, ["premier_league", "mls"])
+    assert [(s.name, s.interval) for s in picked] == [("api_football:premier_league", 600), ("espn:mls", 600)]
+
+def test_owner_must_be_a_source():
+    with pytest.raises(ValueError):
+        sources.parse({"competitions": {"x": {"name": "X", "provider": "espn", "sources": {"thesportsdb": 1}}}})
+
+def test_sport_defaults_to_soccer_and_builds_the_espn_url(catalogue, monkeypatch):
+    competitions, catalogued = sources.parse({"competitions": {
+        "nba": {"name": "NBA", "sport": "basketball", "sources": {"espn": "nba"}},
+        "mls": {"name": "MLS", "sources": {"espn": "usa.1"}},
+    }})
+    assert {s.competition: s.sport for s in catalogued} == {"nba": "basketball", "mls": "soccer"}
+    from providers import espn
+    monkeypatch.setattr(espn, "COMPETITIONS", competitions)
+    monkeypatch.setattr(espn, "LEAGUES", {"nba": "nba", "mls": "usa.1"})
+    monkeypatch.setattr(espn, "ESPN_BASE", "https://espn.test/sports")
+    assert espn.scoreboard_url("nba") == "https://espn.test/sports/basketball/nba/scoreboard"
+    assert espn.scoreboard_url("mls") == "https://espn.test/sports/soccer/usa.1/scoreboard"
+
+def test_api_football_stores_the_catalogue_league_name(monkeypatch):
+    import asyncio, httpx
+    from providers import api_football
+    monkeypatch.setattr(api_football, "FOOTBALL_KEY", "key")
+    payload = {"response": [{
+        "fixture": {"id": 1, "date": "2025-08-16T14:00:00+00:00", "status": {"short": "NS"}},
+        "league": {"id": 39, "name": "English Premier League"},
+        "teams": {"home": {"name": "Arsenal"}, "away": {"name": "Chelsea"}},
+    }]}
+
+    async def fetch():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await api_football.fetch(client, "premier_league")
+    assert [f["league"] for f in asyncio.run(fetch())] == ["Premier League"]
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+from tagger import Automaton, TeamTagger, aliases_for
+
+def test_aliases_drop_club_affixes_and_add_nicknames():
+    assert aliases_for("Arsenal FC") == {"arsenal fc", "arsenal"}
+    assert aliases_for("Manchester United") == {"manchester united", "man utd", "man united"}
+    assert "ac" not in aliases_for("AC Milan")
+
+def test_automaton_matches_whole_words_only():
+    automaton = Automaton({"inter": "Inter", "inter milan": "Inter", "milan": "AC Milan"})
+    found = sorted(automaton.find("inter milan and milan, not international"))
+    assert found == [(0, 5, "Inter"), (0, 11, "Inter"), (6, 11, "AC Milan"), (16, 21, "AC Milan")]
+
+def tagger():
+    t = TeamTagger()
+    t.add_teams([("Arsenal", "Premier League"), ("Chelsea", "Premier League"), ("Tottenham", "Premier League"),
+                 ("Inter", "Serie A")])
+    return t
+
+def test_tag_finds_teams_and_their_leagues():
+    teams, leagues = tagger().tag("Spurs edge Arsenal; Inter Milan watch on")
+    assert teams == {"Tottenham", "Arsenal", "Inter"}
+    assert leagues == {"premier_league", "serie_a"}
+    assert tagger().tag("") == (set(), set())
+
+def test_articles_are_indexed_by_team_and_league_and_untagged():
+    t = tagger()
+    t.tag_article(SimpleNamespace(id="a1", title="Arsenal v Chelsea preview", description=""))
+    t.tag_article(SimpleNamespace(id="a2", title="Internazionale win again", description="A fourth straight win"))
+    assert t.articles_for(["Chelsea"]) == {"a1"}
+    assert t.articles_for(league="serie_a") == {"a2"}
+    assert t.articles_for(["Arsenal"], "serie_a") == {"a1", "a2"}
+    t.remove_article("a1")
+    assert t.articles_for(["Arsenal", "Chelsea"], "premier_league") == set()
+    assert t.by_team.keys() == {"Inter"}
+
+def test_adding_a_known_team_does_not_rebuild():
+    t = tagger()
+    assert not t.add_teams([("Arsenal", "Premier League")])
+    assert t.add_teams([("Everton", "Premier League")])
+    assert t.tag("Everton stay up")[0] == {"Everton"}
@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+import upstream
+from upstream import CircuitBreaker, CircuitOpen, CLOSED, HALF_OPEN, OPEN
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the breaker."""
+    now = [1000.0]
+    monkeypatch.setattr(upstream.time, "monotonic", lambda: now[0])
+    return now
+
+def test_opens_after_consecutive_failures(clock):
+    b = CircuitBreaker("p", threshold=3, slo=10, open_seconds=60)
+    b.failed("boom")
+    b.failed("boom")
+    b.succeeded("pl", ["fixture"], 0.1)
+    assert (b.state, b.failures) == (CLOSED, 0)
+    for _ in range(3):
+        b.failed("boom")
+    assert b.state == OPEN and not b.allow()
+    assert b.snapshot("pl") == ["fixture"] and b.stale_served == 1
+    with pytest.raises(CircuitOpen):
+        b.snapshot("serie_a")
+
+def test_half_open_lets_one_trial_through(clock):
+    b = CircuitBreaker("p", threshold=1, slo=10, open_seconds=60)
+    b.failed("boom")
+    clock[0] += 59
+    assert not b.allow()
+    clock[0] += 1
+    assert b.allow() and b.state == HALF_OPEN
+    assert not b.allow()
+    # a failed trial re-opens at once, whatever the threshold
+    b.failed("still down")
+    assert b.state == OPEN and b.times_opened == 2
+    clock[0] += 60
+    assert b.allow()
+    b.succeeded("pl", [], 0.1)
+    assert b.state == CLOSED and b.allow()
+
+def test_slow_answers_count_as_failures(clock):
+    b = CircuitBreaker("p", threshold=2, slo=1, open_seconds=60)
+    b.succeeded("pl", ["late"], 5)
+    b.succeeded("pl", ["later"], 5)
+    assert b.state == OPEN
+    # the slow answer is still the freshest data to serve
+    assert b.snapshot("pl") == ["later"]
+
+def test_call_serves_the_snapshot_while_open(monkeypatch):
+    monkeypatch.setattr(upstream, "breakers", {})
+    monkeypatch.setattr(upstream, "UPSTREAM_HEDGE", False)
+    calls = []
+    async def ok():
+        calls.append("ok")
+        return ["fixture"]
+    async def down():
+        calls.append("down")
+        raise OSError("connection refused")
+
+    assert asyncio.run(upstream.call("p", "pl", ok)) == (["fixture"], False)
+    for _ in range(upstream.breaker("p").threshold):
+        with pytest.raises(OSError):
+            asyncio.run(upstream.call("p", "pl", down))
+    assert asyncio.run(upstream.call("p", "pl", down)) == (["fixture"], True)
+    assert calls.count("down") == upstream.breaker("p").threshold
+
+def test_hedge_wins_when_the_first_attempt_stalls():
+    attempts = []
+    async def attempt():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            await asyncio.sleep(5)
+            return "first"
+        return "second"
+    assert asyncio.run(upstream.hedged("p", attempt, 0.01)) == "second"
+    assert attempts == [0, 1]
+
+def test_hedge_raises_when_both_attempts_fail():
+    async def attempt():
+        await asyncio.sleep(0.02)
+        raise ValueError("bad payload")
+    with pytest.raises(ValueError):
+        asyncio.run(upstream.hedged("p", attempt, 0.01))
@@ -0,0 +1,6 @@
+-- Adds matches.kickoff_ts and its indexes to a database created before it
+-- existed. Safe to run more than once. The backend fills kickoff_ts for
+-- existing rows at startup (kickoffs.backfill).
+ALTER TABLE matches ADD COLUMN IF NOT EXISTS kickoff_ts BIGINT;
+CREATE INDEX IF NOT EXISTS ix_matches_kickoff_ts ON matches (kickoff_ts);
+CREATE INDEX IF NOT EXISTS ix_matches_league_kickoff_ts ON matches (league, kickoff_ts);
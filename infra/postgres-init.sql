@@ -4,12 +4,21 @@ CREATE TABLE matches (
   league TEXT,
   home TEXT,
   away TEXT,
-  kickoff TIMESTAMP,
+  home_logo TEXT,
+  away_logo TEXT,
+  kickoff TIMESTAMP,  -- naive UTC
+  kickoff_ts BIGINT,  -- the same instant as epoch seconds; window queries filter on it
   status TEXT,
+  venue TEXT,
+  referee TEXT,
+  provider TEXT,
   provider_payload JSONB,
   created_at TIMESTAMP DEFAULT now()
 );
 
+CREATE INDEX ix_matches_kickoff_ts ON matches (kickoff_ts);
+CREATE INDEX ix_matches_league_kickoff_ts ON matches (league, kickoff_ts);
+
 CREATE TABLE odds (
   id SERIAL PRIMARY KEY,
   match_id INTEGER,
@@ -18,4 +27,18 @@ CREATE TABLE odds (
   selection TEXT,
   odd NUMERIC,
   retrieved_at TIMESTAMP DEFAULT now()
-);
\ No newline at end of file
+);
+CREATE TABLE results (
+  id SERIAL PRIMARY KEY,
+  match_id INTEGER UNIQUE,
+  league TEXT,
+  home TEXT,
+  away TEXT,
+  kickoff TIMESTAMP,
+  home_goals INTEGER,
+  away_goals INTEGER,
+  recorded_at TIMESTAMP DEFAULT now()
+);
+
+CREATE INDEX results_league_idx ON results (league);
+CREATE INDEX results_kickoff_idx ON results (kickoff);